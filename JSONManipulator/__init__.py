@@ -8,7 +8,7 @@ DESCRIPTION
     A Python library to manipulate objects in JSON files.
 
 PACKAGE CONTENTS
-    ``set_up(full_path)``: initially set up the JSON file.\n
+    ``set_up(full_path, descriptions=None)``: initially set up the JSON file.\n
     ``GetInformation(value, full_path, levenshtein=1.0, key=None, desc=None)``: \
     retrieve information about particular objects.\n
     ``ChangeValue(value, full_path, levenshtein=1.0, key=None, desc=None)``: \
@@ -17,8 +17,34 @@ PACKAGE CONTENTS
     ``DeleteObject(value, full_path, levenshtein=1.0, key=None, desc=None)``: \
     delete particular objects in the JSON file.\n
     ``AddKey(full_path)``: add a new key to each object in the JSON file.\n
+    ``migrate(full_path, operations)``: add, rename and drop many keys \
+    of each object in the JSON file in one pass.\n
     ``ChangeAllValues(value, full_path)``: \
-    change values of all objects in the JSON file.
+    change values of all objects in the JSON file.\n
+    ``Query(value, levenshtein=1.0, key=None, desc=None)``: \
+    find particular objects in the loaded list of objects without printing.\n
+    ``BatchQuery(queries)``: find the objects by many queries \
+    in one pass over the objects.\n
+    ``Filter(predicate)``: find the objects by the combination \
+    of ``Exact``, ``Prefix``, ``Range`` and ``Fuzzy`` predicates \
+    with ``AllOf`` and ``AnyOf`` in one pass over the objects.\n
+    ``Session(full_path)``: run many non-interactive operations \
+    with one load and one dump of the JSON file.\n
+    ``document_cache``: the process-wide cache of the parsed JSON files.\n
+    ``convert(source_path, target_path, file_format)``: \
+    copy the objects to the file of another format \
+    (``JSON_ARRAY`` or ``JSON_LINES``).\n
+    ``shard(source_path, directory, key, shards)``, \
+    ``unshard(directory, target_path)``, ``reshard(directory, shards)``, \
+    ``ShardedDataset(directory)``: split the objects into the files \
+    by the hash of a key, so the lookups by the key read one file.\n
+    ``aget_information``, ``achange_value``, ``achange_all_values``, \
+    ``adelete_object``, ``aadd_key``, ``aadd_object``: \
+    the coroutines of the non-interactive operations for ``asyncio``.\n
+    ``use_recorder(recorder)``, ``HistogramCollector()``: \
+    record the timings and the counters of the phases of the operations.\n
+    ``set_codec(codec)``, ``register_codec(codec)``: \
+    choose the library which parses and serializes the JSON files.
 """
 
 from JSONManipulator.core.set_up import set_up
@@ -27,7 +53,23 @@ from JSONManipulator.core.ChangeValue import ChangeValue
 from JSONManipulator.core.ChangeAllValues import ChangeAllValues
 from JSONManipulator.core.DeleteObject import DeleteObject
 from JSONManipulator.core.AddKey import AddKey
+from JSONManipulator.core.migration import migrate
 from JSONManipulator.core.AddObject import AddObject
+from JSONManipulator.core.Query import Query
+from JSONManipulator.core.BatchQuery import BatchQuery
+from JSONManipulator.core.Filter import Filter
+from JSONManipulator.core.predicates import Exact, Prefix, Range, Fuzzy, \
+    AllOf, AnyOf
+from JSONManipulator.core.Session import Session
+from JSONManipulator.core.cache import document_cache
+from JSONManipulator.core.storage import convert, JSON_ARRAY, JSON_LINES
+from JSONManipulator.core.sharding import ShardedDataset, shard, unshard, \
+    reshard
+from JSONManipulator.core.aio import aget_information, achange_value, \
+    achange_all_values, adelete_object, aadd_key, aadd_object
+from JSONManipulator.core.instrumentation import use_recorder, \
+    HistogramCollector
+from JSONManipulator.core.codec import set_codec, register_codec
 
 __author__ = """Andrew Polukhin"""
 __email__ = """andrewmathematics2003@gmail.com"""
@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
 """The module with ``AddKey`` class"""
 
-import json
+import JSONManipulator.exceptions as exceptions
+from JSONManipulator.core.migration import migrate
 
 
 class AddKey:
     """A class to add a new key to each object in the JSON file.
 
     Args:
-        ``full_path (str)``: the full path to the JSON file.
+        ``full_path (str)``: the full path to the JSON file.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.
 
     Raises:
         ``FileNotFoundError``: \
@@ -17,13 +20,16 @@ class AddKey:
         if ``full_path`` is to a directory, not to the JSON file.
     """
 
-    def __init__(self, full_path):
+    def __init__(self, full_path, file_format=None):
         self.full_path = full_path
+        self.file_format = file_format
         self.add_key()
 
     def add_key(self) -> None:
         """Add a key to each object in the JSON file, \
         optionally with a description, with a default value.
+
+        The file is written only if none of the objects has the key.
         """
 
         print(
@@ -37,33 +43,17 @@ class AddKey:
         input_desc = input("Enter the description of your new key: ")
         default_value = input("Enter the default value of your key: ")
 
-        with open(self.full_path, 'r') as file:
-            file_contents = json.load(file)
-
-        if input_key and input_desc:
-            for dictionary in file_contents:
-                if not dictionary.get(input_key):
-                    dictionary[input_key] = {input_desc: default_value}
-                elif dictionary.get(input_key):
-                    print("\nSorry, your key already exists. "
-                          "Try our ChangeAllValues functionality instead.")
-                    break
-            else:
-                print("\nSuccess!")
-
-        elif input_key and not input_desc:
-            for dictionary in file_contents:
-                if not dictionary.get(input_key):
-                    dictionary[input_key] = default_value
-                elif dictionary.get(input_key):
-                    print("\nSorry, your key already exists. "
-                          "Try our ChangeAllValues functionality instead.")
-                    break
-            else:
-                print("\nSuccess!")
-
-        else:
+        if not input_key:
             print("\nSorry, you have not specified the key.")
-
-        with open(self.full_path, 'w') as file:
-            json.dump(file_contents, file)
+            return
+
+        try:
+            migrate(self.full_path, [{
+                "op": "add", "key": input_key,
+                "desc": input_desc, "default": default_value,
+            }], self.file_format)
+        except exceptions.KeyAlreadyExists:
+            print("\nSorry, your key already exists. "
+                  "Try our ChangeAllValues functionality instead.")
+        else:
+            print("\nSuccess!")
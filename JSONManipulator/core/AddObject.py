@@ -1,48 +1,82 @@
 # -*- coding: utf-8 -*-
 """The module with ``AddObject`` class"""
 
-import json
+import JSONManipulator.exceptions as exceptions
 from JSONManipulator.core.ChangeValue import ChangeValue
+from JSONManipulator.core.schema import Schema
+from JSONManipulator.core.storage import iter_records, append_document
 
 
 class AddObject:
     """A class to add a new object to the JSON file.
 
     Args:
-        ``full_path (str)``: the full path to the JSON file.
+        ``full_path (str)``: the full path to the JSON file.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.
+
+    Raises:
+        ``exceptions.NotSupportedJSONFile``: if the JSON file has no objects \
+        to take the keys from, or not only the objects.
     """
 
-    def __init__(self, full_path):
+    def __init__(self, full_path, file_format=None):
         self.full_path = full_path
+        self.file_format = file_format
         self.add_object()
 
     def add_object(self) -> None:
-        """Add an object to the JSON file."""
+        """Add an object to the end of the JSON file, \
+        taking its keys from ``Schema`` of the file, or else reading \
+        the file object by object, and appending only the new one.
+        """
+
+        longest_dict = self.schema_dict()
+        if longest_dict is None:
+            for dictionary in iter_records(self.full_path, self.file_format):
+                if not isinstance(dictionary, dict):
+                    longest_dict = None
+                    break
+                if longest_dict is None \
+                        or len(dictionary) > len(longest_dict):
+                    longest_dict = dictionary
+
+        if longest_dict is None:
+            raise exceptions.NotSupportedJSONFile
 
         print("\nAssign the value to the descriptions "
               "(press <Enter> if you don\'t need the description):")
-        with open(self.full_path, 'r') as file:
-            file_contents = json.load(file)
-
-        if all(isinstance(dictionary, dict) for dictionary in file_contents):
-            longest_dict = max(file_contents, key=len)
-            example_dict = longest_dict.copy()
-            for dict_key, dict_value in example_dict.copy().items():
-                if isinstance(dict_value, dict):
-                    for desc, initial_value in dict_value.items():
-                        new_value = input(f"--------<{desc}>: ")
-                        if not new_value:
-                            del example_dict[dict_key]
-                        else:
-                            ChangeValue.if_clauses(
-                                initial_value, example_dict, dict_key, desc, new_value
-                            )
-                else:
-                    del example_dict[dict_key]
-
-            file_contents.append(example_dict)
-
-            with open(self.full_path, 'w') as file:
-                json.dump(file_contents, file)
-
-            print("\nSuccess!")
+        example_dict = longest_dict.copy()
+        for dict_key, dict_value in example_dict.copy().items():
+            if isinstance(dict_value, dict):
+                for desc, initial_value in dict_value.items():
+                    new_value = input(f"--------<{desc}>: ")
+                    if not new_value:
+                        del example_dict[dict_key]
+                    else:
+                        ChangeValue.if_clauses(
+                            initial_value, example_dict, dict_key, desc, new_value
+                        )
+            else:
+                del example_dict[dict_key]
+
+        append_document(self.full_path, [example_dict], self.file_format)
+
+        print("\nSuccess!")
+
+    def schema_dict(self) -> dict or None:
+        """Build the object with every key and its first description \
+        from ``Schema`` of the file, with the empty values of their kinds.
+
+        Returns:
+            ``None``: if the schema is missing or out of date.
+        """
+
+        pairs = Schema(self.full_path).load()
+        if not pairs:
+            return None
+        schema_dict = dict()
+        for key, desc, kind in pairs:
+            if key not in schema_dict:
+                schema_dict[key] = {desc: [] if kind == "list" else ""}
+        return schema_dict
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""The module with ``BatchQuery`` class"""
+
+import math
+from typing import List, Dict
+
+from JSONManipulator.core.Query import Query
+from JSONManipulator.core.index import ExactIndex
+from JSONManipulator.core.storage import load_document, iter_records
+import JSONManipulator.core.instrumentation as instrumentation
+
+
+class BatchQuery:
+    """A non-interactive class to find the objects by many queries \
+    in one pass over the objects.
+
+    The value of every ``key``/``desc`` of an object is normalized once \
+    and compared with all the queries to it. The queries \
+    with ``levenshtein == 1.0`` are looked up by the hash \
+    of the normalized value and its prefixes, as in ``ExactIndex``, \
+    and the others are compared one by one. Every query finds the same \
+    objects in the same order as ``Query.find()`` does.
+
+    Args:
+        ``queries (list)``: ``Query`` instances, or the tuples \
+        ``(value, levenshtein, key, desc)`` and the dictionaries \
+        of the arguments of ``Query``.\n
+        ``scorer (Scorer)``: the engine which compares the values \
+        of the queries built from the tuples and the dictionaries.
+
+    Raises:
+        ``exceptions.NoKeyAndDesc``: \
+        if neither ``key`` nor ``desc`` is entered in a query.
+    """
+
+    __slots__ = ["queries", "output_dict_containers", "output_positions"]
+
+    def __init__(self, queries, scorer=None):
+        self.queries = []
+        for query in queries:
+            if isinstance(query, dict):
+                query = Query(scorer=scorer, **query)
+            elif not isinstance(query, Query):
+                query = Query(*query, scorer=scorer)
+            self.queries.append(query)
+        self.output_dict_containers = []
+        self.output_positions = []
+
+    def find(self, file_contents) -> List[List[Dict]]:
+        """Find the objects in ``file_contents`` which match every query.
+
+        Args:
+            ``file_contents (Iterable)``: the objects to search in, \
+            read only once.
+
+        Returns:
+            ``List[List[Dict]]``: the found objects of every query \
+            in the order of the queries, their positions are kept \
+            in ``object.output_positions``.
+        """
+
+        self.output_dict_containers = [[] for _ in self.queries]
+        self.output_positions = [[] for _ in self.queries]
+        keys, descs = self.group_queries()
+
+        scanned = 0
+        scored = 0
+        with instrumentation.span("match"):
+            for position, dictionary in enumerate(file_contents):
+                scanned += 1
+                for key, group in keys.items():
+                    if key in dictionary:
+                        scored += 1
+                        self.match(group, dictionary[key], dictionary, position)
+                if descs:
+                    for value in dictionary.values():
+                        if isinstance(value, dict):
+                            for desc, end_value in value.items():
+                                if desc in descs:
+                                    scored += 1
+                                    self.match(descs[desc], end_value,
+                                               dictionary, position)
+
+        instrumentation.count("records_scanned", scanned)
+        instrumentation.count("records_scored", scored)
+        instrumentation.count("matches", sum(
+            len(container) for container in self.output_dict_containers
+        ))
+        return self.output_dict_containers
+
+    def find_in_file(self, full_path, file_format=None,
+                     stream=False) -> List[List[Dict]]:
+        """Find the objects in the JSON file which match every query, \
+        parsing the file once.
+
+        Args:
+            ``full_path (str)``: the full path to the JSON file.\n
+            ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+            detected from the file if not passed.\n
+            ``stream (bool)``: read the objects one by one \
+            instead of loading the whole file.
+
+        Returns:
+            ``List[List[Dict]]``: the found objects of every query.
+        """
+
+        if stream:
+            return self.find(iter_records(full_path, file_format))
+        return self.find(
+            load_document(full_path, cached=True, file_format=file_format)
+        )
+
+    def group_queries(self) -> tuple:
+        """Group the numbers of the queries by their ``key`` or ``desc``.
+
+        Returns:
+            ``tuple``: the groups of the keys and of the descriptions, \
+            the dictionaries of ``(exact, prefixes, fuzzy)``, where \
+            ``exact`` maps the normalized values of the queries \
+            with ``levenshtein == 1.0`` to their numbers, ``prefixes`` \
+            maps their prefixes of at least 80% of the length, \
+            and ``fuzzy`` lists the numbers of the other queries.
+        """
+
+        keys = dict()
+        descs = dict()
+        for number, query in enumerate(self.queries):
+            if not query.value \
+                    or not isinstance(query.levenshtein, (float, int)) \
+                    or not 1 >= query.levenshtein > 0:
+                continue
+            groups, field = (keys, query.key) if query.key \
+                else (descs, query.desc)
+            exact, prefixes, fuzzy = groups.setdefault(field, ({}, {}, []))
+
+            if ExactIndex.supports(query.levenshtein):
+                value = tuple(query.value)
+                exact.setdefault(value, []).append(number)
+                for length in range(math.floor(0.8 * len(value)),
+                                    len(value)):
+                    prefixes.setdefault(value[:length], []).append(number)
+            else:
+                fuzzy.append(number)
+        return keys, descs
+
+    def match(self, group, dictionary_value, dictionary, position) -> None:
+        """Normalize ``dictionary_value`` once and append ``dictionary`` \
+        to the results of the queries of ``group`` which it matches.
+        """
+
+        exact, prefixes, fuzzy = group
+        dictionary_value = Query.normalize_dictionary_value(dictionary_value)
+        if not isinstance(dictionary_value, list):
+            return
+
+        candidates = list(fuzzy)
+        if exact:
+            value = tuple(dictionary_value)
+            candidates.extend(prefixes.get(value, ()))
+            for length in range(math.floor(0.8 * len(value)),
+                                len(value) + 1):
+                candidates.extend(exact.get(value[:length], ()))
+
+        for number in sorted(set(candidates)):
+            if self.queries[number].is_similar(dictionary_value):
+                self.output_dict_containers[number].append(dictionary)
+                self.output_positions[number].append(position)
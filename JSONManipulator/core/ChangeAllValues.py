@@ -1,17 +1,23 @@
 # -*- coding: utf-8 -*-
 """The module with ``ChangeAllValues`` class"""
 
-import json
 from JSONManipulator.core.ChangeValue import ChangeValue
+from JSONManipulator.core.locking import FileLock
+from JSONManipulator.core.storage import iter_records, dump_document
 
 
 class ChangeAllValues(ChangeValue):
     """A class to change values of all objects in the JSON file.
 
+    The objects are read and written one by one, so only one object \
+    is kept in memory whatever the size of the file.
+
     Args:
         ``value (str)``: a redundant parameter, \
         exists as mandatory in the parent class.\n
         ``full_path (str)``: the full path to the JSON file.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.\n
 
     Raises:
         ``FileNotFoundError``: \
@@ -20,8 +26,8 @@ class ChangeAllValues(ChangeValue):
         if ``full_path`` is to a directory, not to the JSON file.
     """
 
-    def __init__(self, full_path, value=""):
-        super().__init__(value, full_path)
+    def __init__(self, full_path, value="", file_format=None):
+        super().__init__(value, full_path, file_format=file_format)
         self.change_all_values()
 
     def change_all_values(self) -> None:
@@ -41,9 +47,30 @@ class ChangeAllValues(ChangeValue):
                 "\nOr assign the new value to the given descriptions:"
             )
 
-            with open(self.full_path, 'r') as file:
-                file_contents = json.load(file)
+            shortest_dict = None
+            for dictionary in iter_records(self.full_path, self.file_format):
+                if shortest_dict is None or len(dictionary) < len(shortest_dict):
+                    shortest_dict = dictionary
 
-            self.change_several_objects(file_contents)
+            if shortest_dict is not None:
+                self.stream_changes(self.ask_template(shortest_dict))
+            print("\nSuccess!")
         else:
             print("Process terminated.")
+
+    def stream_changes(self, template) -> None:
+        """Change all the objects by ``template`` from ``ask_template()`` \
+        in one pass, writing every object as soon as it is changed.
+        """
+
+        with FileLock(self.full_path, exclusive=True):
+            dump_document(
+                self.full_path,
+                (
+                    self.apply_template(dictionary, template)
+                    for dictionary in iter_records(
+                        self.full_path, self.file_format
+                    )
+                ),
+                self.file_format
+            )
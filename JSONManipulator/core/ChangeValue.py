@@ -6,6 +6,8 @@ import copy
 from typing import List, Dict
 
 from JSONManipulator.core.GetInformation import GetInformation
+from JSONManipulator.core.locking import FileLock
+from JSONManipulator.core.storage import load_document, mutate_document
 
 
 class ChangeValue(GetInformation):
@@ -19,7 +21,13 @@ class ChangeValue(GetInformation):
         ``value (str)``: the value of ``key``/``desc`` \
         which will be used to find the object(s).\n
         ``levenshtein (float)``: the similarity of the elicited objects \
-        to the input. By default, seeks 100% similarity.
+        to the input. By default, seeks 100% similarity.\n
+        ``index (bool)``: choose the candidates with ``ExactIndex`` \
+        or ``FuzzyIndex`` instead of scanning the whole file.\n
+        ``scorer (Scorer)``: the engine which compares the values.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.\n
+        ``columnar (bool)``: search in ``ColumnStore`` of the objects.
 
     Raises:
         ``exceptions.NoKeyAndDesc``: \
@@ -33,8 +41,10 @@ class ChangeValue(GetInformation):
     __slots__ = ["value", "full_path", "levenshtein", "key", "desc"]
 
     def __init__(self, value, full_path, levenshtein=1.0, key=None,
-                 desc=None):
-        super().__init__(value, full_path, levenshtein, key, desc)
+                 desc=None, index=False, scorer=None, file_format=None,
+                 columnar=False):
+        super().__init__(value, full_path, levenshtein, key, desc, index,
+                         scorer, file_format=file_format, columnar=columnar)
         if self.__class__ == ChangeValue:
             #  Call the function if not inherited.
             self.change_value()
@@ -54,7 +64,9 @@ class ChangeValue(GetInformation):
             )
 
             initial_dictionary = dictionary_container[0]
-            self.change_one_object(initial_dictionary)
+            self.change_one_object(
+                initial_dictionary, self.output_positions[0]
+            )
 
         elif len(dictionary_container) > 1:
             print("\n\n----Use this function if you want to change values "
@@ -75,23 +87,40 @@ class ChangeValue(GetInformation):
 
             if option.isdecimal() and len(dictionary_container) >= int(option) >= 1:
                 initial_dictionary = dictionary_container[int(option) - 1]
-                self.change_one_object(initial_dictionary)
+                self.change_one_object(
+                    initial_dictionary, self.output_positions[int(option) - 1]
+                )
 
             elif option.lower() in ["all", "\'all\'"]:
                 initial_dictionary_list = dictionary_container
-                self.change_several_objects(initial_dictionary_list)
+                self.change_several_objects(
+                    initial_dictionary_list, self.output_positions
+                )
 
             elif self.format_several_objects(option, dictionary_container):
-                initial_dictionary_list = self.format_several_objects(
-                    option, dictionary_container
+                chosen_numbers = self.format_several_objects(
+                    option, list(range(len(dictionary_container)))
+                )
+                initial_dictionary_list = [
+                    dictionary_container[number] for number in chosen_numbers
+                ]
+                self.change_several_objects(
+                    initial_dictionary_list,
+                    [self.output_positions[number] for number in chosen_numbers]
                 )
-                self.change_several_objects(initial_dictionary_list)
 
             else:
                 print("Sorry, check your input.")
 
-    def change_one_object(self, start_dictionary) -> None:
-        """Change user-chosen values from the object - ``start_dictionary``."""
+    def change_one_object(self, start_dictionary, position=None) -> None:
+        """Change user-chosen values from the object - ``start_dictionary``.
+
+        Args:
+            ``start_dictionary (dict)``: the object to change.\n
+            ``position (int)``: the position of the object in the JSON file, \
+            from ``object.output_positions``. If not passed, \
+            all the objects equal to ``start_dictionary`` are changed.
+        """
 
         changed_dictionary = copy.deepcopy(start_dictionary)
 
@@ -109,65 +138,122 @@ class ChangeValue(GetInformation):
                             key_in_initial_dict, desc, new_value
                         )
 
-        with open(self.full_path, 'r') as file:
-            file_contents = json.load(file)
-
-        file_contents = [
-            element
-            for element in file_contents
-            if element != start_dictionary
-        ]
-        file_contents.append(changed_dictionary)
+        with FileLock(self.full_path, exclusive=True):
+            positions = self.record_positions([start_dictionary], [position])
 
-        with open(self.full_path, 'w') as file:
-            json.dump(file_contents, file)
+            mutate_document(
+                self.full_path, deletions=positions,
+                appends=[changed_dictionary], file_format=self.file_format
+            )
         print("\nSuccess!")
 
-    def change_several_objects(self, start_list_dictionaries) -> None:
+    def change_several_objects(self, start_list_dictionaries,
+                               positions=None) -> None:
         """Change several objects from ``start_list_dictionaries`` simultaneously.
+
+        Args:
+            ``start_list_dictionaries (list)``: the objects to change.\n
+            ``positions (list)``: the positions of the objects \
+            in the JSON file, from ``object.output_positions``. \
+            If not passed, all the objects equal to the ones \
+            from ``start_list_dictionaries`` are changed.
         """
 
+        if positions is not None:
+            #  The same object is found twice by several descriptions.
+            unique_objects = dict(zip(positions, start_list_dictionaries))
+            positions = list(unique_objects.keys())
+            start_list_dictionaries = list(unique_objects.values())
+
         changed_list_dictionaries = copy.deepcopy(start_list_dictionaries)
-        shortest_dict = min(changed_list_dictionaries, key=len)
-        dict_for_change = shortest_dict.copy()
-        for key, value in dict_for_change.items():
+        template = self.ask_template(min(changed_list_dictionaries, key=len))
+        for dictionary in changed_list_dictionaries:
+            self.apply_template(dictionary, template)
+
+        with FileLock(self.full_path, exclusive=True):
+            positions = self.record_positions(
+                start_list_dictionaries, positions
+            )
+
+            mutate_document(
+                self.full_path, deletions=positions,
+                appends=changed_list_dictionaries, file_format=self.file_format
+            )
+
+        print("\nSuccess!")
+
+    def ask_template(self, dictionary) -> Dict:
+        """Ask for the new values of the described keys of ``dictionary``.
+
+        Returns:
+            ``Dict``: the template of the changes by the keys: \
+            the new ``{desc: value}``, ``"<del>"`` to delete the key \
+            or ``"<continue>"`` to keep it.
+        """
+
+        template = dictionary.copy()
+        for key, value in template.items():
             if isinstance(value, dict):
                 for desc, type_value in value.items():
                     new_value = input(f"--------<{desc}>: ")
                     if new_value in ["del", "<del>"]:
-                        dict_for_change[key] = "<del>"
+                        template[key] = "<del>"
                     elif new_value == "":
-                        dict_for_change[key] = "<continue>"
+                        template[key] = "<continue>"
                     else:
                         self.if_clauses(
-                            type_value, dict_for_change, key, desc, new_value
+                            type_value, template, key, desc, new_value
                         )
+        return template
 
-        for dictionary in changed_list_dictionaries:
-            for initial_key in dictionary.copy().keys():
-                for key_for_change, value_for_change in dict_for_change.items():
-                    if initial_key == key_for_change:
-                        if value_for_change == "<continue>":
-                            pass
-                        elif value_for_change == "<del>":
-                            del dictionary[initial_key]
-                        elif isinstance(value_for_change, dict):
-                            dictionary[initial_key] = value_for_change
-
-        with open(self.full_path, 'r') as file:
-            file_contents = json.load(file)
-
-        file_contents = [
-            element
-            for element in file_contents
-            if element not in start_list_dictionaries
-        ]
-        file_contents.extend(changed_list_dictionaries)
+    @staticmethod
+    def apply_template(dictionary, template) -> Dict:
+        """Change ``dictionary`` in place by ``template`` \
+        from ``ask_template()``.
+
+        Returns:
+            ``Dict``: the changed ``dictionary``.
+        """
 
-        with open(self.full_path, 'w') as file:
-            json.dump(file_contents, file)
+        for key in list(dictionary):
+            value_for_change = template.get(key)
+            if value_for_change == "<del>":
+                del dictionary[key]
+            elif isinstance(value_for_change, dict):
+                dictionary[key] = value_for_change
+        return dictionary
+
+    def record_positions(self, dictionaries, positions=None) -> List[int]:
+        """Return the positions of ``dictionaries`` in the JSON file.
+
+        ``positions`` from ``object.output_positions`` are returned as is \
+        if the file still has ``dictionaries`` there. Otherwise, \
+        as well as if ``positions`` are not passed, the file is searched \
+        for all the objects equal to ``dictionaries``.
+        """
 
-        print("\nSuccess!")
+        file_contents = load_document(
+            self.full_path, cached=True, file_format=self.file_format,
+            columnar=self.columnar
+        )
+
+        def still_there(position, dictionary) -> bool:
+            if position >= len(file_contents):
+                return False
+            element = file_contents[position]
+            return element is dictionary or element == dictionary
+
+        if positions is not None and None not in positions and all(
+            still_there(position, dictionary)
+            for position, dictionary in zip(positions, dictionaries)
+        ):
+            return list(positions)
+
+        return [
+            position
+            for position, element in enumerate(file_contents)
+            if element in dictionaries
+        ]
 
     @staticmethod
     def format_several_objects(user_option, dictionary_container) -> List[Dict]:
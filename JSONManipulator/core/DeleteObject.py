@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 """The module with ``DeleteObject`` class"""
 
-import json
 from JSONManipulator.core.ChangeValue import ChangeValue
+from JSONManipulator.core.locking import FileLock
+from JSONManipulator.core.storage import mutate_document
 
 
 class DeleteObject(ChangeValue):
@@ -15,7 +16,13 @@ class DeleteObject(ChangeValue):
         ``value (str)``: the value of ``key``/``desc`` \
         which will be used to find the object(s).\n
         ``levenshtein (float)``: the similarity of the elicited objects \
-        to the input. By default, seeks 100% similarity.
+        to the input. By default, seeks 100% similarity.\n
+        ``index (bool)``: choose the candidates with ``ExactIndex`` \
+        or ``FuzzyIndex`` instead of scanning the whole file.\n
+        ``scorer (Scorer)``: the engine which compares the values.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.\n
+        ``columnar (bool)``: search in ``ColumnStore`` of the objects.
 
     Raises:
         ``exceptions.NoKeyAndDesc``: \
@@ -29,8 +36,10 @@ class DeleteObject(ChangeValue):
     __slots__ = ["value", "full_path", "levenshtein", "key", "desc"]
 
     def __init__(self, value, full_path, levenshtein=1.0, key=None,
-                 desc=None):
-        super().__init__(value, full_path, levenshtein, key, desc)
+                 desc=None, index=False, scorer=None, file_format=None,
+                 columnar=False):
+        super().__init__(value, full_path, levenshtein, key, desc, index,
+                         scorer, file_format=file_format, columnar=columnar)
         self.delete_object()
 
     def delete_object(self) -> None:
@@ -43,7 +52,9 @@ class DeleteObject(ChangeValue):
         if len(dictionary_container) == 1:
             option = input("\nDelete the object (Y/n)? ")
             if option.lower() in ["y", "yes"]:
-                self.execute_delete(dictionary_container)
+                self.execute_delete(
+                    dictionary_container, self.output_positions
+                )
 
         elif len(dictionary_container) > 1:
             print("\n\n----Use this function if you want to delete "
@@ -60,32 +71,47 @@ class DeleteObject(ChangeValue):
                 execution_dict = dictionary_container[int(option) - 1]
                 execution_container = [execution_dict]
 
-                self.execute_delete(execution_container)
+                self.execute_delete(
+                    execution_container,
+                    [self.output_positions[int(option) - 1]]
+                )
             elif option.lower() in ["all", "\'all\'"]:
-                self.execute_delete(dictionary_container)
+                self.execute_delete(
+                    dictionary_container, self.output_positions
+                )
 
             elif self.format_several_objects(option, dictionary_container):
-                execution_container = self.format_several_objects(
-                    option, dictionary_container
+                chosen_numbers = self.format_several_objects(
+                    option, list(range(len(dictionary_container)))
                 )
+                execution_container = [
+                    dictionary_container[number] for number in chosen_numbers
+                ]
 
-                self.execute_delete(execution_container)
+                self.execute_delete(
+                    execution_container,
+                    [self.output_positions[number] for number in chosen_numbers]
+                )
             else:
                 print("\nSorry, check your input.")
 
-    def execute_delete(self, dict_container) -> None:
-        """Delete redundant objects."""
+    def execute_delete(self, dict_container, positions=None) -> None:
+        """Delete redundant objects.
 
-        with open(self.full_path, 'r') as file:
-            file_contents = json.load(file)
+        Args:
+            ``dict_container (list)``: the objects to delete.\n
+            ``positions (list)``: the positions of the objects \
+            in the JSON file, from ``object.output_positions``. \
+            If not passed, all the objects equal to the ones \
+            from ``dict_container`` are deleted.
+        """
 
-        file_contents = [
-            dictionary
-            for dictionary in file_contents
-            if dictionary not in dict_container
-        ]
+        with FileLock(self.full_path, exclusive=True):
+            positions = self.record_positions(dict_container, positions)
 
-        with open(self.full_path, 'w') as file:
-            json.dump(file_contents, file)
+            mutate_document(
+                self.full_path, deletions=positions,
+                file_format=self.file_format
+            )
 
         print("\nSuccess!")
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""The module with ``Filter`` class"""
+
+from typing import List, Dict
+
+from JSONManipulator.core.predicates import AllOf
+from JSONManipulator.core.storage import load_document, iter_records
+import JSONManipulator.core.instrumentation as instrumentation
+
+
+class Filter:
+    """A non-interactive class to find the objects which match \
+    a combination of the predicates in one pass over the objects.
+
+    The predicate is compiled into one closure once, see ``predicates``.
+
+    Args:
+        ``predicate (Predicate)``: the predicate built of ``Exact``, \
+        ``Prefix``, ``Range``, ``Fuzzy``, ``AllOf`` and ``AnyOf``, \
+        or the list of the predicates which must all match.
+    """
+
+    __slots__ = ["predicate", "match", "output_dict_container",
+                 "output_positions"]
+
+    def __init__(self, predicate):
+        if isinstance(predicate, (list, tuple)):
+            predicate = AllOf(*predicate)
+        self.predicate = predicate
+        self.match = predicate.compile()
+        self.output_dict_container = []
+        self.output_positions = []
+
+    def __reduce__(self):
+        #  The compiled closure is built anew in the other processes.
+        return Filter, (self.predicate,)
+
+    def find(self, file_contents) -> List[Dict]:
+        """Find the objects in ``file_contents`` which match the predicate.
+
+        Args:
+            ``file_contents (Iterable)``: the objects to search in, \
+            read only once.
+
+        Returns:
+            ``List[Dict]``: the found objects in the order of ``file_contents``, \
+            their positions are kept in ``object.output_positions``.
+        """
+
+        self.output_dict_container = []
+        self.output_positions = []
+        match = self.match
+        scanned = 0
+        with instrumentation.span("match"):
+            for position, dictionary in enumerate(file_contents):
+                scanned += 1
+                if match(dictionary):
+                    self.output_dict_container.append(dictionary)
+                    self.output_positions.append(position)
+
+        instrumentation.count("records_scanned", scanned)
+        instrumentation.count("matches", len(self.output_dict_container))
+        return self.output_dict_container
+
+    def find_positions(self, file_contents) -> List[int]:
+        """Find the positions of the objects in ``file_contents`` \
+        which match the predicate.
+        """
+
+        self.find(file_contents)
+        return list(self.output_positions)
+
+    def find_in_file(self, full_path, file_format=None,
+                     stream=False) -> List[Dict]:
+        """Find the objects in the JSON file which match the predicate.
+
+        Args:
+            ``full_path (str)``: the full path to the JSON file.\n
+            ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+            detected from the file if not passed.\n
+            ``stream (bool)``: read the objects one by one \
+            instead of loading the whole file.
+
+        Returns:
+            ``List[Dict]``: the found objects.
+        """
+
+        if stream:
+            return self.find(iter_records(full_path, file_format))
+        return self.find(
+            load_document(full_path, cached=True, file_format=file_format)
+        )
@@ -1,10 +1,21 @@
 # -*- coding: utf-8 -*-
 """The module with ``GetInformation`` class"""
 
-import json
-from typing import List, Dict
-from difflib import SequenceMatcher
+import heapq
+from typing import List, Dict, Iterator, Tuple
 import JSONManipulator.exceptions as exceptions
+import JSONManipulator.core.instrumentation as instrumentation
+from JSONManipulator.core.cache import document_cache
+from JSONManipulator.core.columnar import ColumnStore
+from JSONManipulator.core.index import ExactIndex, FuzzyIndex
+from JSONManipulator.core.locking import FileLock
+from JSONManipulator.core.mutation_log import MutationLog
+from JSONManipulator.core.parallel import scan_records, scan_lines, CHUNK_SIZE
+from JSONManipulator.core.schema import Schema
+from JSONManipulator.core.scoring import difflib_scorer
+from JSONManipulator.core.storage import load_document, iter_records, \
+    detect_format, JSON_LINES
+from JSONManipulator.core.token_cache import TokenCache, normalize_value
 
 
 class GetInformation:
@@ -18,6 +29,34 @@ class GetInformation:
         which will be used to find the object(s).\n
         ``levenshtein (float)``: the similarity of the elicited objects \
         to the input. By default, seeks 100% similarity.\n
+        ``index (bool)``: choose the candidates with ``ExactIndex`` \
+        if ``levenshtein`` is 1.0, or with ``FuzzyIndex`` otherwise, \
+        instead of scanning the whole file. \
+        The index is kept in ``document_cache`` together with the file.\n
+        ``scorer (Scorer)``: the engine which compares the values, \
+        by default ``DifflibScorer``, taking the same decisions \
+        as ``SequenceMatcher``.\n
+        ``stream (bool)``: parse the objects of the file one by one \
+        instead of loading the whole file, for the files larger than RAM. \
+        ``index`` is not used then.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.\n
+        ``workers (int)``: compare the values in ``workers`` processes \
+        if ``index`` is not used. The JSON Lines file is split \
+        into the byte ranges read by the workers themselves.\n
+        ``chunk_size (int)``: the number of the objects sent \
+        to a worker at once.\n
+        ``chunk_bytes (int)``: the size of the byte range of the JSON Lines \
+        file read by a worker, by default four ranges per worker.\n
+        ``top (int)``: find only ``top`` most similar objects, \
+        in the order of their similarity kept in ``object.output_scores``. \
+        The similarity is computed in one process.\n
+        ``tokens (bool)``: take the normalized values of ``key``/``desc`` \
+        from the sidecar ``<full_path>.tokens`` of ``TokenCache``, \
+        creating it on the first search. ``index`` is used instead \
+        if it is enabled, and ``stream`` and ``workers`` are not used.\n
+        ``columnar (bool)``: keep the objects in ``document_cache`` \
+        as ``ColumnStore``, the found objects are its ``RecordView``.\n
 
     Raises:
         ``exceptions.NoKeyAndDesc``: \
@@ -29,16 +68,35 @@ class GetInformation:
     """
 
     __slots__ = ["value", "full_path", "levenshtein", "key",
-                 "desc", "output_dict_container"]
+                 "desc", "index", "scorer", "stream", "file_format",
+                 "workers", "chunk_size", "chunk_bytes", "top", "tokens", "columnar",
+                 "output_dict_container", "output_positions", "output_scores",
+                 "scanned", "desc_keys"]
 
     def __init__(self, value, full_path, levenshtein=1.0, key=None,
-                 desc=None):
+                 desc=None, index=False, scorer=None, stream=False,
+                 file_format=None, workers=None, chunk_size=CHUNK_SIZE,
+                 top=None, tokens=False, columnar=False, chunk_bytes=None):
         self.desc = desc
         self.value = value
         self.levenshtein = levenshtein
         self.key = key
         self.full_path = full_path
+        self.index = index
+        self.scorer = scorer or difflib_scorer
+        self.stream = stream
+        self.file_format = file_format
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.chunk_bytes = chunk_bytes
+        self.top = top
+        self.tokens = tokens
+        self.columnar = columnar
         self.output_dict_container = []
+        self.output_positions = []
+        self.output_scores = []
+        self.scanned = 0
+        self.desc_keys = None
         if self.__class__ == GetInformation:
             #  Call the function if not inherited.
             self.get_information()
@@ -56,9 +114,37 @@ class GetInformation:
 
         if not (self.key or self.desc):
             raise exceptions.NoKeyAndDesc
+        token_entries = None
         try:
-            with open(self.full_path, 'r') as file:
-                file_contents = json.load(file)
+            #  The keys of ``desc`` are resolved for the same version
+            #  of the file as the loaded objects.
+            with FileLock(self.full_path):
+                if self.desc and not self.key:
+                    self.desc_keys = Schema(self.full_path).keys_of(self.desc)
+                if self.tokens:
+                    file_contents = load_document(
+                        self.full_path, cached=True,
+                        file_format=self.file_format, columnar=self.columnar
+                    )
+                    if not self.index:
+                        token_entries = TokenCache(self.full_path).entries(
+                            file_contents, self.key, self.desc
+                        )
+                elif self.workers and not (self.index or self.top) \
+                        and self.is_plain_lines():
+                    #  The workers read the byte ranges of the file themselves,
+                    #  later than the schema is read.
+                    file_contents = None
+                    self.desc_keys = None
+                elif self.stream:
+                    file_contents = iter_records(
+                        self.full_path, self.file_format
+                    )
+                else:
+                    file_contents = load_document(
+                        self.full_path, cached=True,
+                        file_format=self.file_format, columnar=self.columnar
+                    )
         except FileNotFoundError:
             raise FileNotFoundError("Check the path to your file")
         except IsADirectoryError:
@@ -66,85 +152,300 @@ class GetInformation:
                 "You have specified the directory, not the path to the JSON file."
             )
         else:
-            if isinstance(self.value, list):
-                self.value = [
-                    str(element).upper().strip().replace(",", "")
-                    for element in self.value
-                    if isinstance(element, (str, int, float))
-                ]
-
-            if isinstance(self.value, (str, int, float)):
-                if isinstance(self.value, str) and ", " in self.value \
-                    and self.cap_sentence(self.value):
-                    self.value = self.value.upper().strip().split(", ")
-                else:
-                    str_value = str(self.value)
-                    self.value = str_value.upper().strip().replace(",", "").split()
-
-            if self.key and self.value:
-                for dictionary in file_contents:
-                    if self.key in dictionary:
-                        temporary_key = dictionary[self.key]
-                        self.levenshtein_calc(temporary_key, dictionary)
-                        continue
-                self.output_for_key_and_value()
-
-            elif self.desc and self.value:
-                for dictionary in file_contents:
-                    for value in dictionary.values():
-                        if isinstance(value, dict):
-                            for key, end_value in value.items():
-                                if key == self.desc:
-                                    self.levenshtein_calc(end_value, dictionary)
-                                    continue
-
-                self.output_for_key_and_value()
+            self.normalize_value()
+
+            if self.value:
+                index_class = ExactIndex \
+                    if ExactIndex.supports(self.levenshtein) else FuzzyIndex
+                with instrumentation.span("match"):
+                    if self.index and not self.stream \
+                            and index_class.supports(self.levenshtein):
+                        index = document_cache.index(file_contents, index_class)
+                        if self.top:
+                            candidates = index.candidates(self)
+                            self.scan_top(candidates)
+                            instrumentation.count(
+                                "records_scanned", len(candidates)
+                            )
+                        else:
+                            self.scan_index(index)
+                    elif token_entries is not None:
+                        self.scan_tokens(token_entries, len(file_contents))
+                    elif self.top:
+                        self.scan_top(self.scan_entries(file_contents))
+                        instrumentation.count("records_scanned", self.scanned)
+                    elif self.workers:
+                        self.scan_parallel(file_contents)
+                    else:
+                        self.scan(file_contents)
+                instrumentation.count(
+                    "matches", len(self.output_dict_container)
+                )
+                with instrumentation.span("render"):
+                    self.output_for_key_and_value()
 
         if self.__class__ != GetInformation:
             return self.output_dict_container
 
-    def levenshtein_calc(self, dictionary_value, dictionary) -> None:
-        """Compare processed ``object.value`` and ``dictionary_value``, \
-        and if the similarity is higher than ``object.levenshtein`` \
-        - append to the list for the further output.
+    def normalize_value(self) -> None:
+        """Bring ``object.value`` to the list of upper-cased words \
+        which is compared with the values in the JSON file.
         """
 
-        while isinstance(dictionary_value, dict):
-            dictionary_value = list(dictionary_value.values())[0]
-
-        if isinstance(dictionary_value, list):
-            dictionary_value = [
+        if isinstance(self.value, list):
+            self.value = [
                 str(element).upper().strip().replace(",", "")
-                for element in dictionary_value
-                if element and isinstance(element, (str, int, float))
+                for element in self.value
+                if isinstance(element, (str, int, float))
             ]
 
-        if isinstance(dictionary_value, (str, int, float)):
-            str_value = str(dictionary_value)
-            new_str_value = str_value.upper().strip().replace(",", "")
-            dictionary_value = new_str_value.split()
+        if isinstance(self.value, (str, int, float)):
+            if isinstance(self.value, str) and ", " in self.value \
+                and self.cap_sentence(self.value):
+                self.value = self.value.upper().strip().split(", ")
+            else:
+                str_value = str(self.value)
+                self.value = str_value.upper().strip().replace(",", "").split()
+
+    def scan(self, file_contents) -> None:
+        """Pass the values of ``object.key``/``object.desc`` \
+        of each object in ``file_contents`` to ``levenshtein_calc()``.
+        """
+
+        scored = 0
+        for dictionary_value, dictionary, position \
+                in self.scan_entries(file_contents):
+            scored += 1
+            self.levenshtein_calc(dictionary_value, dictionary, position)
+        instrumentation.count("records_scanned", self.scanned)
+        instrumentation.count("records_scored", scored)
+
+    def scan_index(self, index) -> None:
+        """Pass only the candidates from ``index`` to ``levenshtein_calc()``, \
+        in the same order as ``scan()`` does.
+        """
+
+        candidates = index.candidates(self)
+        for dictionary_value, dictionary, position in candidates:
+            self.levenshtein_calc(dictionary_value, dictionary, position)
+        instrumentation.count("records_scanned", len(candidates))
+        instrumentation.count("records_scored", len(candidates))
+
+    def scan_tokens(self, entries, scanned) -> None:
+        """Compare the already normalized values of ``entries`` \
+        from ``TokenCache``, finding the same objects in the same order \
+        as ``scan()`` does.
+        """
+
+        instrumentation.count("records_scanned", scanned)
+        if self.top:
+            self.scan_top(entries, normalized=True)
+            return
+
+        if isinstance(self.levenshtein, (float, int)) \
+                and 1 >= self.levenshtein > 0:
+            for dictionary_value, dictionary, position in entries:
+                if self.is_similar(dictionary_value):
+                    self.output_dict_container.append(dictionary)
+                    self.output_positions.append(position)
+        instrumentation.count("records_scored", len(entries))
+
+    def scan_parallel(self, file_contents) -> None:
+        """Pass the objects to ``levenshtein_calc()`` in the processes, \
+        finding the same objects in the same order as ``scan()`` does.
+        """
+
+        if file_contents is None:
+            scanned = scan_lines(
+                self, self.full_path, self.workers, self.chunk_bytes
+            )
+        else:
+            scanned = scan_records(
+                self, file_contents, self.workers, self.chunk_size
+            )
+        instrumentation.count("records_scanned", scanned)
+
+    def is_plain_lines(self) -> bool:
+        """Check if the JSON file is JSON Lines without the log of changes."""
+
+        return detect_format(self.full_path, self.file_format) == JSON_LINES \
+            and not MutationLog(self.full_path).enabled
+
+    def scan_entries(self, file_contents) -> Iterator[Tuple]:
+        """Yield the values of ``object.key``/``object.desc`` \
+        together with their objects and the positions of the objects \
+        in ``file_contents``. The number of the objects is kept \
+        in ``object.scanned`` at the end.
+        """
+
+        if isinstance(file_contents, ColumnStore):
+            yield from file_contents.entries(self.key, self.desc)
+            self.scanned = len(file_contents)
+            return
+
+        position = -1
+        if self.key:
+            for position, dictionary in enumerate(file_contents):
+                if self.key in dictionary:
+                    yield dictionary[self.key], dictionary, position
+
+        elif self.desc and self.desc_keys is not None \
+                and len(self.desc_keys) <= 1:
+            #  ``Schema`` knows the only key which can have the description.
+            key = self.desc_keys[0] if self.desc_keys else None
+            for position, dictionary in enumerate(file_contents):
+                value = dictionary.get(key)
+                if isinstance(value, dict) and self.desc in value:
+                    yield value[self.desc], dictionary, position
+
+        elif self.desc:
+            for position, dictionary in enumerate(file_contents):
+                for value in dictionary.values():
+                    if isinstance(value, dict):
+                        for key, end_value in value.items():
+                            if key == self.desc:
+                                yield end_value, dictionary, position
+        self.scanned = position + 1
+
+    def levenshtein_calc(self, dictionary_value, dictionary,
+                         position=None) -> None:
+        """Compare processed ``object.value`` and ``dictionary_value``, \
+        and if the similarity is higher than ``object.levenshtein`` \
+        - append to the list for the further output, \
+        and ``position`` of the object - to ``object.output_positions``.
+        """
+
+        dictionary_value = self.normalize_dictionary_value(dictionary_value)
 
         if isinstance(self.levenshtein, (float, int)) \
-            and 1 >= self.levenshtein > 0:
-            long_list = len(max(dictionary_value, self.value))
-            short_list = len(min(dictionary_value, self.value))
-
-            similarity_of_lists = SequenceMatcher(
-                None, dictionary_value, self.value
-            ).ratio()
-
-            similarity_of_words = (
-                SequenceMatcher(
-                    None, dictionary_value[i],
-                    self.value[i]
-                ).ratio() >= self.levenshtein
-                for i in range(short_list)
+            and 1 >= self.levenshtein > 0 \
+            and self.is_similar(dictionary_value):
+            self.output_dict_container.append(dictionary)
+            self.output_positions.append(position)
+
+    def scan_top(self, entries, normalized=False) -> None:
+        """Keep ``object.top`` most similar objects from ``entries`` \
+        in a bounded heap, ordered by ``similarity()`` and then by position.
+
+        Once the heap is full, the similarity of the worst kept object \
+        becomes the threshold of the next ones, so more of them are \
+        rejected by the cheap bounds of ``similarity()``. \
+        The values of ``entries`` are not normalized again if ``normalized``.
+        """
+
+        if not isinstance(self.levenshtein, (float, int)) \
+                or not 1 >= self.levenshtein > 0:
+            return
+
+        heap = []
+        threshold = self.levenshtein
+        scored = 0
+        best = None
+        for order, (dictionary_value, dictionary, position) \
+                in enumerate(entries):
+            scored += 1
+            if best is not None and best[2] != position:
+                threshold = self.push_top(heap, best, threshold)
+                best = None
+            if not normalized:
+                dictionary_value = \
+                    self.normalize_dictionary_value(dictionary_value)
+            if not isinstance(dictionary_value, list):
+                continue
+            score = self.similarity(dictionary_value, threshold)
+            if score is not None and (best is None or score > best[0]):
+                #  The same object is found by several descriptions.
+                best = (score, -order, position, dictionary) \
+                    if best is None else (score, best[1], position, dictionary)
+        if best is not None:
+            self.push_top(heap, best, threshold)
+
+        instrumentation.count("records_scored", scored)
+        for score, _, position, dictionary in sorted(heap, reverse=True):
+            self.output_scores.append(score)
+            self.output_positions.append(position)
+            self.output_dict_container.append(dictionary)
+
+    def push_top(self, heap, item, threshold) -> float:
+        """Push ``(score, -order, position, dictionary)`` to the heap \
+        of ``object.top`` items, replacing the worst one if it is full.
+
+        Returns:
+            ``float``: the new threshold of the similarity.
+        """
+
+        if len(heap) < self.top:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+        if len(heap) == self.top:
+            return max(threshold, heap[0][0])
+        return threshold
+
+    def similarity(self, dictionary_value, threshold) -> float or None:
+        """Compute the highest ``levenshtein`` with which \
+        ``is_similar(dictionary_value)`` holds: the lowest of the length \
+        ratio divided by 0.8, the ratio of the lists divided by 0.6 \
+        and the ratios of the words, but not more than 1.
+
+        Returns:
+            ``float``: the similarity, if it is not lower than ``threshold``.\n
+            ``None``: else.
+        """
+
+        long_list = len(max(dictionary_value, self.value))
+        short_list = len(min(dictionary_value, self.value))
+        if not 1 >= short_list / long_list >= 0.8 * threshold:
+            return None
+        score = min(1.0, short_list / long_list / 0.8)
+
+        list_ratio = self.scorer.ratio_if_at_least(
+            dictionary_value, self.value, 0.6 * threshold
+        )
+        if list_ratio is None:
+            return None
+        score = min(score, list_ratio / 0.6)
+
+        for i in range(short_list):
+            word_ratio = self.scorer.ratio_if_at_least(
+                dictionary_value[i], self.value[i], threshold
+            )
+            if word_ratio is None:
+                return None
+            score = min(score, word_ratio)
+        return score
+
+    def is_similar(self, dictionary_value) -> bool:
+        """Check if the normalized ``dictionary_value`` is similar \
+        to ``object.value`` by ``object.levenshtein``.
+        """
+
+        long_list = len(max(dictionary_value, self.value))
+        short_list = len(min(dictionary_value, self.value))
+
+        similarity_of_words = (
+            self.scorer.ratio_at_least(
+                dictionary_value[i], self.value[i], self.levenshtein
             )
+            for i in range(short_list)
+        )
+
+        return 1 >= short_list / long_list >= 0.8 * self.levenshtein \
+            and self.scorer.ratio_at_least(
+                dictionary_value, self.value, 0.6 * self.levenshtein
+            ) \
+            and all(similarity_of_words)
+
+    @staticmethod
+    def normalize_dictionary_value(dictionary_value):
+        """Bring the value from the JSON file to the list of upper-cased words.
+
+        Returns:
+            ``List[str]``: the normalized value.\n
+            The value itself: if it is not a string, a number or a list.
+        """
 
-            if 1 >= short_list / long_list >= 0.8 * self.levenshtein \
-                and similarity_of_lists >= 0.6 * self.levenshtein \
-                and all(similarity_of_words):
-                self.output_dict_container.append(dictionary)
+        return normalize_value(dictionary_value)
 
     def output_for_key_and_value(self) -> None:
         """Process ``object.output_dict_container`` from ``levenshtein_calc()``, \
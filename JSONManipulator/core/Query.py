@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""The module with ``Query`` class"""
+
+from typing import List, Dict, Tuple
+
+from JSONManipulator.core.GetInformation import GetInformation
+import JSONManipulator.exceptions as exceptions
+import JSONManipulator.core.instrumentation as instrumentation
+
+
+class Query(GetInformation):
+    """A non-interactive child class of ``GetInformation`` \
+    to find objects in the already loaded list of objects \
+    without printing them.
+
+    Args:
+        ``value (str)``: the value of ``key``/``desc`` \
+        which will be used to find the object(s).\n
+        ``levenshtein (float)``: the similarity of the elicited objects \
+        to the input. By default, seeks 100% similarity.\n
+        ``key (str)``: to find the object by the key.\n
+        ``desc (str)``: to find the object by the description.\n
+        ``scorer (Scorer)``: the engine which compares the values.
+
+    Raises:
+        ``exceptions.NoKeyAndDesc``: \
+        if neither ``key`` nor ``desc`` is entered.
+    """
+
+    __slots__ = ["value", "full_path", "levenshtein", "key", "desc"]
+
+    def __init__(self, value, levenshtein=1.0, key=None, desc=None,
+                 scorer=None):
+        super().__init__(value, None, levenshtein, key, desc, scorer=scorer)
+        if not (self.key or self.desc):
+            raise exceptions.NoKeyAndDesc
+        self.normalize_value()
+
+    def find(self, file_contents, index=None) -> List[Dict]:
+        """Find the objects in ``file_contents`` which match the query.
+
+        Args:
+            ``file_contents (list)``: the objects to search in.\n
+            ``index (BaseIndex)``: the index built over ``file_contents``, \
+            used if it supports ``levenshtein``.
+
+        Returns:
+            ``List[Dict]``: the found objects in the order of ``file_contents``, \
+            their positions in ``file_contents`` are kept \
+            in ``object.output_positions``.
+        """
+
+        self.output_dict_container = []
+        self.output_positions = []
+        with instrumentation.span("match"):
+            if self.value and index is not None \
+                    and index.supports(self.levenshtein):
+                self.scan_index(index)
+            elif self.value:
+                self.scan(file_contents)
+        instrumentation.count("matches", len(self.output_dict_container))
+        return self.output_dict_container
+
+    def find_positions(self, file_contents, index=None) -> List[int]:
+        """Find the positions of the objects in ``file_contents`` \
+        which match the query, each position once.
+
+        Returns:
+            ``List[int]``: the sorted positions of the found objects.
+        """
+
+        self.find(file_contents, index)
+        return sorted(set(self.output_positions))
+
+    def find_top(self, file_contents, top, index=None) -> List[Tuple]:
+        """Find ``top`` objects in ``file_contents`` which are the most \
+        similar to the query, not less than ``levenshtein``.
+
+        Args:
+            ``file_contents (list)``: the objects to search in.\n
+            ``top (int)``: the number of the objects to find.\n
+            ``index (BaseIndex)``: the index built over ``file_contents``, \
+            used if it supports ``levenshtein``.
+
+        Returns:
+            ``List[Tuple]``: ``(similarity, object)`` pairs, \
+            the most similar first, and the earlier object first \
+            among the equally similar ones. The positions \
+            of the found objects are kept in ``object.output_positions``.
+        """
+
+        self.top = top
+        self.output_dict_container = []
+        self.output_positions = []
+        self.output_scores = []
+        with instrumentation.span("match"):
+            if self.value and top and index is not None \
+                    and index.supports(self.levenshtein):
+                self.scan_top(index.candidates(self))
+            elif self.value and top:
+                self.scan_top(self.scan_entries(file_contents))
+        instrumentation.count("matches", len(self.output_dict_container))
+        return list(zip(self.output_scores, self.output_dict_container))
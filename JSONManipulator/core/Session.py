@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""The module with ``Session`` class"""
+
+from typing import List, Dict
+
+from JSONManipulator.core.columnar import ColumnStore, to_records
+from JSONManipulator.core.locking import FileLock
+from JSONManipulator.core.migration import migrate_records, \
+    validate_operations
+from JSONManipulator.core.Query import Query
+from JSONManipulator.core.storage import load_document, dump_document, \
+    detect_format
+import JSONManipulator.exceptions as exceptions
+
+
+class Session:
+    """A context manager to run many non-interactive operations \
+    on the JSON file with one load and one dump of the file.
+
+    The file is loaded when entering the ``with`` block, all the operations \
+    are applied to the objects in memory, and the file is written once \
+    when leaving the block. If an exception is raised inside the block, \
+    the file stays untouched. The exclusive lock of the file is held \
+    inside the block, so the other processes wait for the changes.
+
+    Args:
+        ``full_path (str)``: the full path to the JSON file.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.\n
+        ``columnar (bool)``: keep the objects in ``ColumnStore`` \
+        instead of the list of the dictionaries.
+
+    Raises:
+        ``FileNotFoundError``: \
+        if the JSON file is not found by ``full_path``.\n
+        ``IsADirectoryError``: \
+        if ``full_path`` is to a directory, not to the JSON file.
+    """
+
+    __slots__ = ["full_path", "file_format", "columnar", "file_contents",
+                 "changed", "file_lock"]
+
+    def __init__(self, full_path, file_format=None, columnar=False):
+        self.full_path = full_path
+        self.file_format = detect_format(full_path, file_format)
+        self.columnar = columnar
+        self.file_contents = None
+        self.changed = False
+        self.file_lock = FileLock(full_path, exclusive=True)
+
+    def __enter__(self):
+        self.file_lock.acquire()
+        try:
+            self.load()
+        except BaseException:
+            self.file_lock.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            self.file_lock.release()
+            self.file_contents = None
+            self.changed = False
+        return False
+
+    def load(self) -> None:
+        """Load the JSON file, discarding the uncommitted changes."""
+
+        self.file_contents = load_document(
+            self.full_path, file_format=self.file_format,
+            columnar=self.columnar
+        )
+        self.changed = False
+
+    def commit(self) -> None:
+        """Write the changed objects to the JSON file."""
+
+        if self.changed:
+            dump_document(
+                self.full_path, to_records(self.file_contents),
+                self.file_format
+            )
+            self.changed = False
+
+    def get_information(self, value, levenshtein=1.0, key=None,
+                        desc=None) -> List[Dict]:
+        """Find the objects like ``GetInformation`` does, without printing.
+
+        Returns:
+            ``List[Dict]``: the found objects.
+        """
+
+        return Query(value, levenshtein, key, desc).find(self.file_contents)
+
+    def change_value(self, changes, value, levenshtein=1.0, key=None,
+                     desc=None) -> int:
+        """Change the found objects like ``ChangeValue`` does.
+
+        Args:
+            ``changes (dict)``: new values of the keys, \
+            ``"<del>"`` deletes the key from the objects.
+
+        Returns:
+            ``int``: the number of the changed objects.
+        """
+
+        positions = Query(value, levenshtein, key, desc).find_positions(
+            self.file_contents
+        )
+        for position in positions:
+            self.apply_changes(self.file_contents[position], changes)
+        if positions:
+            self.changed = True
+        return len(positions)
+
+    def change_all_values(self, changes) -> int:
+        """Change all the objects like ``ChangeAllValues`` does.
+
+        Args:
+            ``changes (dict)``: new values of the keys, \
+            ``"<del>"`` deletes the key from the objects.
+
+        Returns:
+            ``int``: the number of the changed objects.
+        """
+
+        for dictionary in self.file_contents:
+            self.apply_changes(dictionary, changes)
+        if self.file_contents:
+            self.changed = True
+        return len(self.file_contents)
+
+    def delete_object(self, value, levenshtein=1.0, key=None,
+                      desc=None) -> int:
+        """Delete the found objects like ``DeleteObject`` does.
+
+        Returns:
+            ``int``: the number of the deleted objects.
+        """
+
+        positions = set(
+            Query(value, levenshtein, key, desc).find_positions(
+                self.file_contents
+            )
+        )
+        if isinstance(self.file_contents, ColumnStore):
+            self.file_contents.delete(positions)
+        else:
+            self.file_contents = [
+                dictionary
+                for position, dictionary in enumerate(self.file_contents)
+                if position not in positions
+            ]
+        if positions:
+            self.changed = True
+        return len(positions)
+
+    def add_key(self, key, desc=None, default_value="") -> None:
+        """Add ``key`` to each object like ``AddKey`` does.
+
+        Raises:
+            ``exceptions.KeyAlreadyExists``: \
+            if any object already has ``key``.
+        """
+
+        if any(dictionary.get(key) for dictionary in self.file_contents):
+            raise exceptions.KeyAlreadyExists(key)
+
+        for dictionary in self.file_contents:
+            dictionary[key] = {desc: default_value} if desc else default_value
+        self.changed = True
+
+    def migrate(self, operations) -> None:
+        """Add, rename and drop many keys of each object \
+        like ``migrate()`` does. If any object conflicts \
+        with ``operations``, none of the objects is changed.
+
+        Raises:
+            ``exceptions.InvalidMigration``: \
+            if the operations are malformed or conflict with each other.\n
+            ``exceptions.KeyAlreadyExists``: \
+            if an object already has a key which is added or renamed to.
+        """
+
+        migrated = list(migrate_records(
+            (dict(dictionary) for dictionary in self.file_contents),
+            validate_operations(operations)
+        ))
+        self.file_contents = ColumnStore(migrated) if self.columnar \
+            else migrated
+        self.changed = True
+
+    def add_object(self, new_object) -> None:
+        """Add ``new_object`` to the JSON file like ``AddObject`` does.
+
+        Raises:
+            ``exceptions.NotSupportedJSONFile``: \
+            if ``new_object`` is not a dictionary.
+        """
+
+        if not isinstance(new_object, dict):
+            raise exceptions.NotSupportedJSONFile
+        self.file_contents.append(new_object)
+        self.changed = True
+
+    @staticmethod
+    def apply_changes(dictionary, changes) -> None:
+        """Set the values from ``changes`` to the keys of ``dictionary``, \
+        keeping the descriptions of the keys.
+        """
+
+        for key, new_value in changes.items():
+            if key not in dictionary:
+                continue
+            if new_value in ["del", "<del>"]:
+                del dictionary[key]
+            elif isinstance(dictionary[key], dict) and dictionary[key]:
+                desc = list(dictionary[key].keys())[0]
+                dictionary[key] = {desc: new_value}
+            else:
+                dictionary[key] = new_value
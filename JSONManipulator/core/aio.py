@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""The module with the ``asyncio`` API: the non-interactive operations \
+of ``Session`` as coroutines, to overlap the work on many JSON files.
+
+Reading, parsing and writing of the files run in the executor \
+of the event loop, so the loop is never blocked. The operations which \
+change the same file run one after another, the lookups are not waiting \
+for each other.
+"""
+
+import asyncio
+import copy
+import os
+import weakref
+from functools import partial
+from typing import List, Dict
+
+from JSONManipulator.core.cache import document_cache
+from JSONManipulator.core.index import ExactIndex, FuzzyIndex
+from JSONManipulator.core.Query import Query
+from JSONManipulator.core.Session import Session
+from JSONManipulator.core.storage import load_document, append_document
+import JSONManipulator.exceptions as exceptions
+
+#  The locks of the files by the event loop and the real path of the file.
+LOCKS = weakref.WeakKeyDictionary()
+
+
+def file_lock(full_path) -> asyncio.Lock:
+    """Return the lock which serializes the changes of the JSON file \
+    in the running event loop.
+    """
+
+    loop_locks = LOCKS.setdefault(asyncio.get_event_loop(), dict())
+    return loop_locks.setdefault(os.path.realpath(full_path), asyncio.Lock())
+
+
+async def run_in_executor(function, *args, executor=None):
+    """Run ``function(*args)`` in ``executor``, \
+    by default in the executor of the event loop.
+    """
+
+    return await asyncio.get_event_loop().run_in_executor(
+        executor, partial(function, *args)
+    )
+
+
+async def aget_information(full_path, value, levenshtein=1.0, key=None,
+                           desc=None, index=False, file_format=None,
+                           executor=None) -> List[Dict]:
+    """Find the objects like ``GetInformation`` does, without printing.
+
+    Args:
+        ``index (bool)``: choose the candidates with ``ExactIndex`` \
+        or ``FuzzyIndex``, kept in ``document_cache`` with the file.\n
+        ``executor (concurrent.futures.Executor)``: the executor \
+        to read the file in, by default the one of the event loop.
+
+    Returns:
+        ``List[Dict]``: the copies of the found objects.
+
+    Raises:
+        ``exceptions.NoKeyAndDesc``: \
+        if neither ``key`` nor ``desc`` is entered.\n
+        ``FileNotFoundError``: \
+        if the JSON file is not found by ``full_path``.
+    """
+
+    query = Query(value, levenshtein, key, desc)
+    return await run_in_executor(
+        find, query, full_path, index, file_format, executor=executor
+    )
+
+
+def find(query, full_path, index, file_format) -> List[Dict]:
+    """Load the JSON file from ``document_cache`` and run ``query`` on it."""
+
+    file_contents = load_document(
+        full_path, cached=True, file_format=file_format
+    )
+    file_index = None
+    if index:
+        index_class = ExactIndex \
+            if ExactIndex.supports(query.levenshtein) else FuzzyIndex
+        file_index = document_cache.index(file_contents, index_class)
+    return copy.deepcopy(query.find(file_contents, file_index))
+
+
+async def run_session(full_path, method, *args, file_format=None,
+                      executor=None):
+    """Call ``method`` of ``Session`` of the JSON file in ``executor``, \
+    after the previous changes of the file are written.
+    """
+
+    async with file_lock(full_path):
+        return await run_in_executor(
+            session_call, full_path, file_format, method, args,
+            executor=executor
+        )
+
+
+def session_call(full_path, file_format, method, args):
+    """Open ``Session`` of the JSON file and call its ``method``."""
+
+    with Session(full_path, file_format) as session:
+        return getattr(session, method)(*args)
+
+
+async def achange_value(full_path, changes, value, levenshtein=1.0, key=None,
+                        desc=None, file_format=None, executor=None) -> int:
+    """Change the found objects like ``Session.change_value()`` does.
+
+    Returns:
+        ``int``: the number of the changed objects.
+    """
+
+    return await run_session(
+        full_path, "change_value", changes, value, levenshtein, key, desc,
+        file_format=file_format, executor=executor
+    )
+
+
+async def achange_all_values(full_path, changes, file_format=None,
+                             executor=None) -> int:
+    """Change all the objects like ``Session.change_all_values()`` does.
+
+    Returns:
+        ``int``: the number of the changed objects.
+    """
+
+    return await run_session(
+        full_path, "change_all_values", changes,
+        file_format=file_format, executor=executor
+    )
+
+
+async def adelete_object(full_path, value, levenshtein=1.0, key=None,
+                         desc=None, file_format=None, executor=None) -> int:
+    """Delete the found objects like ``Session.delete_object()`` does.
+
+    Returns:
+        ``int``: the number of the deleted objects.
+    """
+
+    return await run_session(
+        full_path, "delete_object", value, levenshtein, key, desc,
+        file_format=file_format, executor=executor
+    )
+
+
+async def aadd_key(full_path, key, desc=None, default_value="",
+                   file_format=None, executor=None) -> None:
+    """Add ``key`` to each object like ``Session.add_key()`` does.
+
+    Raises:
+        ``exceptions.KeyAlreadyExists``: \
+        if any object already has ``key``.
+    """
+
+    await run_session(
+        full_path, "add_key", key, desc, default_value,
+        file_format=file_format, executor=executor
+    )
+
+
+async def aadd_object(full_path, new_object, file_format=None,
+                      executor=None) -> None:
+    """Append ``new_object`` to the end of the JSON file \
+    without rewriting the other objects.
+
+    Raises:
+        ``exceptions.NotSupportedJSONFile``: \
+        if ``new_object`` is not a dictionary.
+    """
+
+    if not isinstance(new_object, dict):
+        raise exceptions.NotSupportedJSONFile
+    async with file_lock(full_path):
+        await run_in_executor(
+            append_document, full_path, [new_object], file_format,
+            executor=executor
+        )
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""The module with the process-wide cache of the parsed JSON files."""
+
+import os
+import threading
+from collections import OrderedDict
+
+
+class DocumentCache:
+    """An LRU cache of the parsed JSON files, limited by the memory budget.
+
+    The entries are keyed by ``(realpath, st_mtime_ns, st_size)`` of the file, \
+    so a changed file is never served from the cache. The size of the file \
+    on the disk is used as the weight of the entry.
+
+    The cached objects are shared between all the readers \
+    and must not be changed in place. The indexes built over the cached \
+    objects are kept together with them and dropped with them.
+
+    Args:
+        ``max_bytes (int)``: the memory budget of the cache, \
+        ``0`` disables the cache.
+    """
+
+    __slots__ = ["max_bytes", "current_bytes", "entries", "lock"]
+
+    def __init__(self, max_bytes=128 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def cache_key(full_path) -> tuple:
+        """Build the key of ``full_path`` with one ``stat()`` call.
+
+        Raises:
+            ``FileNotFoundError``: \
+            if the JSON file is not found by ``full_path``.
+        """
+
+        real_path = os.path.realpath(full_path)
+        stat_result = os.stat(real_path)
+        return real_path, stat_result.st_mtime_ns, stat_result.st_size
+
+    def get(self, cache_key):
+        """Return the cached objects for ``cache_key`` or ``None``."""
+
+        with self.lock:
+            if cache_key not in self.entries:
+                return None
+            self.entries.move_to_end(cache_key)
+            return self.entries[cache_key][0]
+
+    def put(self, cache_key, file_contents) -> None:
+        """Store ``file_contents`` under ``cache_key``, \
+        evicting the least recently used entries if necessary.
+        """
+
+        weight = cache_key[2]
+        if weight > self.max_bytes:
+            return
+        with self.lock:
+            self.discard(cache_key[0])
+            self.entries[cache_key] = [file_contents, {}]
+            self.current_bytes += weight
+            self.evict()
+
+    def index(self, file_contents, index_class):
+        """Return the instance of ``index_class`` built over ``file_contents``, \
+        building it once per cached file.
+        """
+
+        with self.lock:
+            indexes = next(
+                (entry[1] for entry in self.entries.values()
+                 if entry[0] is file_contents),
+                None
+            )
+            if indexes is not None and index_class in indexes:
+                return indexes[index_class]
+
+        built_index = index_class(file_contents)
+        if indexes is not None:
+            with self.lock:
+                built_index = indexes.setdefault(index_class, built_index)
+        return built_index
+
+    def invalidate(self, full_path) -> None:
+        """Drop all the entries of ``full_path``."""
+
+        with self.lock:
+            self.discard(os.path.realpath(full_path))
+
+    def resize(self, max_bytes) -> None:
+        """Change the memory budget of the cache."""
+
+        with self.lock:
+            self.max_bytes = max_bytes
+            self.evict()
+
+    def clear(self) -> None:
+        """Drop all the entries."""
+
+        with self.lock:
+            self.entries.clear()
+            self.current_bytes = 0
+
+    def discard(self, real_path) -> None:
+        """Drop the entries of ``real_path`` without locking."""
+
+        for cache_key in [key for key in self.entries if key[0] == real_path]:
+            del self.entries[cache_key]
+            self.current_bytes -= cache_key[2]
+
+    def evict(self) -> None:
+        """Drop the least recently used entries over the budget without locking."""
+
+        while self.entries and self.current_bytes > self.max_bytes:
+            cache_key, _ = self.entries.popitem(last=False)
+            self.current_bytes -= cache_key[2]
+
+
+document_cache = DocumentCache()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""The module with the codecs which parse and serialize the JSON texts \
+for all the readers and writers of the package.
+
+The default codec ``"auto"`` parses with ``orjson`` if it is importable, \
+falling back to ``json`` for the texts ``orjson`` rejects (``NaN``, \
+the integers beyond 64 bits), and serializes with ``json`` as before, \
+so the written files look the same with or without ``orjson``. \
+The other codecs are chosen by ``set_codec()``:
+
+``"json"``: ``json`` only, ``json_codec()`` tunes the separators \
+and ``ensure_ascii``.\n
+``"orjson"``: ``orjson`` for both, writing the compact UTF-8 text.\n
+``"ujson"``: ``ujson`` for both.
+"""
+
+import json
+from typing import Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class Codec:
+    """The pair of the functions to parse and serialize the JSON texts.
+
+    Args:
+        ``name (str)``: the name to choose the codec by.\n
+        ``loads (Callable)``: parses ``str`` or ``bytes`` to the object.\n
+        ``dumps (Callable)``: serializes the object to ``str``.\n
+        ``separator (str)``: written between the objects of the JSON array.
+    """
+
+    __slots__ = ["name", "loads", "dumps", "separator"]
+
+    def __init__(self, name, loads, dumps, separator=", "):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.separator = separator
+
+    def __repr__(self):
+        return f"Codec({self.name!r})"
+
+
+def json_codec(compact=False, ensure_ascii=True, name="json") -> Codec:
+    """Build the codec of the standard ``json`` module.
+
+    Args:
+        ``compact (bool)``: write without the spaces after ``,`` and ``:``.\n
+        ``ensure_ascii (bool)``: escape the non-ASCII characters.
+    """
+
+    encoder = json.JSONEncoder(
+        ensure_ascii=ensure_ascii,
+        separators=(",", ":") if compact else None
+    )
+    return Codec(
+        name, json.loads, encoder.encode, "," if compact else ", "
+    )
+
+
+def with_fallback(loads) -> Callable:
+    """Parse with ``loads``, and with ``json.loads`` if it fails."""
+
+    def fallback_loads(text):
+        try:
+            return loads(text)
+        except ValueError:
+            return json.loads(text)
+
+    return fallback_loads
+
+
+CODECS = {"json": json_codec()}
+if orjson is not None:
+    CODECS["orjson"] = Codec(
+        "orjson", with_fallback(orjson.loads),
+        lambda obj: orjson.dumps(obj).decode(), ","
+    )
+if ujson is not None:
+    CODECS["ujson"] = Codec(
+        "ujson", with_fallback(ujson.loads),
+        lambda obj: ujson.dumps(obj, escape_forward_slashes=False), ","
+    )
+CODECS["auto"] = Codec(
+    "auto", CODECS["orjson"].loads if orjson is not None else json.loads,
+    CODECS["json"].dumps
+)
+
+#  The codec used by the package.
+CURRENT_CODEC = [CODECS["auto"]]
+
+
+def register_codec(codec) -> None:
+    """Make ``codec`` available to ``set_codec()`` by its name."""
+
+    CODECS[codec.name] = codec
+
+
+def set_codec(codec) -> Codec:
+    """Use ``codec`` (``Codec`` or the name of a registered one) \
+    in all the readers and writers of the package.
+
+    Returns:
+        ``Codec``: the codec used before.
+
+    Raises:
+        ``KeyError``: if there is no registered codec with the name.
+    """
+
+    if isinstance(codec, str):
+        codec = CODECS[codec]
+    previous = CURRENT_CODEC[0]
+    CURRENT_CODEC[0] = codec
+    return previous
+
+
+def get_codec() -> Codec:
+    """Return the codec used by the package."""
+
+    return CURRENT_CODEC[0]
+
+
+def loads(text):
+    """Parse ``text`` with the current codec."""
+
+    return CURRENT_CODEC[0].loads(text)
+
+
+def dumps(obj) -> str:
+    """Serialize ``obj`` with the current codec."""
+
+    return CURRENT_CODEC[0].dumps(obj)
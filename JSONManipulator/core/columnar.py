@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""The module with ``ColumnStore`` class, the compact in-memory form \
+of the objects of the JSON file after ``set_up()``.
+
+Every key is kept as a column of the values of its ``{desc: value}`` \
+dictionaries, with the description stored once per column. The keys, \
+the descriptions and the short string values are interned, the orders \
+of the keys are shared by the objects with the same keys, and the columns \
+of only integers or only floats are kept in ``array``. The values \
+which are not ``{desc: value}`` dictionaries are kept as they are.
+
+The objects are read through ``RecordView``, a dictionary-like view \
+which builds ``{desc: value}`` on access, so ``GetInformation``, \
+``Query`` and ``Session`` work with the store as with the list \
+of the dictionaries.
+"""
+
+import copy
+import sys
+from array import array
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Tuple
+
+#  The string values up to this length are interned.
+INTERNED_LENGTH = 64
+
+
+class Column:
+    """The values of one key of all the objects of ``ColumnStore``.
+
+    The position of an object without the key keeps a placeholder.
+
+    Args:
+        ``length (int)``: the number of the objects in the store.
+    """
+
+    __slots__ = ["desc", "descs", "values", "filled"]
+
+    def __init__(self, length=0):
+        self.desc = None
+        #  The descriptions which differ from ``desc``, by the positions.
+        self.descs = dict()
+        self.values = array("q", bytes(8 * length))
+        self.filled = False
+
+    def desc_at(self, position) -> str:
+        """Return the description of the value at ``position``."""
+
+        return self.descs.get(position, self.desc)
+
+    def set(self, position, desc, value) -> None:
+        """Store ``{desc: value}`` at ``position``."""
+
+        if self.desc is None:
+            self.desc = desc
+        if desc == self.desc:
+            self.descs.pop(position, None)
+        else:
+            self.descs[position] = desc
+
+        values = self.values
+        if isinstance(values, array):
+            if values.typecode == "q" and type(value) is int \
+                    and -2 ** 63 <= value < 2 ** 63:
+                values[position] = value
+                self.filled = True
+                return
+            if type(value) is float and (
+                    values.typecode == "d" or not self.filled):
+                if values.typecode != "d":
+                    self.values = values = array("d", bytes(8 * len(values)))
+                values[position] = value
+                self.filled = True
+                return
+            self.values = values = list(values) if self.filled \
+                else [None] * len(values)
+        values[position] = value
+        self.filled = True
+
+    def append_placeholder(self) -> None:
+        """Add the position of the next object of the store."""
+
+        self.values.append(0 if isinstance(self.values, array) else None)
+
+    def clear(self, position) -> None:
+        """Drop the value at ``position``."""
+
+        self.descs.pop(position, None)
+        if not isinstance(self.values, array):
+            self.values[position] = None
+
+    def keep(self, kept, shifts) -> None:
+        """Keep only the positions of ``kept``, moved to ``shifts``."""
+
+        values = [self.values[position] for position in kept]
+        self.values = array(self.values.typecode, values) \
+            if isinstance(self.values, array) else values
+        self.descs = {
+            shifts[position]: desc for position, desc in self.descs.items()
+            if shifts[position] is not None
+        }
+
+
+class ColumnStore:
+    """The objects of the JSON file kept as the columns of their keys.
+
+    The store is a sequence of ``RecordView``. The views of the objects \
+    are valid until the objects are deleted from the store.
+
+    Args:
+        ``records (Iterable)``: the objects to store, \
+        read one by one, so it can be a generator.
+    """
+
+    __slots__ = ["columns", "shapes", "shape_ids", "record_shapes",
+                 "extras", "strings"]
+
+    def __init__(self, records=()):
+        self.columns = dict()
+        #  The orders of the keys and their numbers.
+        self.shapes = []
+        self.shape_ids = dict()
+        self.record_shapes = array("I")
+        #  The values which are not ``{desc: value}``, by (position, key).
+        self.extras = dict()
+        self.strings = dict()
+        for record in records:
+            self.append(record)
+
+    def __len__(self):
+        return len(self.record_shapes)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [
+                RecordView(self, number)
+                for number in range(*position.indices(len(self)))
+            ]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("ColumnStore index out of range")
+        return RecordView(self, position)
+
+    def __iter__(self) -> Iterator:
+        for position in range(len(self)):
+            yield RecordView(self, position)
+
+    def __repr__(self):
+        return f"ColumnStore({len(self)} objects, {len(self.columns)} keys)"
+
+    def records(self) -> Iterator[dict]:
+        """Yield the objects as the dictionaries one by one, e.g. to write them."""
+
+        for position in range(len(self)):
+            yield self.record(position)
+
+    def record(self, position) -> dict:
+        """Build the dictionary of the object at ``position``."""
+
+        return {
+            key: self.value(position, key)
+            for key in self.shapes[self.record_shapes[position]]
+        }
+
+    def intern(self, string):
+        """Return the shared copy of the short ``string``."""
+
+        if type(string) is not str or len(string) > INTERNED_LENGTH:
+            return string
+        return self.strings.setdefault(string, string)
+
+    def shape_id(self, keys) -> int:
+        """Return the number of the order of ``keys``, adding it if needed."""
+
+        keys = tuple(keys)
+        shape_id = self.shape_ids.get(keys)
+        if shape_id is None:
+            shape_id = self.shape_ids[keys] = len(self.shapes)
+            self.shapes.append(keys)
+        return shape_id
+
+    def append(self, record) -> None:
+        """Add ``record`` to the end of the store."""
+
+        position = len(self)
+        for column in self.columns.values():
+            column.append_placeholder()
+        self.record_shapes.append(self.shape_id(
+            sys.intern(key) if type(key) is str else key for key in record
+        ))
+        for key, value in record.items():
+            self.put(position, key, value)
+
+    def put(self, position, key, value) -> None:
+        """Store ``value`` of ``key`` at ``position``, \
+        the key must be in the order of the object.
+        """
+
+        self.extras.pop((position, key), None)
+        if isinstance(value, dict) and len(value) == 1:
+            desc, end_value = next(iter(value.items()))
+            if type(desc) is str:
+                column = self.columns.get(key)
+                if column is None:
+                    column = self.columns[key] = Column(len(self))
+                column.set(position, sys.intern(desc), self.intern(end_value))
+                return
+        column = self.columns.get(key)
+        if column is not None:
+            column.clear(position)
+        self.extras[(position, key)] = value
+
+    def value(self, position, key):
+        """Return the value of ``key`` at ``position``, \
+        ``{desc: value}`` is built anew.
+        """
+
+        if (position, key) in self.extras:
+            return self.extras[(position, key)]
+        column = self.columns[key]
+        return {column.desc_at(position): column.values[position]}
+
+    def keys_at(self, position) -> Tuple:
+        """Return the keys of the object at ``position`` in their order."""
+
+        return self.shapes[self.record_shapes[position]]
+
+    def set_value(self, position, key, value) -> None:
+        """Set ``value`` of ``key`` of the object at ``position``."""
+
+        keys = self.keys_at(position)
+        if key not in keys:
+            self.record_shapes[position] = self.shape_id(keys + (key,))
+        self.put(position, key, value)
+
+    def delete_value(self, position, key) -> None:
+        """Delete ``key`` from the object at ``position``."""
+
+        keys = self.keys_at(position)
+        self.record_shapes[position] = self.shape_id(
+            other_key for other_key in keys if other_key != key
+        )
+        self.extras.pop((position, key), None)
+        if key in self.columns:
+            self.columns[key].clear(position)
+
+    def delete(self, positions) -> None:
+        """Delete the objects at ``positions``, moving the next ones."""
+
+        positions = set(positions)
+        kept = [
+            position for position in range(len(self))
+            if position not in positions
+        ]
+        shifts = [None] * len(self)
+        for new_position, position in enumerate(kept):
+            shifts[position] = new_position
+
+        for column in self.columns.values():
+            column.keep(kept, shifts)
+        self.record_shapes = array(
+            "I", (self.record_shapes[position] for position in kept)
+        )
+        self.extras = {
+            (shifts[position], key): value
+            for (position, key), value in self.extras.items()
+            if shifts[position] is not None
+        }
+
+    def entries(self, key=None, desc=None) -> Iterator[Tuple]:
+        """Yield the values of ``key``/``desc`` with the views \
+        of their objects and the positions, like \
+        ``GetInformation.scan_entries()`` does. The values of ``key`` \
+        are yielded without their descriptions.
+        """
+
+        if key:
+            shapes = [key in keys for keys in self.shapes]
+            column = self.columns.get(key)
+            for position, shape_id in enumerate(self.record_shapes):
+                if shapes[shape_id]:
+                    if (position, key) in self.extras:
+                        value = self.extras[(position, key)]
+                    else:
+                        value = column.values[position]
+                    yield value, RecordView(self, position), position
+
+        elif desc:
+            for position, shape_id in enumerate(self.record_shapes):
+                view = None
+                for record_key in self.shapes[shape_id]:
+                    if (position, record_key) in self.extras:
+                        value = self.extras[(position, record_key)]
+                        if not (isinstance(value, dict) and desc in value):
+                            continue
+                        value = value[desc]
+                    else:
+                        column = self.columns[record_key]
+                        if column.desc_at(position) != desc:
+                            continue
+                        value = column.values[position]
+                    if view is None:
+                        view = RecordView(self, position)
+                    yield value, view, position
+
+
+class RecordView(MutableMapping):
+    """The dictionary-like view of the object of ``ColumnStore``.
+
+    The values ``{desc: value}`` are built on every access, so a value \
+    is changed by assigning it to the key, not in place.
+
+    Args:
+        ``store (ColumnStore)``: the store of the object.\n
+        ``position (int)``: the position of the object in the store.
+    """
+
+    __slots__ = ["store", "position"]
+
+    def __init__(self, store, position):
+        self.store = store
+        self.position = position
+
+    def __getitem__(self, key):
+        if key not in self.store.keys_at(self.position):
+            raise KeyError(key)
+        return self.store.value(self.position, key)
+
+    def __setitem__(self, key, value):
+        self.store.set_value(self.position, key, value)
+
+    def __delitem__(self, key):
+        if key not in self.store.keys_at(self.position):
+            raise KeyError(key)
+        self.store.delete_value(self.position, key)
+
+    def __contains__(self, key):
+        return key in self.store.keys_at(self.position)
+
+    def __iter__(self):
+        return iter(self.store.keys_at(self.position))
+
+    def __len__(self):
+        return len(self.store.keys_at(self.position))
+
+    def __eq__(self, other):
+        if isinstance(other, RecordView) and other.store is self.store \
+                and other.position == self.position:
+            return True
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.to_dict(), memo)
+
+    def __reduce__(self):
+        #  The view is sent to the other processes as a dictionary.
+        return dict, (self.to_dict(),)
+
+    def copy(self) -> dict:
+        """Return the shallow copy of the object as a dictionary."""
+
+        return self.to_dict()
+
+    def to_dict(self) -> dict:
+        """Build the dictionary of the object."""
+
+        return self.store.record(self.position)
+
+
+def to_records(file_contents) -> Iterator[Dict] or List[Dict]:
+    """Return ``file_contents`` as the dictionaries, for the writers."""
+
+    if isinstance(file_contents, ColumnStore):
+        return file_contents.records()
+    return file_contents
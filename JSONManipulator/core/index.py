@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""The module with the indexes which narrow down the objects \
+passed to ``GetInformation.levenshtein_calc()``.
+
+An index only chooses the candidates, every candidate is still checked \
+by ``levenshtein_calc()``, so the found objects are the same as without it.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import List, Tuple
+
+#  Keeps the float comparisons of the thresholds on the safe side.
+TOLERANCE = 1e-9
+
+
+class BaseIndex(ABC):
+    """The base class of the indexes over the objects of the JSON file.
+
+    The values of ``key``/``desc`` are normalized and indexed \
+    once per ``key``/``desc``, on the first query to it.
+
+    Args:
+        ``file_contents (list)``: the objects of the JSON file.
+    """
+
+    __slots__ = ["file_contents", "fields"]
+
+    def __init__(self, file_contents):
+        self.file_contents = file_contents
+        self.fields = dict()
+
+    def candidates(self, query) -> List[Tuple]:
+        """Choose the ``(dictionary_value, dictionary, position)`` entries \
+        which can be found by ``query`` (``GetInformation`` instance \
+        with the normalized value), in the order of ``query.scan_entries()``.
+        """
+
+        field = (query.key, None) if query.key else (None, query.desc)
+        if field not in self.fields:
+            entries = list(query.scan_entries(self.file_contents))
+            normalized_values = []
+            for dictionary_value, *_ in entries:
+                try:
+                    normalized_value = \
+                        query.normalize_dictionary_value(dictionary_value)
+                except Exception:
+                    normalized_value = None
+                if not isinstance(normalized_value, list):
+                    normalized_value = None
+                normalized_values.append(normalized_value)
+            self.fields[field] = (
+                entries, self.build(normalized_values)
+            )
+        entries, field_index = self.fields[field]
+
+        positions = self.lookup(field_index, query)
+        return [entries[position] for position in sorted(positions)]
+
+    @staticmethod
+    def supports(levenshtein) -> bool:
+        """Check if the index can choose the candidates for ``levenshtein``."""
+
+        return isinstance(levenshtein, (float, int)) and 1 >= levenshtein > 0
+
+    @abstractmethod
+    def build(self, normalized_values):
+        """Index the normalized values, ``None`` stands for a value \
+        which can not be normalized and is always a candidate.
+        """
+
+    @abstractmethod
+    def lookup(self, field_index, query) -> set:
+        """Return the positions of the candidates for ``query``."""
+
+
+class ExactIndex(BaseIndex):
+    """A hash index of the normalized values of ``key``/``desc`` \
+    for the queries with ``levenshtein == 1.0``.
+
+    With the 100% similarity an object is found only if its normalized \
+    value and the normalized input are equal, or one of them starts with \
+    the other and is at least 80% of its length. The index maps the values \
+    and such prefixes of them to the positions of the objects, \
+    so a lookup costs a few dictionary accesses instead of a full scan.
+
+    Args:
+        ``file_contents (list)``: the objects of the JSON file.
+    """
+
+    __slots__ = []
+
+    @staticmethod
+    def supports(levenshtein) -> bool:
+        return isinstance(levenshtein, (float, int)) and levenshtein == 1
+
+    def build(self, normalized_values) -> tuple:
+        values = dict()
+        prefixes = dict()
+        unindexed = []
+
+        for position, normalized_value in enumerate(normalized_values):
+            if normalized_value is None:
+                unindexed.append(position)
+                continue
+
+            normalized_value = tuple(normalized_value)
+            values.setdefault(normalized_value, []).append(position)
+            for length in range(math.floor(0.8 * len(normalized_value)),
+                                len(normalized_value)):
+                prefixes.setdefault(
+                    normalized_value[:length], []
+                ).append(position)
+
+        return values, prefixes, unindexed
+
+    def lookup(self, field_index, query) -> set:
+        values, prefixes, unindexed = field_index
+
+        value = tuple(query.value)
+        positions = set(unindexed)
+        positions.update(prefixes.get(value, ()))
+        for length in range(math.floor(0.8 * len(value)), len(value) + 1):
+            positions.update(values.get(value[:length], ()))
+        return positions
+
+
+class FuzzyIndex(BaseIndex):
+    """An inverted index of the normalized words of ``key``/``desc`` \
+    for the queries with any ``levenshtein``.
+
+    ``levenshtein_calc()`` compares the lists of words with \
+    ``SequenceMatcher``, which matches only equal words, and demands \
+    the similarity of the lists of at least ``0.6 * levenshtein``. \
+    That similarity can not exceed ``2 * shared / (len_1 + len_2)``, \
+    where ``shared`` is the number of the equal words in both lists, \
+    and the shorter list must be at least ``0.8 * levenshtein`` \
+    of the longer one. The index counts the shared words \
+    from the postings of the words of the input, and only the objects \
+    which pass both bounds go to ``levenshtein_calc()``.
+
+    Args:
+        ``file_contents (list)``: the objects of the JSON file.
+    """
+
+    __slots__ = []
+
+    def build(self, normalized_values) -> tuple:
+        postings = dict()
+        lengths = []
+        unindexed = []
+
+        for position, normalized_value in enumerate(normalized_values):
+            if normalized_value is None:
+                lengths.append(0)
+                unindexed.append(position)
+                continue
+
+            lengths.append(len(normalized_value))
+            for word, count in Counter(normalized_value).items():
+                postings.setdefault(word, []).append((position, count))
+
+        return postings, lengths, unindexed
+
+    def lookup(self, field_index, query) -> set:
+        postings, lengths, unindexed = field_index
+
+        shared_words = Counter()
+        for word, query_count in Counter(query.value).items():
+            for position, count in postings.get(word, ()):
+                shared_words[position] += min(count, query_count)
+
+        value_length = len(query.value)
+        positions = set(unindexed)
+        for position, shared in shared_words.items():
+            length = lengths[position]
+            if min(length, value_length) / max(length, value_length) \
+                >= 0.8 * query.levenshtein - TOLERANCE \
+                and 2 * shared / (length + value_length) \
+                    >= 0.6 * query.levenshtein - TOLERANCE:
+                positions.add(position)
+        return positions
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""The module with the recorders of the timings and the counters \
+of the phases of the operations.
+
+The phases are recorded as spans: ``load`` (reading and parsing \
+of the JSON file), ``match`` (comparing the values), ``render`` \
+(printing the found objects) and ``dump`` (writing the JSON file). \
+The counters are ``records_scanned``, ``records_scored``, ``matches``, \
+``bytes_read`` and ``bytes_written``.
+
+By default nothing is recorded. A recorder is chosen for the current \
+context (thread or ``asyncio`` task) with ``use_recorder()``:
+
+    ``with use_recorder(HistogramCollector()) as collector:``\n
+    ``    GetInformation(...)``\n
+    ``print(collector.summary())``
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+try:
+    from contextvars import ContextVar
+except ImportError:
+    ContextVar = None
+
+#  The upper bounds of the buckets of the histograms, in seconds.
+BUCKETS = [0.000001 * 2 ** power for power in range(36)]
+
+
+class NullSpan:
+    """The span which records nothing."""
+
+    __slots__ = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Recorder:
+    """The base class of the recorders, which records nothing.
+
+    A child class overrides ``record_span()`` and ``count()``.
+    """
+
+    __slots__ = []
+
+    enabled = False
+
+    def span(self, name):
+        """Return the context manager which times the phase ``name``."""
+
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name)
+
+    def record_span(self, name, seconds) -> None:
+        """Record that the phase ``name`` took ``seconds``."""
+
+    def count(self, name, amount=1) -> None:
+        """Add ``amount`` to the counter ``name``."""
+
+
+class Span:
+    """The span which passes its duration to ``recorder``."""
+
+    __slots__ = ["recorder", "name", "start"]
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.recorder.record_span(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class CallbackRecorder(Recorder):
+    """The recorder which passes every span and counter to the callbacks.
+
+    Args:
+        ``on_span (Callable)``: called with the name and the seconds.\n
+        ``on_count (Callable)``: called with the name and the amount.
+    """
+
+    __slots__ = ["on_span", "on_count"]
+
+    enabled = True
+
+    def __init__(self, on_span=None, on_count=None):
+        self.on_span = on_span
+        self.on_count = on_count
+
+    def record_span(self, name, seconds) -> None:
+        if self.on_span:
+            self.on_span(name, seconds)
+
+    def count(self, name, amount=1) -> None:
+        if self.on_count:
+            self.on_count(name, amount)
+
+
+class HistogramCollector(Recorder):
+    """The recorder which aggregates the durations of the spans \
+    into the histograms and sums up the counters. It can be shared \
+    by the threads.
+    """
+
+    __slots__ = ["lock", "spans", "counters"]
+
+    enabled = True
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.spans = dict()
+        self.counters = dict()
+
+    def record_span(self, name, seconds) -> None:
+        with self.lock:
+            span = self.spans.get(name)
+            if span is None:
+                span = self.spans[name] = {
+                    "count": 0, "total": 0.0, "min": seconds, "max": seconds,
+                    "buckets": [0] * (len(BUCKETS) + 1),
+                }
+            span["count"] += 1
+            span["total"] += seconds
+            span["min"] = min(span["min"], seconds)
+            span["max"] = max(span["max"], seconds)
+            span["buckets"][bisect.bisect_left(BUCKETS, seconds)] += 1
+
+    def count(self, name, amount=1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def percentile(self, name, percent) -> float:
+        """Estimate the duration of the phase ``name`` which ``percent`` \
+        of the spans did not exceed, by the upper bound of its bucket.
+        """
+
+        with self.lock:
+            span = self.spans[name]
+            needed = span["count"] * percent / 100
+            seen = 0
+            for position, number in enumerate(span["buckets"]):
+                seen += number
+                if number and seen >= needed:
+                    return BUCKETS[position] \
+                        if position < len(BUCKETS) else span["max"]
+            return span["max"]
+
+    def summary(self) -> Dict:
+        """Return the aggregated spans and counters, \
+        with only the non-empty buckets of the histograms.
+        """
+
+        with self.lock:
+            spans = dict()
+            for name, span in self.spans.items():
+                spans[name] = {
+                    "count": span["count"], "total": span["total"],
+                    "min": span["min"], "max": span["max"],
+                    "mean": span["total"] / span["count"],
+                    "histogram": {
+                        str(BUCKETS[position])
+                        if position < len(BUCKETS) else "inf": number
+                        for position, number in enumerate(span["buckets"])
+                        if number
+                    },
+                }
+            return {"spans": spans, "counters": dict(self.counters)}
+
+    def clear(self) -> None:
+        """Forget everything recorded."""
+
+        with self.lock:
+            self.spans.clear()
+            self.counters.clear()
+
+
+NULL_RECORDER = Recorder()
+
+if ContextVar is not None:
+    CURRENT_RECORDER = ContextVar("recorder", default=NULL_RECORDER)
+else:
+    CURRENT_RECORDER = None
+    GLOBAL_RECORDER = [NULL_RECORDER]
+
+
+def current_recorder() -> Recorder:
+    """Return the recorder of the current context."""
+
+    if CURRENT_RECORDER is None:
+        return GLOBAL_RECORDER[0]
+    return CURRENT_RECORDER.get()
+
+
+@contextmanager
+def use_recorder(recorder):
+    """Record the phases inside the block with ``recorder``. \
+    Without ``contextvars`` (Python 3.6) the recorder is process-wide.
+    """
+
+    if CURRENT_RECORDER is None:
+        previous = GLOBAL_RECORDER[0]
+        GLOBAL_RECORDER[0] = recorder
+        try:
+            yield recorder
+        finally:
+            GLOBAL_RECORDER[0] = previous
+        return
+
+    token = CURRENT_RECORDER.set(recorder)
+    try:
+        yield recorder
+    finally:
+        CURRENT_RECORDER.reset(token)
+
+
+def span(name):
+    """Time the phase ``name`` with the recorder of the current context."""
+
+    return current_recorder().span(name)
+
+
+def count(name, amount=1) -> None:
+    """Add ``amount`` to the counter ``name`` of the current recorder."""
+
+    recorder = current_recorder()
+    if recorder.enabled:
+        recorder.count(name, amount)
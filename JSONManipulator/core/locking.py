@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""The module with the locks of the JSON files shared by the processes, \
+and with the atomic writing of the files.
+
+The readers take the shared lock and the writers take the exclusive one \
+on ``<full_path>.lock`` with ``fcntl.flock()``, so many readers run \
+at once, and nobody reads a file which is being written. The file itself \
+is written to a temporary file which replaces it at once, so even \
+a process which does not lock the file never sees it half-written.
+
+Without ``fcntl`` (on Windows) the locks do nothing, and only the atomic \
+writing is kept.
+"""
+
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+#  The locks held by the current thread, by the real path of the JSON file.
+HELD_LOCKS = threading.local()
+
+
+class FileLock:
+    """The shared or the exclusive lock of the JSON file.
+
+    The lock is reentrant within a thread: an inner lock of the same file \
+    reuses the outer one, and the exclusive inner lock upgrades \
+    the shared outer one until the inner lock is released.
+
+    Args:
+        ``full_path (str)``: the full path to the JSON file.\n
+        ``exclusive (bool)``: take the exclusive lock for writing \
+        instead of the shared one for reading.
+    """
+
+    __slots__ = ["full_path", "exclusive", "held"]
+
+    def __init__(self, full_path, exclusive=False):
+        self.full_path = full_path
+        self.exclusive = exclusive
+        self.held = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
+
+    def acquire(self) -> None:
+        """Wait for the lock and take it."""
+
+        if fcntl is None:
+            return
+
+        held_locks = HELD_LOCKS.__dict__.setdefault("locks", dict())
+        real_path = os.path.realpath(self.full_path)
+        held = held_locks.get(real_path)
+        if held is None:
+            held = {
+                "path": real_path, "registry": held_locks,
+                "file": self.open_lock_file(), "holders": [],
+            }
+            held_locks[real_path] = held
+
+        if held["file"] is not None:
+            if self.exclusive and not is_exclusive(held):
+                fcntl.flock(held["file"], fcntl.LOCK_EX)
+            elif not held["holders"]:
+                fcntl.flock(held["file"], fcntl.LOCK_SH)
+        held["holders"].append(self)
+        self.held = held
+
+    def open_lock_file(self):
+        """Open ``<full_path>.lock``, creating it if needed.
+
+        Returns:
+            ``None``: if there is nothing to lock - the JSON file \
+            to read does not exist, or the lock file can not be created.
+        """
+
+        if not self.exclusive and not os.path.isfile(self.full_path):
+            return None
+        try:
+            return open(self.full_path + ".lock", 'a')
+        except OSError:
+            return None
+
+    def release(self) -> None:
+        """Release the lock, downgrading it back to the shared one \
+        if the other locks of the file held by the thread are shared. \
+        The locks may be released in any order.
+        """
+
+        held, self.held = self.held, None
+        if held is None:
+            return
+
+        #  By identity, not the last one: the locks of the iterators
+        #  are released whenever the iterators are closed.
+        held["holders"] = [
+            holder for holder in held["holders"] if holder is not self
+        ]
+        if not held["holders"]:
+            held["registry"].pop(held["path"], None)
+            if held["file"] is not None:
+                fcntl.flock(held["file"], fcntl.LOCK_UN)
+                held["file"].close()
+        elif self.exclusive and not is_exclusive(held) \
+                and held["file"] is not None:
+            fcntl.flock(held["file"], fcntl.LOCK_SH)
+
+
+def is_exclusive(held) -> bool:
+    """Check if any of the holders of the held lock is exclusive."""
+
+    return any(holder.exclusive for holder in held["holders"])
+
+
+class LockedIterator:
+    """The iterator over ``records`` which holds ``lock`` \
+    until it is exhausted, closed or deleted.
+    """
+
+    __slots__ = ["records", "lock"]
+
+    def __init__(self, records, lock):
+        self.records = records
+        self.lock = lock
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self.records)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Stop reading and release the lock."""
+
+        if hasattr(self.records, "close"):
+            self.records.close()
+        self.lock.release()
+
+    def __del__(self):
+        self.close()
+
+
+@contextmanager
+def atomic_write(full_path, mode='w'):
+    """Open a temporary file next to ``full_path`` for writing, \
+    and replace ``full_path`` with it once it is written and synced \
+    to the disk. If an exception is raised, ``full_path`` stays untouched.
+
+    Args:
+        ``full_path (str)``: the full path to the file.\n
+        ``mode (str)``: ``'w'`` or ``'wb'``.
+    """
+
+    #  Replace the file a symbolic link points to, not the link itself.
+    full_path = os.path.realpath(full_path)
+    directory, name = os.path.split(full_path)
+    descriptor, temporary_path = tempfile.mkstemp(
+        prefix=f".{name}.", suffix=".tmp", dir=directory
+    )
+    try:
+        encoding = None if "b" in mode else "utf-8"
+        with os.fdopen(descriptor, mode, encoding=encoding) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        try:
+            file_mode = stat.S_IMODE(os.stat(full_path).st_mode)
+        except FileNotFoundError:
+            file_mode = new_file_mode(temporary_path)
+        os.chmod(temporary_path, file_mode)
+        os.replace(temporary_path, full_path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+    sync_directory(directory)
+
+
+def new_file_mode(temporary_path) -> int:
+    """Return the mode of a new file as ``open()`` creates it \
+    with the current umask, by creating a probe file next to \
+    ``temporary_path``. The umask itself is not changed, \
+    as it is shared by all the threads of the process.
+    """
+
+    probe_path = temporary_path + ".mode"
+    descriptor = os.open(probe_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        return stat.S_IMODE(os.fstat(descriptor).st_mode)
+    finally:
+        os.close(descriptor)
+        os.remove(probe_path)
+
+
+def sync_directory(directory) -> None:
+    """Sync the entries of ``directory`` to the disk, where it is supported."""
+
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    descriptor = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
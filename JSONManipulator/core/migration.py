@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""The module with ``migrate`` function, which adds, renames and drops \
+many keys of the objects of the JSON file at once.
+
+The operations are the dictionaries:
+
+``{"op": "add", "key": "rating", "desc": "Rating", "default": 0}``: \
+add the key to the end of every object, as ``{desc: default}`` \
+or as ``default`` without ``desc``.\n
+``{"op": "rename", "key": "pageCount", "to": "pages", "desc": "Pages"}``: \
+rename the key in place, and its description if ``desc`` is passed.\n
+``{"op": "drop", "key": "thumbnailUrl"}``: delete the key.
+"""
+
+from typing import Dict, Iterator, List
+
+import JSONManipulator.exceptions as exceptions
+from JSONManipulator.core.locking import FileLock
+from JSONManipulator.core.storage import iter_records, dump_document
+
+ADD = "add"
+RENAME = "rename"
+DROP = "drop"
+
+
+def migrate(full_path, operations, file_format=None) -> None:
+    """Apply ``operations`` to every object of the JSON file \
+    in one pass, reading and writing the objects one by one, \
+    and replace the file at once. If any object conflicts \
+    with the operations, the file stays untouched.
+
+    Args:
+        ``full_path (str)``: the full path to the JSON file.\n
+        ``operations (list)``: the operations described above.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.
+
+    Raises:
+        ``exceptions.InvalidMigration``: \
+        if the operations are malformed or conflict with each other.\n
+        ``exceptions.KeyAlreadyExists``: \
+        if an object already has a key which is added or renamed to.\n
+        ``exceptions.NotSupportedJSONFile``: \
+        if an object is not a dictionary.\n
+        ``FileNotFoundError``: \
+        if the JSON file is not found by ``full_path``.
+    """
+
+    operations = validate_operations(operations)
+    new_keys = [
+        operation["key"] if operation["op"] == ADD else operation["to"]
+        for operation in operations if operation["op"] != DROP
+    ]
+
+    with FileLock(full_path, exclusive=True):
+        dump_document(
+            full_path,
+            migrate_records(
+                iter_records(full_path, file_format), operations, new_keys
+            ),
+            file_format
+        )
+
+
+def validate_operations(operations) -> List[Dict]:
+    """Check that every operation is well-formed, that every key \
+    is changed by one operation only, and that no key is both \
+    changed and created.
+
+    Returns:
+        ``List[Dict]``: the operations.
+
+    Raises:
+        ``exceptions.InvalidMigration``: if they are not.
+    """
+
+    operations = list(operations)
+    sources = set()
+    targets = set()
+    for operation in operations:
+        if not isinstance(operation, dict) \
+                or operation.get("op") not in (ADD, RENAME, DROP):
+            raise exceptions.InvalidMigration(f"unknown operation {operation}")
+        key = operation.get("key")
+        target = operation.get("to") if operation["op"] == RENAME else key
+        if not key or not isinstance(key, str) \
+                or not target or not isinstance(target, str):
+            raise exceptions.InvalidMigration(
+                f"the keys of {operation} must be non-empty strings"
+            )
+
+        if operation["op"] != ADD:
+            if key in sources:
+                raise exceptions.InvalidMigration(
+                    f"<{key}> is changed more than once"
+                )
+            sources.add(key)
+        if operation["op"] != DROP:
+            if target in targets:
+                raise exceptions.InvalidMigration(
+                    f"<{target}> is created more than once"
+                )
+            targets.add(target)
+
+    both = sources & targets
+    if both:
+        raise exceptions.InvalidMigration(
+            f"<{sorted(both)[0]}> is both changed and created"
+        )
+    return operations
+
+
+def migrate_records(records, operations, new_keys=None) -> Iterator[Dict]:
+    """Yield the objects with ``operations`` applied.
+
+    Raises:
+        ``exceptions.KeyAlreadyExists``: \
+        if an object already has a key from ``new_keys``.\n
+        ``exceptions.NotSupportedJSONFile``: \
+        if an object is not a dictionary.
+    """
+
+    if new_keys is None:
+        new_keys = [
+            operation["key"] if operation["op"] == ADD else operation["to"]
+            for operation in operations if operation["op"] != DROP
+        ]
+    changes = {
+        operation["key"]: operation
+        for operation in operations if operation["op"] != ADD
+    }
+    additions = [operation for operation in operations if operation["op"] == ADD]
+
+    for dictionary in records:
+        if not isinstance(dictionary, dict):
+            raise exceptions.NotSupportedJSONFile
+        for key in new_keys:
+            if key in dictionary:
+                raise exceptions.KeyAlreadyExists(key)
+
+        if changes:
+            migrated = dict()
+            for key, value in dictionary.items():
+                operation = changes.get(key)
+                if operation is None:
+                    migrated[key] = value
+                elif operation["op"] == RENAME:
+                    if operation.get("desc") and isinstance(value, dict) \
+                            and len(value) == 1:
+                        value = {operation["desc"]: next(iter(value.values()))}
+                    migrated[operation["to"]] = value
+            dictionary = migrated
+
+        for operation in additions:
+            default_value = operation.get("default", "")
+            dictionary[operation["key"]] = \
+                {operation["desc"]: default_value} if operation.get("desc") \
+                else default_value
+        yield dictionary
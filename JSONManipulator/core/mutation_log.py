@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""The module with ``MutationLog`` class, an append-only log of the changes \
+which is kept next to the JSON file instead of rewriting the file."""
+
+import hashlib
+import os
+import threading
+from typing import Iterator, List
+
+import JSONManipulator.core.codec as codec
+from JSONManipulator.core.locking import atomic_write
+
+#  The locks of the logs of this process, by the real path of the JSON file.
+LOCKS = dict()
+LOCKS_GUARD = threading.Lock()
+#  The stats and the checksums of the JSON files of this process
+#  by their real paths, so an unchanged file is not read again.
+CHECKSUMS = dict()
+
+
+class MutationLog:
+    """The log of the changes of the JSON file, stored in ``<full_path>.log`` \
+    as JSON Lines.
+
+    The objects of the file are addressed by their slots: the objects \
+    of the file itself take the slots from 0 to ``count - 1``, and every \
+    appended object takes the next slot. The first line of the log keeps \
+    ``count``, the stamp of the file (the SHA-256 of its contents, \
+    which the copies of the file keep) and the thresholds \
+    of the compaction, the other lines are:
+
+    ``{"op": "append", "object": {...}}``: add an object to the end.\n
+    ``{"op": "upsert", "slot": 3, "object": {...}}``: replace an object.\n
+    ``{"op": "delete", "slot": 3}``: delete an object.
+
+    The slots stay the same until the log is folded into the file. \
+    A log with the stamp of another file is the log of the file \
+    before it was replaced, e.g. if the process stopped after folding \
+    the log into the file but before starting the log anew, \
+    so its changes are already in the file and are not applied again.
+
+    Args:
+        ``full_path (str)``: the full path to the JSON file.
+    """
+
+    __slots__ = ["full_path", "log_path"]
+
+    def __init__(self, full_path):
+        self.full_path = full_path
+        self.log_path = full_path + ".log"
+
+    @property
+    def enabled(self) -> bool:
+        """Check if the log of the JSON file exists."""
+
+        return os.path.isfile(self.log_path)
+
+    @property
+    def lock(self) -> threading.RLock:
+        """The lock of the log, shared by all the threads of the process."""
+
+        real_path = os.path.realpath(self.full_path)
+        with LOCKS_GUARD:
+            return LOCKS.setdefault(real_path, threading.RLock())
+
+    def header(self) -> dict:
+        """Read the first line of the log."""
+
+        with open(self.log_path, 'r', encoding="utf-8") as file:
+            return codec.loads(file.readline())
+
+    def base_stamp(self) -> str:
+        """Build the stamp of the JSON file, the SHA-256 of its contents, \
+        which changes when the file is replaced by another one.
+        """
+
+        real_path = os.path.realpath(self.full_path)
+        stat_result = os.stat(real_path)
+        stat_key = (stat_result.st_ino, stat_result.st_size,
+                    stat_result.st_mtime_ns)
+        with LOCKS_GUARD:
+            cached = CHECKSUMS.get(real_path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        checksum = hashlib.sha256()
+        with open(real_path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                checksum.update(block)
+        with LOCKS_GUARD:
+            CHECKSUMS[real_path] = (stat_key, checksum.hexdigest())
+        return checksum.hexdigest()
+
+    def is_current(self, header=None) -> bool:
+        """Check if the log was started for the current JSON file. \
+        The logs without the stamp are taken as current.
+        """
+
+        header = header or self.header()
+        return header.get("base", self.base_stamp()) == self.base_stamp()
+
+    def entries(self) -> Iterator[dict]:
+        """Yield the changes from the log in the order they were made."""
+
+        with open(self.log_path, 'r', encoding="utf-8") as file:
+            file.readline()
+            for line in file:
+                if line.strip():
+                    yield codec.loads(line)
+
+    def reset(self, count, max_entries=None, max_bytes=None) -> None:
+        """Start an empty log for the file of ``count`` objects, \
+        keeping the thresholds of the compaction if not passed.
+        """
+
+        if self.enabled:
+            header = self.header()
+            max_entries = max_entries or header["max_entries"]
+            max_bytes = max_bytes or header["max_bytes"]
+        header = {
+            "op": "base", "count": count, "base": self.base_stamp(),
+            "max_entries": max_entries or 10000,
+            "max_bytes": max_bytes or 16 * 1024 * 1024,
+        }
+        with atomic_write(self.log_path) as file:
+            file.write(codec.dumps(header) + "\n")
+
+    def disable(self) -> None:
+        """Remove the log, the file must be compacted before."""
+
+        os.remove(self.log_path)
+
+    def append(self, entries) -> None:
+        """Append the changes to the log."""
+
+        with open(self.log_path, 'a', encoding="utf-8") as file:
+            for entry in entries:
+                file.write(codec.dumps(entry) + "\n")
+
+    def slots(self) -> List[int]:
+        """Return the slots of the objects in the order they are read, \
+        the log must be current.
+        """
+
+        next_slot = self.header()["count"]
+        deleted = set()
+        for entry in self.entries():
+            if entry["op"] == "append":
+                next_slot += 1
+            elif entry["op"] == "delete":
+                deleted.add(entry["slot"])
+            else:
+                deleted.discard(entry["slot"])
+        return [slot for slot in range(next_slot) if slot not in deleted]
+
+    def apply(self, file_contents) -> Iterator:
+        """Apply the changes from the log to the objects of the file, \
+        yielding the objects one by one. The log is read at once, \
+        and the log which is not current is not applied.
+        """
+
+        header = self.header()
+        if not self.is_current(header):
+            return iter(file_contents)
+        count = header["count"]
+        next_slot = count
+        changed = dict()
+        deleted = set()
+        for entry in self.entries():
+            if entry["op"] == "append":
+                changed[next_slot] = entry["object"]
+                next_slot += 1
+            elif entry["op"] == "delete":
+                deleted.add(entry["slot"])
+            else:
+                changed[entry["slot"]] = entry["object"]
+                deleted.discard(entry["slot"])
+        return self.apply_changes(
+            file_contents, count, next_slot, changed, deleted
+        )
+
+    @staticmethod
+    def apply_changes(file_contents, count, next_slot, changed,
+                      deleted) -> Iterator:
+        """Yield the objects of the file with the changes read from the log."""
+
+        for slot, dictionary in enumerate(file_contents):
+            if slot not in deleted:
+                yield changed.get(slot, dictionary)
+        for slot in range(count, next_slot):
+            if slot not in deleted:
+                yield changed[slot]
+
+    def needs_compaction(self) -> bool:
+        """Check if the log has grown past one of its thresholds."""
+
+        header = self.header()
+        if not self.is_current(header):
+            return True
+        if os.path.getsize(self.log_path) > header["max_bytes"]:
+            return True
+        with open(self.log_path, 'rb') as file:
+            return sum(1 for _ in file) - 1 > header["max_entries"]
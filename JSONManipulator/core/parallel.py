@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""The module with the parallel scan, which compares the values \
+of the objects in several processes with ``ProcessPoolExecutor``.
+
+The objects are split into the chunks, every worker checks its chunk \
+with ``levenshtein_calc()`` of a copy of the query, and the found \
+positions are merged in the order of the chunks, so the found objects \
+are exactly the same and in the same order as after ``scan()``.
+"""
+
+import copy
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Tuple
+
+import JSONManipulator.core.codec as codec
+from JSONManipulator.core.locking import FileLock
+
+CHUNK_SIZE = 2000
+
+
+def scan_records(query, file_contents, workers=None,
+                 chunk_size=CHUNK_SIZE) -> int:
+    """Find the objects of ``file_contents`` in ``workers`` processes, \
+    appending them to ``query.output_dict_container``.
+
+    Args:
+        ``query (GetInformation)``: the query with the normalized value.\n
+        ``file_contents (Iterable)``: the objects to search in, \
+        can be a generator.\n
+        ``workers (int)``: the number of the processes, \
+        by default the number of the CPUs.\n
+        ``chunk_size (int)``: the number of the objects sent \
+        to a worker at once.
+
+    Returns:
+        ``int``: the number of the objects in ``file_contents``.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    query_copy = worker_query(query)
+    pending = deque()
+    iterator = iter(file_contents)
+    offset = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if chunk:
+                pending.append((offset, chunk, executor.submit(
+                    match_records, query_copy, chunk, offset
+                )))
+                offset += len(chunk)
+            #  Keep only a few chunks in memory, merging them in order.
+            while pending and (not chunk or len(pending) > 2 * workers):
+                chunk_offset, chunk_done, future = pending.popleft()
+                for position in future.result():
+                    query.output_dict_container.append(
+                        chunk_done[position - chunk_offset]
+                    )
+                    query.output_positions.append(position)
+            if not chunk:
+                return offset
+
+
+def worker_query(query):
+    """Copy ``query`` without its found objects, so only the query itself \
+    is sent to the workers with every chunk.
+    """
+
+    query_copy = copy.copy(query)
+    query_copy.output_dict_container = []
+    query_copy.output_positions = []
+    query_copy.output_scores = []
+    return query_copy
+
+
+def match_records(query, chunk, offset) -> List[int]:
+    """Check the objects of ``chunk`` in a worker.
+
+    Returns:
+        ``List[int]``: the positions of the found objects, \
+        counted from ``offset``.
+    """
+
+    query.output_dict_container = []
+    query.output_positions = []
+    for dictionary_value, dictionary, position in query.scan_entries(chunk):
+        query.levenshtein_calc(dictionary_value, dictionary, position + offset)
+    return query.output_positions
+
+
+def scan_lines(query, full_path, workers=None, chunk_bytes=None) -> int:
+    """Find the objects of the JSON Lines file in ``workers`` processes, \
+    every worker reading and parsing its own byte range of the file.
+
+    Args:
+        ``query (GetInformation)``: the query with the normalized value.\n
+        ``full_path (str)``: the full path to the JSON Lines file \
+        without the log of the changes.\n
+        ``workers (int)``: the number of the processes, \
+        by default the number of the CPUs.\n
+        ``chunk_bytes (int)``: the size of a byte range, by default \
+        the file is split into four ranges per worker.
+
+    Returns:
+        ``int``: the number of the objects in the file.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    file_size = os.path.getsize(full_path)
+    chunk_bytes = chunk_bytes or max(file_size // (workers * 4), 1)
+    starts = range(0, file_size, chunk_bytes)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            match_range,
+            [worker_query(query)] * len(starts), [full_path] * len(starts), starts,
+            [min(start + chunk_bytes, file_size) for start in starts]
+        )
+        offset = 0
+        for count, found in results:
+            for position, dictionary in found:
+                query.output_dict_container.append(dictionary)
+                query.output_positions.append(position + offset)
+            offset += count
+    return offset
+
+
+def match_range(query, full_path, start, end) -> Tuple[int, List[Tuple]]:
+    """Check the lines of the JSON Lines file which start \
+    from ``start`` to ``end`` byte in a worker.
+
+    Returns:
+        ``tuple``: the number of the objects in the range, \
+        and the found objects with their positions in the range.
+    """
+
+    with FileLock(full_path), open(full_path, 'rb') as file:
+        if start:
+            #  Skip the line which started in the previous range.
+            file.seek(start - 1)
+            file.readline()
+        chunk = []
+        while file.tell() < end:
+            line = file.readline()
+            if not line:
+                break
+            if line.strip():
+                chunk.append(codec.loads(line))
+
+    positions = match_records(query, chunk, 0)
+    return len(chunk), [(position, chunk[position]) for position in positions]
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""The module with the predicates of ``Filter``: ``Exact``, ``Prefix``, \
+``Range`` and ``Fuzzy`` conditions on the values of a key \
+or a description, combined by ``AllOf`` and ``AnyOf`` \
+(or by the ``&`` and ``|`` operators).
+
+``compile()`` turns the predicate into one closure, which takes an object \
+and tells if it matches. The values of the query are normalized once \
+when compiling, and the conditions of ``AllOf`` and ``AnyOf`` are checked \
+in the order of their ``cost``, so the exact and the range checks reject \
+most objects before ``Fuzzy`` compares any sequences.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator
+
+import JSONManipulator.exceptions as exceptions
+from JSONManipulator.core.Query import Query
+from JSONManipulator.core.token_cache import normalize_value
+
+
+def unwrap(value):
+    """Take the value out of ``{desc: value}``."""
+
+    while isinstance(value, dict) and value:
+        value = next(iter(value.values()))
+    return value
+
+
+def normalize_text(value) -> str or None:
+    """Bring a string or a number to the upper-cased words \
+    joined by single spaces, as ``normalize_value()`` splits them.
+
+    Returns:
+        ``None``: if ``value`` is not a string or a number.
+    """
+
+    if isinstance(value, (str, int, float)):
+        return " ".join(normalize_value(value))
+    return None
+
+
+class Predicate(ABC):
+    """The base class of the predicates.
+
+    ``cost`` is the relative price of checking the predicate on one object.
+    """
+
+    __slots__ = []
+
+    cost = 1
+
+    @abstractmethod
+    def compile(self) -> Callable[[dict], bool]:
+        """Build the closure which checks if an object matches."""
+
+    def __and__(self, other):
+        return AllOf(self, other)
+
+    def __or__(self, other):
+        return AnyOf(self, other)
+
+
+class FieldPredicate(Predicate):
+    """The base class of the conditions on the values \
+    of ``key``/``desc``: an object matches if any of its values \
+    under ``desc`` (or under ``key``, with ``desc`` inside it if passed) \
+    matches.
+
+    Raises:
+        ``exceptions.NoKeyAndDesc``: \
+        if neither ``key`` nor ``desc`` is entered.
+    """
+
+    __slots__ = ["key", "desc"]
+
+    def __init__(self, key=None, desc=None):
+        if not (key or desc):
+            raise exceptions.NoKeyAndDesc
+        self.key = key
+        self.desc = desc
+
+    @abstractmethod
+    def test(self) -> Callable:
+        """Build the closure which checks one value."""
+
+    def compile(self) -> Callable[[dict], bool]:
+        key = self.key
+        desc = self.desc
+        test = self.test()
+
+        if key and desc:
+            def match(dictionary):
+                value = dictionary.get(key)
+                return isinstance(value, dict) and desc in value \
+                    and test(value[desc])
+
+        elif key:
+            def match(dictionary):
+                return key in dictionary and test(dictionary[key])
+
+        else:
+            def match(dictionary):
+                for value in dictionary.values():
+                    if isinstance(value, dict) and desc in value \
+                            and test(value[desc]):
+                        return True
+                return False
+
+        return match
+
+    def __repr__(self):
+        return f"{type(self).__name__}(key={self.key!r}, desc={self.desc!r})"
+
+
+class Exact(FieldPredicate):
+    """The value equals ``value`` up to the case, the commas \
+    and the spaces, or a list has such an element.
+
+    Args:
+        ``value (str)``: the value to compare with.\n
+        ``key (str)``: the key of the values.\n
+        ``desc (str)``: the description of the values.
+    """
+
+    __slots__ = ["value"]
+
+    cost = 1
+
+    def __init__(self, value, key=None, desc=None):
+        super().__init__(key, desc)
+        self.value = value
+
+    def test(self) -> Callable:
+        text = normalize_text(self.value)
+
+        def test(value):
+            value = unwrap(value)
+            if isinstance(value, list):
+                return any(normalize_text(element) == text for element in value)
+            return normalize_text(value) == text
+
+        return test
+
+
+class Prefix(FieldPredicate):
+    """The value starts with ``value`` up to the case, the commas \
+    and the spaces, or a list has such an element.
+
+    Args:
+        ``value (str)``: the beginning of the values.\n
+        ``key (str)``: the key of the values.\n
+        ``desc (str)``: the description of the values.
+    """
+
+    __slots__ = ["value"]
+
+    cost = 2
+
+    def __init__(self, value, key=None, desc=None):
+        super().__init__(key, desc)
+        self.value = value
+
+    def test(self) -> Callable:
+        text = normalize_text(self.value)
+
+        def starts(value):
+            value = normalize_text(value)
+            return value is not None and value.startswith(text)
+
+        def test(value):
+            value = unwrap(value)
+            if isinstance(value, list):
+                return any(starts(element) for element in value)
+            return starts(value)
+
+        return test
+
+
+class Range(FieldPredicate):
+    """The number (or the string of the number) is between \
+    ``low`` and ``high`` inclusive.
+
+    Args:
+        ``low (float)``: the lowest number, not bounded if ``None``.\n
+        ``high (float)``: the highest number, not bounded if ``None``.\n
+        ``key (str)``: the key of the values.\n
+        ``desc (str)``: the description of the values.
+    """
+
+    __slots__ = ["low", "high"]
+
+    cost = 1
+
+    def __init__(self, low=None, high=None, key=None, desc=None):
+        super().__init__(key, desc)
+        self.low = low
+        self.high = high
+
+    def test(self) -> Callable:
+        low = float("-inf") if self.low is None else self.low
+        high = float("inf") if self.high is None else self.high
+
+        def test(value):
+            value = unwrap(value)
+            if isinstance(value, str):
+                try:
+                    value = float(value)
+                except ValueError:
+                    return False
+            elif not isinstance(value, (int, float)) or isinstance(value, bool):
+                return False
+            return low <= value <= high
+
+        return test
+
+
+class Fuzzy(FieldPredicate):
+    """The value is similar to ``value`` by ``levenshtein``, \
+    exactly as ``Query`` compares them.
+
+    Args:
+        ``value (str)``: the value to compare with.\n
+        ``levenshtein (float)``: the similarity of the values.\n
+        ``key (str)``: the key of the values.\n
+        ``desc (str)``: the description of the values.\n
+        ``scorer (Scorer)``: the engine which compares the values.
+    """
+
+    __slots__ = ["query"]
+
+    cost = 10
+
+    def __init__(self, value, levenshtein=1.0, key=None, desc=None,
+                 scorer=None):
+        super().__init__(key, desc)
+        self.query = Query(value, levenshtein, key, desc, scorer=scorer)
+
+    def test(self) -> Callable:
+        query = self.query
+        if not query.value or not isinstance(query.levenshtein, (float, int)) \
+                or not 1 >= query.levenshtein > 0:
+            return lambda value: False
+
+        def test(value):
+            value = normalize_value(value)
+            return isinstance(value, list) and query.is_similar(value)
+
+        return test
+
+
+class AllOf(Predicate):
+    """All of ``predicates`` match, the cheapest ones are checked first."""
+
+    __slots__ = ["predicates"]
+
+    def __init__(self, *predicates):
+        self.predicates = list(flatten(predicates, AllOf))
+
+    @property
+    def cost(self) -> int:
+        return sum(predicate.cost for predicate in self.predicates)
+
+    def compile(self) -> Callable[[dict], bool]:
+        matches = [
+            predicate.compile()
+            for predicate in sorted(self.predicates, key=lambda p: p.cost)
+        ]
+        if len(matches) == 1:
+            return matches[0]
+
+        def match(dictionary):
+            for predicate_match in matches:
+                if not predicate_match(dictionary):
+                    return False
+            return True
+
+        return match
+
+    def __repr__(self):
+        return f"AllOf{tuple(self.predicates)!r}"
+
+
+class AnyOf(Predicate):
+    """Any of ``predicates`` matches, the cheapest ones are checked first."""
+
+    __slots__ = ["predicates"]
+
+    def __init__(self, *predicates):
+        self.predicates = list(flatten(predicates, AnyOf))
+
+    @property
+    def cost(self) -> int:
+        return sum(predicate.cost for predicate in self.predicates)
+
+    def compile(self) -> Callable[[dict], bool]:
+        matches = [
+            predicate.compile()
+            for predicate in sorted(self.predicates, key=lambda p: p.cost)
+        ]
+        if len(matches) == 1:
+            return matches[0]
+
+        def match(dictionary):
+            for predicate_match in matches:
+                if predicate_match(dictionary):
+                    return True
+            return False
+
+        return match
+
+    def __repr__(self):
+        return f"AnyOf{tuple(self.predicates)!r}"
+
+
+def flatten(predicates, kind) -> Iterator[Predicate]:
+    """Yield ``predicates``, taking the ones of the nested ``kind`` out."""
+
+    for predicate in predicates:
+        if isinstance(predicate, kind):
+            yield from predicate.predicates
+        elif isinstance(predicate, Predicate):
+            yield predicate
+        else:
+            raise TypeError(f"{predicate!r} is not a predicate")
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""The module with ``Schema`` class, the sidecar file which keeps \
+the keys of the JSON file with their descriptions, written by ``set_up()``.
+
+The sidecar ``<full_path>.schema`` is a JSON object with the stamp \
+of the JSON file (as ``TokenCache`` keeps it) and the list \
+of ``[key, desc, kind]``: every description met under every key, \
+``kind`` is ``"list"`` for the lists and ``"value"`` otherwise. \
+The keys of the longest object go first, in its order.
+
+With the schema a description is resolved to its key at once, \
+so the searches by ``desc`` read only ``record[key][desc]``, \
+and ``AddObject`` asks for the values without reading the file. \
+The writers of ``storage`` keep the existing schema up to date, \
+and a schema with another stamp is not used.
+"""
+
+import os
+from typing import Iterator, List
+
+import JSONManipulator.core.codec as codec
+from JSONManipulator.core.locking import atomic_write
+from JSONManipulator.core.token_cache import file_stamp
+
+VERSION = 1
+
+
+def record_pairs(dictionary) -> Iterator[list]:
+    """Yield ``[key, desc, kind]`` of the described values of the object."""
+
+    for key, value in dictionary.items():
+        if isinstance(value, dict):
+            for desc, end_value in value.items():
+                yield [
+                    key, desc, "list" if isinstance(end_value, list) else "value"
+                ]
+
+
+class Schema:
+    """The sidecar with the keys and the descriptions of the JSON file.
+
+    The caller holds ``FileLock`` of the JSON file, the exclusive one \
+    for the methods called by the writers.
+
+    Args:
+        ``full_path (str)``: the full path to the JSON file.
+    """
+
+    __slots__ = ["full_path", "schema_path", "collected"]
+
+    def __init__(self, full_path):
+        self.full_path = full_path
+        self.schema_path = full_path + ".schema"
+        self.collected = None
+
+    @property
+    def enabled(self) -> bool:
+        """Check if the schema of the JSON file exists."""
+
+        return os.path.isfile(self.schema_path)
+
+    def load(self) -> List[list] or None:
+        """Read ``[key, desc, kind]`` of the schema.
+
+        Returns:
+            ``None``: if the schema is missing or out of date.
+        """
+
+        try:
+            with open(self.schema_path, 'rb') as file:
+                schema = codec.loads(file.read())
+            if schema.get("version") != VERSION \
+                    or schema.get("stamp") != file_stamp(self.full_path):
+                return None
+            return [list(pair) for pair in schema["keys"]]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def save(self, pairs) -> None:
+        """Write the schema with the stamp of the JSON file."""
+
+        with atomic_write(self.schema_path) as file:
+            file.write(codec.dumps({
+                "version": VERSION, "stamp": file_stamp(self.full_path),
+                "keys": pairs,
+            }))
+
+    def build(self, file_contents) -> None:
+        """Write the schema of the objects of the JSON file."""
+
+        for _ in self.rewrite(file_contents):
+            pass
+        self.rewritten()
+
+    @staticmethod
+    def merge(pairs, new_pairs) -> List[list]:
+        """Append the ``[key, desc, kind]`` of ``new_pairs`` \
+        which are not in ``pairs`` yet.
+        """
+
+        pairs = list(pairs or [])
+        known = {(key, desc) for key, desc, _ in pairs}
+        for key, desc, kind in new_pairs:
+            if (key, desc) not in known:
+                known.add((key, desc))
+                pairs.append([key, desc, kind])
+        return pairs
+
+    def keys_of(self, desc, pairs=None) -> List[str]:
+        """Return the keys described by ``desc``.
+
+        Returns:
+            ``None``: if the schema is missing or out of date.
+        """
+
+        pairs = self.load() if pairs is None else pairs
+        if pairs is None:
+            return None
+        return [key for key, pair_desc, _ in pairs if pair_desc == desc]
+
+    def rewrite(self, file_contents) -> Iterator:
+        """Yield the objects of ``file_contents`` to the writer \
+        of the whole file, collecting their keys for ``rewritten()``.
+        """
+
+        pairs = []
+        known = set()
+        longest = None
+        for dictionary in file_contents:
+            new_pairs = list(record_pairs(dictionary))
+            if longest is None or len(dictionary) > len(longest[0]):
+                longest = (dictionary, new_pairs)
+            for key, desc, kind in new_pairs:
+                if (key, desc) not in known:
+                    known.add((key, desc))
+                    pairs.append([key, desc, kind])
+            yield dictionary
+        self.collected = self.merge(longest[1], pairs) if longest else []
+
+    def rewritten(self, count=None) -> None:
+        """Save the schema collected by ``rewrite()``."""
+
+        self.save(self.collected or [])
+        self.collected = None
+
+    def update(self, loaded, deletions=(), changes=None, appends=()) -> None:
+        """Add the keys of the changed and the appended objects \
+        to ``loaded`` from ``load()`` before the JSON file was written, \
+        and save the schema with the stamp of the written file.
+        """
+
+        changed = list((changes or dict()).values()) + list(appends)
+        self.save(self.merge(loaded, (
+            pair for dictionary in changed for pair in record_pairs(dictionary)
+        )))
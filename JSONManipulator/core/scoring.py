@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""The module with the scorers which decide if two sequences are similar \
+enough for ``GetInformation.levenshtein_calc()``.
+
+A scorer gets the threshold together with the sequences, so it can stop \
+as soon as the threshold becomes unreachable.
+"""
+
+from abc import ABC, abstractmethod
+from difflib import SequenceMatcher
+
+
+class Scorer(ABC):
+    """The base class of the scorers."""
+
+    __slots__ = []
+
+    def ratio_at_least(self, first, second, threshold) -> bool:
+        """Check if the similarity of ``first`` and ``second`` \
+        is not lower than ``threshold``.
+        """
+
+        return self.ratio_if_at_least(first, second, threshold) is not None
+
+    @abstractmethod
+    def ratio_if_at_least(self, first, second, threshold) -> float or None:
+        """Return the similarity of ``first`` and ``second`` \
+        if it is not lower than ``threshold``, otherwise ``None``.
+        """
+
+    @staticmethod
+    def length_bound(first, second) -> float:
+        """The upper bound of any similarity ratio by the lengths only."""
+
+        length = len(first) + len(second)
+        return 2.0 * min(len(first), len(second)) / length if length else 1.0
+
+
+class DifflibScorer(Scorer):
+    """The compatible scorer, which takes exactly the same decisions \
+    as ``SequenceMatcher(None, first, second).ratio() >= threshold``.
+
+    Before the full ratio it checks the cheaper upper bounds of it \
+    by the lengths (``real_quick_ratio()``) and by the multisets \
+    of the elements (``quick_ratio()``), and stops if either of them \
+    is lower than ``threshold``.
+    """
+
+    __slots__ = []
+
+    def ratio_at_least(self, first, second, threshold) -> bool:
+        if self.length_bound(first, second) < threshold:
+            return False
+        matcher = SequenceMatcher(None, first, second)
+        if matcher.quick_ratio() < threshold:
+            return False
+        return matcher.ratio() >= threshold
+
+    def ratio_if_at_least(self, first, second, threshold) -> float or None:
+        if self.length_bound(first, second) < threshold:
+            return None
+        matcher = SequenceMatcher(None, first, second)
+        if matcher.quick_ratio() < threshold:
+            return None
+        ratio = matcher.ratio()
+        return ratio if ratio >= threshold else None
+
+
+class IndelScorer(Scorer):
+    """The fast scorer, which measures the similarity by the longest \
+    common subsequence: ``2 * LCS / (len(first) + len(second))``.
+
+    The subsequence is computed with the bit-parallel algorithm, one \
+    integer operation per element of ``second``, and the computation stops \
+    as soon as the rest of ``second`` can not reach ``threshold``.
+
+    The ratio is never lower than the one of ``SequenceMatcher``, \
+    so this scorer may find more objects than ``DifflibScorer``.
+    """
+
+    __slots__ = []
+
+    def ratio_if_at_least(self, first, second, threshold) -> float or None:
+        length = len(first) + len(second)
+        if not length:
+            return 1.0 if threshold <= 1.0 else None
+        if self.length_bound(first, second) < threshold:
+            return None
+
+        needed = threshold * length / 2
+        match_masks = dict()
+        for position, element in enumerate(first):
+            match_masks[element] = match_masks.get(element, 0) | (1 << position)
+
+        full_mask = (1 << len(first)) - 1
+        vector = full_mask
+        for position, element in enumerate(second):
+            matches = vector & match_masks.get(element, 0)
+            vector = ((vector + matches) | (vector - matches)) & full_mask
+            common = len(first) - bin(vector).count("1")
+            if common + len(second) - position - 1 < needed:
+                return None
+        ratio = 2.0 * (len(first) - bin(vector).count("1")) / length
+        return ratio if ratio >= threshold else None
+
+
+difflib_scorer = DifflibScorer()
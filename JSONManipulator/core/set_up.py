@@ -1,16 +1,35 @@
 # -*- coding: utf-8 -*-
 """The module with ``set_up`` function"""
 
-import json
+from typing import Dict, Iterator, List
+
+import JSONManipulator.core.codec as codec
 import JSONManipulator.exceptions as exceptions
+from JSONManipulator.core.locking import FileLock
+from JSONManipulator.core.schema import Schema
+from JSONManipulator.core.storage import iter_records, dump_document, \
+    detect_format
 
 
-def set_up(full_path) -> None:
+def set_up(full_path, file_format=None, descriptions=None,
+           target_path=None) -> None:
     """Configure the initial JSON file. Add descriptions for the keys in \
-    the JSON file for the further more readable retrieval.
+    the JSON file for the further more readable retrieval, \
+    and write them to ``Schema`` of the file.
+
+    The objects are read and written one by one, so only one object \
+    is kept in memory. Without ``descriptions`` the keys of all the objects \
+    are collected first, and a description is asked for each of them.
 
     Args:
-        ``full_path (str)``: the path to the desired file.
+        ``full_path (str)``: the path to the desired file.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.\n
+        ``descriptions (dict or str)``: the descriptions by the keys, \
+        or the path to the JSON file with them, instead of asking for them. \
+        The keys without a description are left as they are.\n
+        ``target_path (str)``: the path to write the set up file to, \
+        by default the file is set up in place.
 
     Raises:
         ``FileNotFoundError``: \
@@ -24,31 +43,76 @@ def set_up(full_path) -> None:
 
     """
 
-    with open(full_path, 'r') as file:
-        file_contents = json.load(file)
-
-    if all(isinstance(dictionary, dict) for dictionary in file_contents):
-        keys_list = [
-            list(dictionary.keys())
-            for dictionary in file_contents
-        ]
-        longest_key_list = max(keys_list, key=len)
+    if descriptions is None:
+        keys = collect_keys(iter_records(full_path, file_format))
         print("\nAssign a short description to the keys "
               "(press <Enter> if you don\'t need this key):")
-        keys_and_description = dict()
-
-        for item in longest_key_list:
+        descriptions = dict()
+        for item in keys:
             desc = input(f"<{item}>: ")
             if desc:
-                keys_and_description[item] = desc
+                descriptions[item] = desc
 
-        for dictionary in file_contents:
-            for key, desc_to_key in keys_and_description.items():
-                if key in dictionary:
-                    dictionary[key] = {desc_to_key: dictionary[key]}
+    elif isinstance(descriptions, str):
+        with open(descriptions, 'rb') as file:
+            descriptions = codec.loads(file.read())
+        if not isinstance(descriptions, dict):
+            raise exceptions.NotSupportedJSONFile
 
-        with open(full_path, 'w') as file:
-            json.dump(file_contents, file)
-        print("\nSuccess!")
+    descriptions = {key: desc for key, desc in descriptions.items() if desc}
+    if target_path is None:
+        target_path, target_format = full_path, \
+            detect_format(full_path, file_format)
     else:
-        raise exceptions.NotSupportedJSONFile
+        target_format = None
+
+    schema = Schema(target_path)
+    with FileLock(target_path, exclusive=True):
+        dump_document(
+            target_path,
+            schema.rewrite(describe_records(
+                iter_records(full_path, file_format), descriptions
+            )),
+            target_format
+        )
+        schema.rewritten()
+    print("\nSuccess!")
+
+
+def collect_keys(records) -> List[str]:
+    """Collect the keys of all the objects in one pass: the keys \
+    of the longest object in its order, then the other ones as they appear.
+
+    Raises:
+        ``exception.NotSupportedJSONFile``: \
+        if an object is not a dictionary.
+    """
+
+    keys = dict()
+    longest = []
+    for dictionary in records:
+        if not isinstance(dictionary, dict):
+            raise exceptions.NotSupportedJSONFile
+        if len(dictionary) > len(longest):
+            longest = list(dictionary)
+        keys.update(dict.fromkeys(dictionary))
+    longest_keys = set(longest)
+    return longest + [key for key in keys if key not in longest_keys]
+
+
+def describe_records(records, descriptions) -> Iterator[Dict]:
+    """Yield the objects with the values of the described keys \
+    wrapped as ``{desc: value}``.
+
+    Raises:
+        ``exception.NotSupportedJSONFile``: \
+        if an object is not a dictionary.
+    """
+
+    for dictionary in records:
+        if not isinstance(dictionary, dict):
+            raise exceptions.NotSupportedJSONFile
+        for key, desc_to_key in descriptions.items():
+            if key in dictionary:
+                dictionary[key] = {desc_to_key: dictionary[key]}
+        yield dictionary
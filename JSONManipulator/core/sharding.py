@@ -0,0 +1,468 @@
+# -*- coding: utf-8 -*-
+"""The module with ``ShardedDataset`` class, the objects of one catalogue \
+split into several JSON Lines files, the shards, by the hash of the value \
+of a chosen key.
+
+The directory of the dataset keeps the shards and ``manifest.json`` \
+with the key, the number of the objects and the SHA-256 of every shard. \
+The value of the key, a string, a number or ``null``, is normalized \
+like ``Exact`` does, so an exact lookup, a change or a deletion \
+by the key reads and rewrites one shard only. The scans go shard by shard, \
+or over the shards in several processes.
+
+The lookups and the changes hold the shared lock of the manifest \
+and ``reshard()`` holds the exclusive one, so the shards are not replaced \
+under the changes. The manifest itself is rewritten under the lock \
+of ``manifest.json.update``.
+
+``shard()`` and ``unshard()`` convert a JSON file to a dataset and back, \
+and ``reshard()`` splits the dataset anew. The shards of every split \
+have new names, and the manifest is replaced after they are written, \
+so the readers of the manifest always see the complete split.
+"""
+
+import copy
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from itertools import chain
+from typing import Dict, Iterator, List, Tuple
+
+import JSONManipulator.core.codec as codec
+from JSONManipulator.core.Filter import Filter
+from JSONManipulator.core.locking import FileLock, atomic_write
+from JSONManipulator.core.predicates import Exact, normalize_text, unwrap
+from JSONManipulator.core.Session import Session
+from JSONManipulator.core.storage import JSON_LINES, load_document, \
+    iter_records, dump_document, append_document, mutate_document
+
+VERSION = 1
+MANIFEST = "manifest.json"
+
+
+def shard_number(value, shards) -> int:
+    """Return the number of the shard of the objects \
+    with ``value`` of the key, the same in every process.
+
+    Raises:
+        ``ValueError``: if ``value`` is not a string, a number or ``None``, \
+        e.g. a list, whose elements could not be looked up in one shard.
+    """
+
+    value = unwrap(value)
+    text = normalize_text(value)
+    if text is None:
+        if value is not None:
+            raise ValueError(
+                f"The values of the key of a dataset must be strings, "
+                f"numbers or null, not {value!r}."
+            )
+        #  Independent of the codec of the package.
+        text = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+def file_checksum(full_path) -> str:
+    """Return the SHA-256 of the file."""
+
+    checksum = hashlib.sha256()
+    with open(full_path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            checksum.update(block)
+    return checksum.hexdigest()
+
+
+def find_in_shard(finder, full_path) -> List[Tuple[int, Dict]]:
+    """Find the objects of one shard with ``finder``, in a worker.
+
+    Returns:
+        ``List[Tuple[int, Dict]]``: the positions of the found objects \
+        in the shard with the objects, each object once.
+    """
+
+    found = finder.find(load_document(full_path, file_format=JSON_LINES))
+    return list(dict(zip(finder.output_positions, found)).items())
+
+
+def shard(source_path, directory, key, shards=16,
+          source_format=None) -> "ShardedDataset":
+    """Split the objects of the JSON file into ``shards`` files \
+    in ``directory`` by the hash of the value of ``key``, \
+    reading and writing the objects one by one.
+
+    Args:
+        ``source_path (str)``: the full path to the JSON file.\n
+        ``directory (str)``: the directory of the dataset, created if needed.\n
+        ``key (str)``: the key which values choose the shards.\n
+        ``shards (int)``: the number of the shards.\n
+        ``source_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.
+
+    Returns:
+        ``ShardedDataset``: the written dataset.
+
+    Raises:
+        ``ValueError``: if ``directory`` already has a dataset \
+        or ``shards`` is less than 1.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+    dataset = ShardedDataset(directory, load=False)
+    with FileLock(dataset.manifest_path, exclusive=True):
+        #  Checked under the lock, so two processes do not both write it.
+        if os.path.isfile(dataset.manifest_path):
+            raise ValueError(
+                f"{directory} already has a dataset, use reshard()."
+            )
+        dataset.write(iter_records(source_path, source_format), key, shards)
+    return dataset
+
+
+def unshard(directory, target_path, file_format=JSON_LINES) -> None:
+    """Write all the objects of the dataset to one JSON file, \
+    shard after shard.
+
+    Args:
+        ``directory (str)``: the directory of the dataset.\n
+        ``target_path (str)``: the full path to the JSON file.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``.
+    """
+
+    dataset = ShardedDataset(directory)
+    with dataset.locked():
+        dump_document(target_path, dataset.records(), file_format)
+
+
+def reshard(directory, shards, key=None) -> "ShardedDataset":
+    """Split the objects of the dataset anew into ``shards`` files, \
+    optionally by another ``key``.
+
+    Returns:
+        ``ShardedDataset``: the dataset with the new split.
+    """
+
+    dataset = ShardedDataset(directory)
+    with FileLock(dataset.manifest_path, exclusive=True):
+        dataset.load()
+        old_paths = dataset.paths()
+        dataset.write(dataset.records(), key or dataset.key, shards)
+    for full_path in old_paths:
+        for path in [full_path] + [
+                full_path + suffix
+                for suffix in (".lock", ".log", ".tokens", ".schema")]:
+            if os.path.exists(path):
+                os.remove(path)
+    return dataset
+
+
+class ShardedDataset:
+    """The dataset of the objects split into the shards by ``key``.
+
+    The shards are usual JSON Lines files, so every class of the package \
+    works with ``shard_path()`` of a shard, and ``refresh()`` brings \
+    the manifest up to date after the shard is changed outside the dataset.
+
+    Args:
+        ``directory (str)``: the directory of the dataset.\n
+        ``load (bool)``: read the manifest at once.
+
+    Raises:
+        ``FileNotFoundError``: if the directory has no dataset.
+    """
+
+    __slots__ = ["directory", "manifest_path", "key", "generation", "files"]
+
+    def __init__(self, directory, load=True):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST)
+        self.key = None
+        self.generation = 0
+        self.files = []
+        if load:
+            self.load()
+
+    def __len__(self):
+        return sum(entry["count"] for entry in self.files)
+
+    def __repr__(self):
+        return f"ShardedDataset({self.directory!r}, key={self.key!r}, " \
+               f"{len(self.files)} shards)"
+
+    @contextmanager
+    def locked(self, exclusive=False):
+        """Hold the lock of the manifest and read it anew."""
+
+        with FileLock(self.manifest_path, exclusive=exclusive):
+            self.load()
+            yield self
+
+    @property
+    def shards(self) -> int:
+        """The number of the shards."""
+
+        return len(self.files)
+
+    def load(self) -> None:
+        """Read the manifest of the dataset."""
+
+        with open(self.manifest_path, 'rb') as file:
+            manifest = codec.loads(file.read())
+        if manifest.get("version") != VERSION:
+            raise ValueError(f"Unknown version of {self.manifest_path}.")
+        self.key = manifest["key"]
+        self.generation = manifest["generation"]
+        self.files = manifest["shards"]
+
+    def save(self) -> None:
+        """Replace the manifest of the dataset."""
+
+        with atomic_write(self.manifest_path) as file:
+            file.write(codec.dumps({
+                "version": VERSION, "key": self.key,
+                "generation": self.generation, "shards": self.files,
+            }))
+
+    def shard_path(self, number) -> str:
+        """Return the full path to the shard ``number``."""
+
+        return os.path.join(self.directory, self.files[number]["name"])
+
+    def paths(self) -> List[str]:
+        """Return the full paths to all the shards in their order."""
+
+        return [self.shard_path(number) for number in range(self.shards)]
+
+    def shard_of(self, value) -> int:
+        """Return the number of the shard of the objects with ``value``."""
+
+        return shard_number(value, self.shards)
+
+    def write(self, records, key, shards) -> None:
+        """Write ``records`` to the new shards and replace the manifest, \
+        the caller holds the exclusive lock of the manifest.
+        """
+
+        if shards < 1:
+            raise ValueError("A dataset needs at least one shard.")
+        generation = self.generation + 1
+        names = [
+            f"shard-{generation}-{number:05d}.jsonl"
+            for number in range(shards)
+        ]
+        counts = [0] * shards
+        with ExitStack() as stack:
+            files = [
+                stack.enter_context(
+                    atomic_write(os.path.join(self.directory, name))
+                )
+                for name in names
+            ]
+            for dictionary in records:
+                number = shard_number(dictionary.get(key), shards)
+                files[number].write(codec.dumps(dictionary) + "\n")
+                counts[number] += 1
+
+        self.key = key
+        self.generation = generation
+        self.files = [
+            {"name": name, "count": count,
+             "sha256": file_checksum(os.path.join(self.directory, name))}
+            for name, count in zip(names, counts)
+        ]
+        self.save()
+
+    def refresh(self, numbers=None) -> None:
+        """Recount the objects and the checksums of the shards \
+        ``numbers`` (by default, of all of them) in the manifest.
+        """
+
+        with self.locked(), \
+                FileLock(self.manifest_path + ".update", exclusive=True):
+            self.load()
+            for number in range(self.shards) if numbers is None else numbers:
+                full_path = self.shard_path(number)
+                with FileLock(full_path):
+                    self.files[number]["count"] = sum(
+                        1 for _ in iter_records(full_path, JSON_LINES)
+                    )
+                    self.files[number]["sha256"] = file_checksum(full_path)
+            self.save()
+
+    def verify(self) -> List[int]:
+        """Compare the shards with the checksums of the manifest.
+
+        Returns:
+            ``List[int]``: the numbers of the shards which differ.
+        """
+
+        def differs(number, entry) -> bool:
+            full_path = self.shard_path(number)
+            if not os.path.isfile(full_path):
+                return True
+            return file_checksum(full_path) != entry["sha256"]
+
+        with self.locked():
+            return [
+                number for number, entry in enumerate(self.files)
+                if differs(number, entry)
+            ]
+
+    def records(self) -> Iterator[Dict]:
+        """Yield all the objects shard after shard."""
+
+        return chain.from_iterable(
+            iter_records(full_path, JSON_LINES) for full_path in self.paths()
+        )
+
+    def lookup(self, value) -> List[Dict]:
+        """Find the objects with ``value`` of the key, reading one shard."""
+
+        with self.locked():
+            return Filter(Exact(value, key=self.key)).find(load_document(
+                self.shard_path(self.shard_of(value)), cached=True,
+                file_format=JSON_LINES
+            ))
+
+    def find(self, finder, workers=None) -> List[Tuple[int, int, Dict]]:
+        """Find the objects of all the shards with ``finder``.
+
+        Args:
+            ``finder``: ``Query``, ``Filter`` or any object \
+            with ``find(file_contents)`` and ``output_positions``.\n
+            ``workers (int)``: search the shards in this number \
+            of the processes, by default one by one in this process.
+
+        Returns:
+            ``List[Tuple[int, int, Dict]]``: the numbers of the shards, \
+            the positions in the shards and the found objects, \
+            in the order of the shards.
+        """
+
+        with self.locked():
+            paths = self.paths()
+            if workers and workers > 1 and len(paths) > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(
+                        find_in_shard, [finder] * len(paths), paths
+                    ))
+            else:
+                results = [
+                    find_in_shard(finder, full_path) for full_path in paths
+                ]
+
+        return [
+            (number, position, dictionary)
+            for number, found in enumerate(results)
+            for position, dictionary in found
+        ]
+
+    def append(self, new_objects) -> None:
+        """Add ``new_objects`` to the ends of their shards.
+
+        Raises:
+            ``ValueError``: if the value of the key of an object \
+            is not a string, a number or ``None``.
+        """
+
+        with self.locked():
+            self.append_objects(new_objects)
+
+    def append_objects(self, new_objects) -> List[int]:
+        """Append ``new_objects`` to their shards and refresh them, \
+        the caller holds the lock of the manifest.
+
+        Returns:
+            ``List[int]``: the numbers of the changed shards.
+        """
+
+        by_shard = dict()
+        for dictionary in new_objects:
+            by_shard.setdefault(
+                self.shard_of(dictionary.get(self.key)), []
+            ).append(dictionary)
+        for number, dictionaries in by_shard.items():
+            append_document(self.shard_path(number), dictionaries, JSON_LINES)
+        self.refresh(by_shard)
+        return list(by_shard)
+
+    def change(self, value, changes) -> int:
+        """Change the objects with ``value`` of the key \
+        like ``Session.change_all_values()`` does, rewriting one shard. \
+        The objects with the changed value of the key are moved \
+        to their new shards.
+
+        Returns:
+            ``int``: the number of the changed objects.
+
+        Raises:
+            ``ValueError``: if the new value of the key \
+            is not a string, a number or ``None``.
+        """
+
+        #  The moves write to the other shards, so they run one at a time
+        #  under the exclusive lock. The key is read under the lock,
+        #  as another process may reshard the dataset by another key.
+        with self.locked():
+            if self.key not in changes:
+                return self.change_shard(value, changes)
+        with self.locked(exclusive=True):
+            return self.change_shard(value, changes)
+
+    def change_shard(self, value, changes) -> int:
+        """Change the objects with ``value`` of the key in their shard \
+        and move them if needed, the caller holds the lock of the manifest.
+
+        Returns:
+            ``int``: the number of the changed objects.
+        """
+
+        number = self.shard_of(value)
+        full_path = self.shard_path(number)
+        with FileLock(full_path, exclusive=True):
+            file_contents = load_document(full_path, file_format=JSON_LINES)
+            finder = Filter(Exact(value, key=self.key))
+            finder.find(file_contents)
+            new_objects = dict()
+            moved = dict()
+            for position, dictionary in zip(finder.output_positions,
+                                            finder.output_dict_container):
+                dictionary = copy.deepcopy(dictionary)
+                Session.apply_changes(dictionary, changes)
+                if self.shard_of(dictionary.get(self.key)) == number:
+                    new_objects[position] = dictionary
+                else:
+                    moved[position] = dictionary
+
+            #  Appended before deleted, so a failure can not lose them.
+            if moved:
+                self.append_objects(moved.values())
+            if new_objects or moved:
+                mutate_document(full_path, deletions=moved,
+                                changes=new_objects, file_format=JSON_LINES)
+        if new_objects or moved:
+            self.refresh([number])
+        return len(new_objects) + len(moved)
+
+    def delete(self, value) -> int:
+        """Delete the objects with ``value`` of the key, rewriting one shard.
+
+        Returns:
+            ``int``: the number of the deleted objects.
+        """
+
+        with self.locked():
+            number = self.shard_of(value)
+            full_path = self.shard_path(number)
+            with FileLock(full_path, exclusive=True):
+                positions = Filter(Exact(value, key=self.key)).find_positions(
+                    load_document(full_path, file_format=JSON_LINES)
+                )
+                if positions:
+                    mutate_document(full_path, deletions=positions,
+                                    file_format=JSON_LINES)
+            if positions:
+                self.refresh([number])
+        return len(positions)
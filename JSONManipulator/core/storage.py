@@ -0,0 +1,535 @@
+# -*- coding: utf-8 -*-
+"""The module with the functions to read and write the JSON files.
+
+Two formats of the files are supported: ``JSON_ARRAY`` \
+(``[{...}, {...}, ...]``, the default one) and ``JSON_LINES`` \
+(one object per line). The format is detected from the file \
+or can be passed explicitly as ``file_format``.
+
+The readers hold the shared ``FileLock`` of the file and the writers \
+hold the exclusive one, and the file is rewritten by ``atomic_write()``, \
+so the readers never see it half-written.
+
+If ``MutationLog`` of the file is enabled, the changes are appended \
+to the log instead of rewriting the file, the readers apply the log \
+on top of the file, and the log is folded into the file by \
+``compact_document()`` once it grows past its thresholds.
+
+If the sidecars of the file (``TokenCache``, ``Schema``) exist, \
+the writers update them together with the file.
+"""
+
+import json
+import os
+import threading
+from typing import Iterator
+
+import JSONManipulator.core.codec as codec
+import JSONManipulator.core.instrumentation as instrumentation
+import JSONManipulator.exceptions as exceptions
+from JSONManipulator.core.cache import document_cache
+from JSONManipulator.core.columnar import ColumnStore
+from JSONManipulator.core.locking import FileLock, LockedIterator, \
+    atomic_write
+from JSONManipulator.core.mutation_log import MutationLog
+from JSONManipulator.core.streaming import iter_objects
+from JSONManipulator.core.schema import Schema
+from JSONManipulator.core.token_cache import TokenCache
+
+JSON_ARRAY = "json"
+JSON_LINES = "jsonl"
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson")
+
+
+def detect_format(full_path, file_format=None) -> str:
+    """Detect the format of the JSON file.
+
+    A file is ``JSON_LINES`` if it has the ``.jsonl``/``.ndjson`` extension, \
+    or if its first line is a complete object. Otherwise, \
+    as well as for an empty or a missing file, it is ``JSON_ARRAY``.
+
+    Args:
+        ``full_path (str)``: the full path to the JSON file.\n
+        ``file_format (str)``: the format to return as is, if passed.
+    """
+
+    if file_format:
+        return file_format
+    if full_path.lower().endswith(JSON_LINES_EXTENSIONS):
+        return JSON_LINES
+    if not os.path.isfile(full_path):
+        return JSON_ARRAY
+
+    with open(full_path, 'r', encoding="utf-8") as file:
+        first_character = file.read(1)
+        while first_character.isspace():
+            first_character = file.read(1)
+        if first_character != "{":
+            return JSON_ARRAY
+        first_line = first_character + file.readline()
+    try:
+        if isinstance(codec.loads(first_line), dict):
+            return JSON_LINES
+    except ValueError:
+        pass
+    return JSON_ARRAY
+
+
+def iter_records(full_path, file_format=None) -> Iterator:
+    """Yield the objects of the JSON file one by one, \
+    keeping only the current object in memory. The shared lock \
+    of the file is held until all the objects are read or the iterator \
+    is closed.
+
+    Raises:
+        ``FileNotFoundError``: \
+        if the JSON file is not found by ``full_path``.\n
+        ``IsADirectoryError``: \
+        if ``full_path`` is to a directory, not to the JSON file.
+    """
+
+    file_lock = FileLock(full_path)
+    file_lock.acquire()
+    try:
+        mutation_log = MutationLog(full_path)
+        if mutation_log.enabled:
+            with mutation_log.lock:
+                records = mutation_log.apply(iter_base(full_path, file_format))
+        else:
+            records = iter_base(full_path, file_format)
+    except BaseException:
+        file_lock.release()
+        raise
+    return LockedIterator(records, file_lock)
+
+
+def iter_base(full_path, file_format=None) -> Iterator:
+    """Yield the objects of the JSON file one by one without its log."""
+
+    if detect_format(full_path, file_format) == JSON_ARRAY:
+        records = iter_objects(full_path)
+    else:
+        records = iter_lines(open(full_path, 'r', encoding="utf-8"))
+    instrumentation.count("bytes_read", os.path.getsize(full_path))
+    return records
+
+
+def iter_lines(file) -> Iterator:
+    """Yield the objects of the JSON Lines ``file`` and close it at the end."""
+
+    with file:
+        for line in file:
+            if line.strip():
+                yield codec.loads(line)
+
+
+def load_document(full_path, cached=False, file_format=None,
+                  columnar=False) -> list or ColumnStore:
+    """Load the objects from the JSON file.
+
+    Args:
+        ``full_path (str)``: the full path to the JSON file.\n
+        ``cached (bool)``: take the objects from ``document_cache`` \
+        if the file has not changed since it was parsed. \
+        The cached objects must not be changed in place.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.\n
+        ``columnar (bool)``: load the objects one by one \
+        into ``ColumnStore`` instead of the list of the dictionaries.
+
+    Raises:
+        ``FileNotFoundError``: \
+        if the JSON file is not found by ``full_path``.\n
+        ``IsADirectoryError``: \
+        if ``full_path`` is to a directory, not to the JSON file.
+    """
+
+    with instrumentation.span("load"):
+        if cached:
+            return load_cached(full_path, file_format, columnar)
+        if columnar:
+            return ColumnStore(iter_records(full_path, file_format))
+        return read_document(full_path, file_format)
+
+
+def load_cached(full_path, file_format=None,
+                columnar=False) -> list or ColumnStore:
+    """Take the objects from ``document_cache`` or parse the JSON file."""
+
+    with FileLock(full_path):
+        cache_key = document_cache.cache_key(full_path)
+        mutation_log = MutationLog(full_path)
+        if mutation_log.enabled:
+            log_stat = os.stat(mutation_log.log_path)
+            cache_key += (log_stat.st_mtime_ns, log_stat.st_size)
+        if columnar:
+            cache_key += ("columnar",)
+        file_contents = document_cache.get(cache_key)
+        if file_contents is None:
+            file_contents = ColumnStore(iter_records(full_path, file_format)) \
+                if columnar else read_document(full_path, file_format)
+            document_cache.put(cache_key, file_contents)
+    return file_contents
+
+
+def read_document(full_path, file_format=None) -> list:
+    """Parse the whole JSON file and apply its log."""
+
+    with FileLock(full_path):
+        mutation_log = MutationLog(full_path)
+        if mutation_log.enabled:
+            with mutation_log.lock:
+                return list(
+                    mutation_log.apply(read_base(full_path, file_format))
+                )
+        return read_base(full_path, file_format)
+
+
+def read_base(full_path, file_format=None) -> list:
+    """Parse the whole JSON file without its log."""
+
+    if detect_format(full_path, file_format) == JSON_ARRAY:
+        with open(full_path, 'rb') as file:
+            instrumentation.count(
+                "bytes_read", os.fstat(file.fileno()).st_size
+            )
+            return codec.loads(file.read())
+    return list(iter_base(full_path, JSON_LINES))
+
+
+def dump_document(full_path, file_contents, file_format=None) -> None:
+    """Write ``file_contents`` to the JSON file and invalidate its cache. \
+    The log of the file, if enabled, starts anew.
+
+    Args:
+        ``full_path (str)``: the full path to the JSON file.\n
+        ``file_contents (Iterable)``: the objects to write, \
+        written one by one, so it can be a generator.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.
+    """
+
+    file_format = detect_format(full_path, file_format)
+    mutation_log = MutationLog(full_path)
+    with instrumentation.span("dump"), \
+            FileLock(full_path, exclusive=True), mutation_log.lock:
+        sidecars = [
+            sidecar for sidecar in (TokenCache(full_path), Schema(full_path))
+            if sidecar.enabled
+        ]
+        for sidecar in sidecars:
+            file_contents = sidecar.rewrite(file_contents)
+        with atomic_write(full_path) as file:
+            count = write_records(file, file_contents, file_format)
+        if mutation_log.enabled:
+            mutation_log.reset(count)
+        for sidecar in sidecars:
+            sidecar.rewritten(count)
+    document_cache.invalidate(full_path)
+
+
+def write_records(file, file_contents, file_format) -> int:
+    """Write the objects to the opened ``file`` in ``file_format``.
+
+    Returns:
+        ``int``: the number of the written objects.
+    """
+
+    count = 0
+    written = 0
+    if file_format == JSON_LINES:
+        for dictionary in file_contents:
+            written += file.write(codec.dumps(dictionary))
+            written += file.write("\n")
+            count += 1
+        instrumentation.count("bytes_written", written)
+        return count
+
+    current_codec = codec.get_codec()
+    written += file.write("[")
+    for dictionary in file_contents:
+        if count:
+            written += file.write(current_codec.separator)
+        written += file.write(current_codec.dumps(dictionary))
+        count += 1
+    written += file.write("]")
+    instrumentation.count("bytes_written", written)
+    return count
+
+
+def append_document(full_path, new_objects, file_format=None) -> None:
+    """Append ``new_objects`` to the end of the JSON file \
+    without rewriting the objects which are already there.
+    """
+
+    if MutationLog(full_path).enabled:
+        mutate_document(full_path, appends=new_objects)
+        return
+
+    with instrumentation.span("dump"), FileLock(full_path, exclusive=True):
+        sidecars = load_sidecars(full_path)
+        if sidecars:
+            new_objects = list(new_objects)
+        append_base(full_path, new_objects, file_format)
+        update_sidecars(sidecars, appends=new_objects)
+    document_cache.invalidate(full_path)
+
+
+def load_sidecars(full_path) -> list:
+    """Read the up-to-date sidecars of the JSON file before writing it.
+
+    Returns:
+        ``list``: the sidecars with the results of their ``load()``.
+    """
+
+    sidecars = []
+    for sidecar in (TokenCache(full_path), Schema(full_path)):
+        if sidecar.enabled:
+            loaded = sidecar.load()
+            if loaded is not None:
+                sidecars.append((sidecar, loaded))
+    return sidecars
+
+
+def update_sidecars(sidecars, deletions=(), changes=None, appends=()) -> None:
+    """Apply the changes of the objects to the sidecars \
+    from ``load_sidecars()`` after the JSON file is written.
+    """
+
+    for sidecar, loaded in sidecars:
+        sidecar.update(loaded, deletions, changes, appends)
+
+
+def append_base(full_path, new_objects, file_format=None) -> None:
+    """Append ``new_objects`` to the JSON file.
+
+    The JSON Lines file is appended in place and synced to the disk, \
+    so an interrupted append can leave only an incomplete last line. \
+    The JSON array is copied byte by byte up to its closing bracket \
+    to the temporary file of ``atomic_write()``, which replaces the file \
+    once the new objects are written, so the objects are not parsed again \
+    and the file is never left without its closing bracket.
+    """
+
+    file_format = detect_format(full_path, file_format)
+    if file_format == JSON_LINES:
+        with open(full_path, 'a', encoding="utf-8") as file:
+            write_records(file, new_objects, JSON_LINES)
+            file.flush()
+            os.fsync(file.fileno())
+        return
+
+    with open(full_path, 'rb') as source:
+        end = source.seek(0, os.SEEK_END)
+        closing_bracket = last_character(source, end)
+        if closing_bracket is None or closing_bracket[1] != b"]":
+            raise json.decoder.JSONDecodeError(
+                "Expecting ']'", full_path, end
+            )
+        previous = last_character(source, closing_bracket[0])
+        is_empty = previous is not None and previous[1] == b"["
+
+        with atomic_write(full_path, 'wb') as file:
+            source.seek(0)
+            remaining = closing_bracket[0]
+            while remaining:
+                block = source.read(min(remaining, 1 << 20))
+                if not block:
+                    break
+                file.write(block)
+                remaining -= len(block)
+
+            current_codec = codec.get_codec()
+            written = 0
+            for dictionary in new_objects:
+                if not is_empty:
+                    written += file.write(current_codec.separator.encode())
+                written += file.write(current_codec.dumps(dictionary).encode())
+                is_empty = False
+            written += file.write(b"]")
+    instrumentation.count("bytes_written", written)
+
+
+def last_character(file, end) -> tuple or None:
+    """Find the last non-whitespace byte of the binary ``file`` before ``end``.
+
+    Returns:
+        ``tuple``: the position and the byte.\n
+        ``None``: if there are only whitespaces.
+    """
+
+    position = end
+    while position > 0:
+        step = min(position, 4096)
+        position -= step
+        file.seek(position)
+        chunk = file.read(step)
+        stripped = chunk.rstrip()
+        if stripped:
+            offset = position + len(stripped) - 1
+            return offset, stripped[-1:]
+    return None
+
+
+def convert(source_path, target_path, file_format, source_format=None) -> None:
+    """Copy the objects from one JSON file to another, object by object, \
+    changing the format of the file.
+
+    Args:
+        ``source_path (str)``: the full path to the source JSON file.\n
+        ``target_path (str)``: the full path to the new JSON file.\n
+        ``file_format (str)``: the format of the new file.\n
+        ``source_format (str)``: the format of the source file, \
+        detected from the file if not passed.
+
+    Raises:
+        ``ValueError``: if both paths are to the same file.
+    """
+
+    if os.path.realpath(source_path) == os.path.realpath(target_path):
+        raise ValueError("The source and the target files must differ.")
+    dump_document(
+        target_path, iter_records(source_path, source_format), file_format
+    )
+
+
+def mutate_document(full_path, deletions=(), changes=None, appends=(),
+                    file_format=None) -> threading.Thread or None:
+    """Delete, replace and append the objects of the JSON file at once.
+
+    Without the log the file is rewritten, with the log only the changes \
+    are appended to it, and the log is compacted in the background \
+    if it has grown past its thresholds.
+
+    Args:
+        ``full_path (str)``: the full path to the JSON file.\n
+        ``deletions (Iterable[int])``: the positions of the objects \
+        to delete, as they are read by ``load_document()``.\n
+        ``changes (Dict[int, dict])``: the new objects by the positions.\n
+        ``appends (Iterable[dict])``: the objects to add to the end.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the file if not passed.
+
+    Returns:
+        ``threading.Thread``: the thread of the compaction, if started.
+
+    Raises:
+        ``exceptions.StaleMutationLog``: if the log was started \
+        for another version of the file, e.g. if the compaction stopped \
+        halfway, until ``compact_document()`` starts it anew.
+    """
+
+    deletions = set(deletions)
+    changes = changes or dict()
+    mutation_log = MutationLog(full_path)
+
+    if not mutation_log.enabled:
+        #  The objects are read and written one by one, so the file
+        #  is never parsed into the list of the dictionaries at once.
+        with FileLock(full_path, exclusive=True):
+            dump_document(
+                full_path,
+                mutated_records(
+                    iter_records(full_path, file_format),
+                    deletions, changes, appends
+                ),
+                file_format
+            )
+        return None
+
+    appends = list(appends)
+    with FileLock(full_path, exclusive=True), mutation_log.lock:
+        if not mutation_log.is_current():
+            raise exceptions.StaleMutationLog(full_path)
+        sidecars = load_sidecars(full_path)
+        slots = mutation_log.slots()
+        entries = [
+            {"op": "delete", "slot": slots[position]}
+            for position in sorted(deletions)
+        ]
+        entries.extend(
+            {"op": "upsert", "slot": slots[position], "object": dictionary}
+            for position, dictionary in sorted(changes.items())
+            if position not in deletions
+        )
+        entries.extend(
+            {"op": "append", "object": dictionary} for dictionary in appends
+        )
+        mutation_log.append(entries)
+        update_sidecars(sidecars, deletions, changes, appends)
+    document_cache.invalidate(full_path)
+
+    if mutation_log.needs_compaction():
+        return compact_document(full_path, file_format, background=True)
+    return None
+
+
+def mutated_records(records, deletions, changes, appends) -> Iterator:
+    """Yield ``records`` without ``deletions``, with ``changes`` \
+    by the positions and with ``appends`` at the end.
+    """
+
+    for position, dictionary in enumerate(records):
+        if position not in deletions:
+            yield changes.get(position, dictionary)
+    yield from appends
+
+
+def compact_document(full_path, file_format=None,
+                     background=False) -> threading.Thread or None:
+    """Fold the log into the JSON file and start the log anew.
+
+    Args:
+        ``background (bool)``: compact in a separate thread.
+
+    Returns:
+        ``threading.Thread``: the thread of the compaction, if in background.
+    """
+
+    if background:
+        #  Not a daemon thread, so the interpreter waits for the compaction
+        #  at exit instead of stopping it halfway.
+        thread = threading.Thread(
+            target=compact_document, args=(full_path, file_format)
+        )
+        thread.start()
+        return thread
+
+    mutation_log = MutationLog(full_path)
+    with FileLock(full_path, exclusive=True), mutation_log.lock:
+        if mutation_log.enabled:
+            dump_document(
+                full_path, read_document(full_path, file_format), file_format
+            )
+    return None
+
+
+def enable_mutation_log(full_path, max_entries=10000,
+                        max_bytes=16 * 1024 * 1024, file_format=None) -> None:
+    """Start keeping the changes of the JSON file in its log.
+
+    Args:
+        ``max_entries (int)``: the number of the changes \
+        which triggers the compaction.\n
+        ``max_bytes (int)``: the size of the log which triggers the compaction.
+    """
+
+    mutation_log = MutationLog(full_path)
+    with FileLock(full_path, exclusive=True), mutation_log.lock:
+        compact_document(full_path, file_format)
+        count = sum(1 for _ in iter_base(full_path, file_format))
+        sidecars = load_sidecars(full_path)
+        mutation_log.reset(count, max_entries, max_bytes)
+        update_sidecars(sidecars)
+
+
+def disable_mutation_log(full_path, file_format=None) -> None:
+    """Fold the log into the JSON file and stop keeping the log."""
+
+    mutation_log = MutationLog(full_path)
+    with FileLock(full_path, exclusive=True), mutation_log.lock:
+        compact_document(full_path, file_format)
+        sidecars = load_sidecars(full_path)
+        if mutation_log.enabled:
+            mutation_log.disable()
+        update_sidecars(sidecars)
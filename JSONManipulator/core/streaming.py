@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""The module with the incremental parser of the JSON files, \
+which reads the objects of the top-level array one by one.
+"""
+
+import json
+import re
+from typing import Iterator
+
+import JSONManipulator.exceptions as exceptions
+import JSONManipulator.core.codec as codec
+
+BUFFER_SIZE = 1024 * 1024
+
+#  The characters which change the nesting or start a string.
+STRUCTURE = re.compile(r'[{}\[\]"]')
+#  The characters which end or escape inside a string.
+STRING_SPECIAL = re.compile(r'["\\]')
+#  The characters which end a number, ``true``, ``false`` or ``null``.
+SCALAR_END = re.compile(r'[,\]\s]')
+
+
+def iter_objects(full_path, buffer_size=BUFFER_SIZE) -> Iterator:
+    """Yield the objects of the top-level array of the JSON file one by one.
+
+    The file is read by ``buffer_size`` characters, and only the text \
+    of the current object is kept in memory, so the peak memory is bounded \
+    by the largest object, not by the whole file.
+
+    Args:
+        ``full_path (str)``: the full path to the JSON file.\n
+        ``buffer_size (int)``: the number of characters read at once.
+
+    Raises:
+        ``FileNotFoundError``: \
+        if the JSON file is not found by ``full_path``.\n
+        ``IsADirectoryError``: \
+        if ``full_path`` is to a directory, not to the JSON file.\n
+        ``exceptions.NotSupportedJSONFile``: \
+        if the JSON file is not an array.\n
+        ``json.JSONDecodeError``: \
+        if the JSON file is broken.
+    """
+
+    file = open(full_path, 'r', encoding="utf-8")
+    return parse_array(file, buffer_size)
+
+
+def parse_array(file, buffer_size=BUFFER_SIZE) -> Iterator:
+    """Yield the objects of the top-level array from the opened ``file`` \
+    and close it at the end. The commas and the text after the array \
+    are checked like ``json.load()`` does.
+    """
+
+    buffer = ""
+    position = 0
+    started = False
+    ended = False
+    #  After an element, or after a comma, waiting for the next element.
+    after_element = False
+    after_comma = False
+    in_string = False
+    in_scalar = False
+    depth = 0
+    element_start = None
+
+    try:
+        while True:
+            chunk = file.read(buffer_size)
+            if not chunk:
+                break
+            buffer += chunk
+
+            while position < len(buffer):
+                if in_string:
+                    match = STRING_SPECIAL.search(buffer, position)
+                    if not match:
+                        position = len(buffer)
+                    elif match.group() == "\\":
+                        if match.end() == len(buffer):
+                            #  Wait for the escaped character.
+                            position = match.start()
+                            break
+                        position = match.end() + 1
+                    else:
+                        in_string = False
+                        position = match.end()
+                        if not depth:
+                            yield codec.loads(buffer[element_start:position])
+                            element_start = None
+                            after_element = True
+                    continue
+
+                if in_scalar:
+                    match = SCALAR_END.search(buffer, position)
+                    if not match:
+                        position = len(buffer)
+                        continue
+                    in_scalar = False
+                    position = match.start()
+                    yield codec.loads(buffer[element_start:position])
+                    element_start = None
+                    after_element = True
+                    continue
+
+                if element_start is None:
+                    char = buffer[position]
+                    if char.isspace():
+                        position += 1
+                    elif ended:
+                        raise json.JSONDecodeError(
+                            "Extra data", buffer, position
+                        )
+                    elif not started:
+                        if char != "[":
+                            raise exceptions.NotSupportedJSONFile
+                        started = True
+                        position += 1
+                    elif char == ",":
+                        if not after_element:
+                            raise json.JSONDecodeError(
+                                "Expecting value", buffer, position
+                            )
+                        after_element = False
+                        after_comma = True
+                        position += 1
+                    elif char == "]":
+                        if after_comma:
+                            raise json.JSONDecodeError(
+                                "Expecting value", buffer, position
+                            )
+                        ended = True
+                        position += 1
+                    elif after_element:
+                        raise json.JSONDecodeError(
+                            "Expecting ',' delimiter", buffer, position
+                        )
+                    else:
+                        after_comma = False
+                        element_start = position
+                        position += 1
+                        if char in "{[":
+                            depth = 1
+                        elif char == '"':
+                            in_string = True
+                        else:
+                            in_scalar = True
+                    continue
+
+                match = STRUCTURE.search(buffer, position)
+                if not match:
+                    position = len(buffer)
+                    continue
+                char = match.group()
+                position = match.end()
+                if char == '"':
+                    in_string = True
+                elif char in "{[":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if not depth:
+                        yield codec.loads(buffer[element_start:position])
+                        element_start = None
+                        after_element = True
+
+            if element_start is None:
+                buffer = buffer[position:]
+                position = 0
+            else:
+                buffer = buffer[element_start:]
+                position -= element_start
+                element_start = 0
+
+        if ended:
+            return
+        if not started:
+            raise exceptions.NotSupportedJSONFile
+        raise json.JSONDecodeError(
+            "Expecting ',' delimiter or ']'", buffer, position
+        )
+    finally:
+        file.close()
@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""The module with ``TokenCache`` class, the sidecar file which keeps \
+the normalized values of the keys and the descriptions of the objects \
+of the JSON file, so the searches only compare them.
+
+The sidecar ``<full_path>.tokens`` is JSON Lines: the first line keeps \
+the version of the format, the stamp of the JSON file \
+(``st_mtime_ns`` and ``st_size`` of the file and of its log) \
+and the names of the fields, every next line keeps the entries \
+``[position, normalized value]`` of one field in the order \
+of ``GetInformation.scan_entries()``. A sidecar with another stamp \
+is not used, and a field is added to it on the first search by the field.
+
+The writers of ``storage`` keep the existing sidecar up to date: \
+``dump_document()`` normalizes the fields of the written objects \
+while writing them, and the appends and the changes in the log \
+update only the entries of the changed objects.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Tuple
+
+import JSONManipulator.core.codec as codec
+from JSONManipulator.core.locking import atomic_write
+from JSONManipulator.core.mutation_log import MutationLog
+
+VERSION = 1
+
+#  The sidecars read by this process, by the real path of the JSON file,
+#  the least recently used first.
+LOADED = OrderedDict()
+LOADED_GUARD = threading.Lock()
+#  The budget of ``LOADED`` by the sizes of the sidecars on the disk.
+MAX_LOADED_BYTES = 64 * 1024 * 1024
+
+
+def normalize_value(dictionary_value):
+    """Bring the value from the JSON file to the list of upper-cased words.
+
+    Returns:
+        ``List[str]``: the normalized value.\n
+        The value itself: if it is not a string, a number or a list.
+    """
+
+    while isinstance(dictionary_value, dict):
+        dictionary_value = list(dictionary_value.values())[0]
+
+    if isinstance(dictionary_value, list):
+        dictionary_value = [
+            str(element).upper().strip().replace(",", "")
+            for element in dictionary_value
+            if element and isinstance(element, (str, int, float))
+        ]
+
+    if isinstance(dictionary_value, (str, int, float)):
+        str_value = str(dictionary_value)
+        new_str_value = str_value.upper().strip().replace(",", "")
+        dictionary_value = new_str_value.split()
+
+    return dictionary_value
+
+
+def file_stamp(full_path) -> list:
+    """Build the stamp of the JSON file and its log, \
+    which changes with every write of them.
+    """
+
+    stat_result = os.stat(full_path)
+    stamp = [stat_result.st_mtime_ns, stat_result.st_size]
+    mutation_log = MutationLog(full_path)
+    if mutation_log.enabled:
+        log_stat = os.stat(mutation_log.log_path)
+        stamp += [log_stat.st_mtime_ns, log_stat.st_size]
+    return stamp
+
+
+def field_entries(file_contents, field, offset=0) -> Iterator[list]:
+    """Yield ``[position, normalized value]`` of ``field`` \
+    (``("key", name)`` or ``("desc", name)``) of the objects. \
+    The values which can not be normalized to a list never match \
+    and are skipped.
+    """
+
+    kind, name = field
+    for position, dictionary in enumerate(file_contents, offset):
+        if kind == "key":
+            values = [dictionary[name]] if name in dictionary else []
+        else:
+            values = [
+                value[name] for value in dictionary.values()
+                if isinstance(value, dict) and name in value
+            ]
+        for value in values:
+            try:
+                normalized_value = normalize_value(value)
+            except IndexError:
+                continue
+            if isinstance(normalized_value, list):
+                yield [position, normalized_value]
+
+
+class TokenCache:
+    """The sidecar with the normalized values of the JSON file.
+
+    The caller holds ``FileLock`` of the JSON file, the exclusive one \
+    for the methods called by the writers.
+
+    Args:
+        ``full_path (str)``: the full path to the JSON file.
+    """
+
+    __slots__ = ["full_path", "sidecar_path", "collected"]
+
+    def __init__(self, full_path):
+        self.full_path = full_path
+        self.sidecar_path = full_path + ".tokens"
+        self.collected = None
+
+    @property
+    def enabled(self) -> bool:
+        """Check if the sidecar of the JSON file exists."""
+
+        return os.path.isfile(self.sidecar_path)
+
+    def entries(self, file_contents, key=None, desc=None) -> List[Tuple]:
+        """Return ``(normalized value, dictionary, position)`` \
+        of ``key``/``desc`` of ``file_contents``, loaded from the JSON file \
+        under the same lock, adding the field to the sidecar if needed.
+        """
+
+        stamp = file_stamp(self.full_path)
+        field = ("key", key) if key else ("desc", desc)
+        loaded = self.load(stamp)
+        if loaded is None or loaded[0] != len(file_contents):
+            loaded = (len(file_contents), dict())
+        count, fields = loaded
+
+        if field not in fields:
+            fields = dict(fields)
+            fields[field] = list(field_entries(file_contents, field))
+            self.save(stamp, count, fields)
+
+        return [
+            (normalized_value, file_contents[position], position)
+            for position, normalized_value in fields[field]
+        ]
+
+    def load(self, stamp=None) -> tuple or None:
+        """Read the sidecar, if it was written for ``stamp`` \
+        (by default, for the current JSON file).
+
+        Returns:
+            ``tuple``: the number of the objects and the entries \
+            of the fields by their names.\n
+            ``None``: if the sidecar is missing or out of date.
+        """
+
+        if stamp is None:
+            stamp = file_stamp(self.full_path)
+        real_path = os.path.realpath(self.full_path)
+        with LOADED_GUARD:
+            loaded = LOADED.get(real_path)
+            if loaded is not None:
+                LOADED.move_to_end(real_path)
+        if loaded is not None and loaded[0] == stamp:
+            return loaded[1:3]
+
+        try:
+            with open(self.sidecar_path, 'rb') as file:
+                header = codec.loads(file.readline())
+                if header.get("version") != VERSION \
+                        or header.get("stamp") != stamp:
+                    return None
+                fields = {
+                    tuple(field): codec.loads(file.readline())
+                    for field in header["fields"]
+                }
+        except (OSError, ValueError, KeyError, AttributeError):
+            return None
+
+        self.remember(stamp, header["count"], fields)
+        return header["count"], fields
+
+    def save(self, stamp, count, fields) -> None:
+        """Write the sidecar of the JSON file with ``stamp``."""
+
+        with atomic_write(self.sidecar_path) as file:
+            file.write(codec.dumps({
+                "version": VERSION, "stamp": stamp, "count": count,
+                "fields": [list(field) for field in fields],
+            }) + "\n")
+            for entries in fields.values():
+                file.write(codec.dumps(entries) + "\n")
+        self.remember(stamp, count, fields)
+
+    def remember(self, stamp, count, fields) -> None:
+        """Keep the read or the written sidecar in ``LOADED``, \
+        dropping the least recently used ones over ``MAX_LOADED_BYTES``.
+        """
+
+        try:
+            weight = os.path.getsize(self.sidecar_path)
+        except OSError:
+            return
+        with LOADED_GUARD:
+            LOADED.pop(os.path.realpath(self.full_path), None)
+            if weight > MAX_LOADED_BYTES:
+                return
+            LOADED[os.path.realpath(self.full_path)] = \
+                (stamp, count, fields, weight)
+            total = sum(loaded[3] for loaded in LOADED.values())
+            while total > MAX_LOADED_BYTES:
+                _, loaded = LOADED.popitem(last=False)
+                total -= loaded[3]
+
+    def field_names(self) -> List[tuple]:
+        """Return the names of the fields kept in the sidecar."""
+
+        try:
+            with open(self.sidecar_path, 'rb') as file:
+                return [
+                    tuple(field)
+                    for field in codec.loads(file.readline())["fields"]
+                ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return []
+
+    def rewrite(self, file_contents) -> Iterator:
+        """Yield the objects of ``file_contents`` to the writer \
+        of the whole file, normalizing the fields of the sidecar \
+        for ``rewritten()``.
+        """
+
+        self.collected = {field: [] for field in self.field_names()}
+        return self.collect(file_contents, self.collected)
+
+    def rewritten(self, count) -> None:
+        """Save the fields normalized by ``rewrite()`` \
+        of ``count`` written objects.
+        """
+
+        self.update((count, self.collected))
+        self.collected = None
+
+    def collect(self, file_contents, fields) -> Iterator:
+        """Yield the objects of ``file_contents`` to the writer, \
+        adding the entries of their ``fields`` to the dictionary ``fields``.
+        """
+
+        for position, dictionary in enumerate(file_contents):
+            for field, entries in fields.items():
+                entries.extend(field_entries([dictionary], field, position))
+            yield dictionary
+
+    def update(self, loaded, deletions=(), changes=None, appends=()) -> None:
+        """Apply the changes of the objects to ``loaded`` from ``load()`` \
+        before the JSON file was written, and save the sidecar \
+        with the stamp of the written file.
+
+        Args:
+            ``deletions (Iterable[int])``: the positions \
+            of the deleted objects.\n
+            ``changes (Dict[int, dict])``: the new objects by the positions.\n
+            ``appends (List[dict])``: the objects added to the end.
+        """
+
+        count, fields = loaded
+        deletions = set(deletions)
+        changes = changes or dict()
+        #  The new positions of the kept objects.
+        shifts = []
+        shift = 0
+        for position in range(count):
+            if position in deletions:
+                shift += 1
+            shifts.append(position - shift)
+        new_count = count - len(deletions) + len(appends)
+
+        new_fields = dict()
+        for field, entries in fields.items():
+            new_entries = []
+            changed = set()
+            for position, normalized_value in entries:
+                if position in deletions:
+                    continue
+                if position in changes:
+                    if position not in changed:
+                        changed.add(position)
+                        new_entries.extend(field_entries(
+                            [changes[position]], field, shifts[position]
+                        ))
+                    continue
+                new_entries.append([shifts[position], normalized_value])
+            for position in changes.keys() - changed - deletions:
+                new_entries.extend(field_entries(
+                    [changes[position]], field, shifts[position]
+                ))
+            new_entries.sort(key=lambda entry: entry[0])
+            new_entries.extend(field_entries(
+                appends, field, new_count - len(appends)
+            ))
+            new_fields[field] = new_entries
+
+        self.save(file_stamp(self.full_path), new_count, new_fields)
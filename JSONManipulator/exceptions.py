@@ -20,3 +20,34 @@ class NotSupportedJSONFile(Exception):
         super().__init__(
             "\nSorry, we don\'t support your structure of JSON."
         )
+
+
+class KeyAlreadyExists(Exception):
+    """Raised when a key which is being added \
+    already exists in the objects of the JSON file."""
+
+    def __init__(self, key):
+        super().__init__(
+            f"The key <{key}> already exists, "
+            f"try changing its values instead."
+        )
+
+
+class InvalidMigration(Exception):
+    """Raised when the operations of a migration \
+    are malformed or conflict with each other."""
+
+    def __init__(self, reason):
+        super().__init__(f"The migration is invalid: {reason}.")
+
+
+class StaleMutationLog(Exception):
+    """Raised when the log of the JSON file was started \
+    for another version of the file."""
+
+    def __init__(self, full_path):
+        super().__init__(
+            f"The log of <{full_path}> was started for another version "
+            f"of the file, compact the file to keep it as it is "
+            f"and start the log anew."
+        )
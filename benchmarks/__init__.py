@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+"""The benchmarks of the operations of ``JSONManipulator`` \
+on the synthetic JSON files."""
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""The generator of the synthetic JSON files shaped like the files \
+after ``set_up()``: ``[{key: {desc: value}}, ...]``.
+
+The objects are written one by one, so the files of millions of objects \
+are generated with little memory.
+
+Usage:
+    ``python -m benchmarks.generate_dataset books.json --records 100000``
+"""
+
+import argparse
+import random
+from typing import Iterator
+
+from JSONManipulator.core.storage import dump_document
+
+WORDS = [
+    "android", "python", "java", "action", "guide", "practical", "modern",
+    "design", "patterns", "data", "science", "web", "development", "cloud",
+    "systems", "network", "security", "learning", "machine", "deep",
+    "algorithms", "structures", "programming", "software", "engineering",
+    "database", "mobile", "testing", "agile", "enterprise",
+]
+NAMES = [
+    "W. Frank Ableson", "Charlie Collins", "Robi Sen", "Gojko Adzic",
+    "Tariq Ahmed", "Jon Orwant", "Satnam Alag", "Marc Andersen",
+    "Mark Tacchi", "Dion Almaer", "Ben Galbraith", "Dan Allen",
+]
+STATUSES = ["PUBLISH", "MEAP"]
+
+
+def generate_records(records, value_length=4, list_length=2,
+                     duplicate_rate=0.0, seed=0) -> Iterator[dict]:
+    """Yield the objects of the synthetic JSON file.
+
+    Args:
+        ``records (int)``: the number of the objects.\n
+        ``value_length (int)``: the number of the words in the titles \
+        and twice as many in the short descriptions.\n
+        ``list_length (int)``: the number of the elements \
+        of the list fields (authors and categories).\n
+        ``duplicate_rate (float)``: the share of the objects \
+        which repeat the title of one of the previous objects.\n
+        ``seed (int)``: the seed of the random generator.
+    """
+
+    generator = random.Random(seed)
+    titles = []
+    for number in range(records):
+        if titles and generator.random() < duplicate_rate:
+            title = generator.choice(titles)
+        else:
+            title = " ".join(
+                generator.choice(WORDS).capitalize()
+                for _ in range(value_length)
+            )
+            titles.append(title)
+            if len(titles) > 10000:
+                titles.pop(generator.randrange(len(titles)))
+
+        yield {
+            "title": {"Title": title},
+            "isbn": {"ISBN": str(1000000000 + number)},
+            "pageCount": {"The number of pages": generator.randint(50, 1200)},
+            "shortDescription": {"Short description": " ".join(
+                generator.choice(WORDS) for _ in range(2 * value_length)
+            ) + "."},
+            "status": {"Status": generator.choice(STATUSES)},
+            "authors": {"Authors": generator.sample(
+                NAMES, min(list_length, len(NAMES))
+            )},
+            "categories": {"Categories": [
+                generator.choice(WORDS).capitalize()
+                for _ in range(list_length)
+            ]},
+        }
+
+
+def generate_dataset(full_path, records, value_length=4, list_length=2,
+                     duplicate_rate=0.0, seed=0, file_format=None) -> None:
+    """Write the synthetic JSON file of ``records`` objects.
+
+    Args:
+        ``full_path (str)``: the full path to the new JSON file.\n
+        ``file_format (str)``: ``JSON_ARRAY`` or ``JSON_LINES``, \
+        detected from the extension if not passed.\n
+        The other arguments are the ones of ``generate_records()``.
+    """
+
+    dump_document(
+        full_path,
+        generate_records(
+            records, value_length, list_length, duplicate_rate, seed
+        ),
+        file_format
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("full_path")
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--value-length", type=int, default=4)
+    parser.add_argument("--list-length", type=int, default=2)
+    parser.add_argument("--duplicate-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--file-format", default=None)
+    arguments = parser.parse_args()
+
+    generate_dataset(
+        arguments.full_path, arguments.records, arguments.value_length,
+        arguments.list_length, arguments.duplicate_rate, arguments.seed,
+        arguments.file_format
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""The timing harness of the operations of ``JSONManipulator`` \
+on the synthetic JSON files, writing the results as JSON.
+
+Every operation runs on a fresh copy of the generated file with an empty \
+``document_cache``, the answers to its prompts are given automatically \
+and its output is discarded. Only the operation itself is timed.
+
+Usage:
+    ``python -m benchmarks.run_benchmarks --sizes 10000 100000 \
+    --output results.json --compare previous_results.json``
+"""
+
+import argparse
+import builtins
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+from typing import Dict, List
+
+import JSONManipulator
+from JSONManipulator import GetInformation, ChangeValue, DeleteObject, \
+    AddKey, AddObject, ChangeAllValues, document_cache
+from JSONManipulator.core.storage import iter_records
+
+from benchmarks.generate_dataset import generate_dataset
+
+SIZES = [10000, 100000, 1000000, 10000000]
+LEVENSHTEIN = [1.0, 0.8, 0.6]
+OPERATIONS = [
+    "GetInformation", "GetInformation[index]", "ChangeValue",
+    "DeleteObject", "AddKey", "AddObject", "ChangeAllValues",
+]
+
+#  The answers to the prompts of the operations by the parts of the prompts.
+ANSWERS = {
+    "ChangeValue": [("Write numbers", "1"), ("<Title>", "Changed title")],
+    "DeleteObject": [("Write numbers", "1"), ("Delete the object", "y")],
+    "AddKey": [
+        ("new key", "benchmark_key"), ("description", "Benchmark"),
+        ("default value", "0"),
+    ],
+    "AddObject": [("<", "Added value")],
+    "ChangeAllValues": [("Proceed", "y"), ("<Status>", "SOLD")],
+}
+
+
+@contextmanager
+def answered(answers):
+    """Answer the prompts of ``input()`` by ``answers`` \
+    and discard the output inside the block.
+    """
+
+    def answer(prompt=""):
+        for part, value in answers:
+            if part in prompt:
+                return value
+        return ""
+
+    original_input = builtins.input
+    builtins.input = answer
+    try:
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            yield
+    finally:
+        builtins.input = original_input
+
+
+def run_operation(operation, full_path, value, levenshtein) -> None:
+    """Run ``operation`` on the JSON file."""
+
+    if operation.startswith("GetInformation"):
+        GetInformation(
+            value=value, full_path=full_path, levenshtein=levenshtein,
+            key="title", index=operation.endswith("[index]")
+        )
+    elif operation == "ChangeValue":
+        ChangeValue(
+            value=value, full_path=full_path, levenshtein=levenshtein,
+            key="title"
+        )
+    elif operation == "DeleteObject":
+        DeleteObject(
+            value=value, full_path=full_path, levenshtein=levenshtein,
+            key="title"
+        )
+    elif operation == "AddKey":
+        AddKey(full_path)
+    elif operation == "AddObject":
+        AddObject(full_path)
+    elif operation == "ChangeAllValues":
+        ChangeAllValues(full_path)
+
+
+def measure(operation, dataset_path, work_path, value, levenshtein,
+            repeat) -> List[float]:
+    """Time ``operation`` ``repeat`` times on the copies of the dataset.
+
+    Returns:
+        ``List[float]``: the durations in seconds.
+    """
+
+    durations = []
+    for _ in range(repeat):
+        shutil.copyfile(dataset_path, work_path)
+        document_cache.clear()
+        with answered(ANSWERS.get(operation, [])):
+            start = time.perf_counter()
+            run_operation(operation, work_path, value, levenshtein)
+            durations.append(time.perf_counter() - start)
+    return durations
+
+
+def run_benchmarks(sizes=(10000,), levenshtein=tuple(LEVENSHTEIN),
+                   operations=tuple(OPERATIONS), repeat=3, value_length=4,
+                   list_length=2, duplicate_rate=0.0, file_format=None,
+                   directory=None) -> Dict:
+    """Generate the datasets of ``sizes`` objects and time the operations.
+
+    The searching operations are timed with every value \
+    of ``levenshtein``, the other ones once.
+
+    Returns:
+        ``dict``: the environment, the parameters and the results, \
+        ready to be written as JSON.
+    """
+
+    parameters = {
+        "sizes": list(sizes), "levenshtein": list(levenshtein),
+        "operations": list(operations), "repeat": repeat,
+        "value_length": value_length, "list_length": list_length,
+        "duplicate_rate": duplicate_rate, "file_format": file_format,
+    }
+    results = []
+    extension = ".jsonl" if file_format == "jsonl" else ".json"
+
+    with tempfile.TemporaryDirectory(dir=directory) as temporary_directory:
+        dataset_path = os.path.join(temporary_directory, "dataset" + extension)
+        work_path = os.path.join(temporary_directory, "work" + extension)
+        for size in sizes:
+            generate_dataset(
+                dataset_path, size, value_length, list_length,
+                duplicate_rate, file_format=file_format
+            )
+            value = next(iter_records(dataset_path))["title"]["Title"]
+
+            for operation in operations:
+                searching = operation.startswith(
+                    ("GetInformation", "ChangeValue", "DeleteObject")
+                )
+                for similarity in (levenshtein if searching else [None]):
+                    durations = measure(
+                        operation, dataset_path, work_path, value,
+                        similarity or 1.0, repeat
+                    )
+                    results.append({
+                        "operation": operation, "records": size,
+                        "levenshtein": similarity, "seconds": durations,
+                        "best": min(durations),
+                        "median": statistics.median(durations),
+                    })
+
+    return {
+        "version": JSONManipulator.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "parameters": parameters,
+        "results": results,
+    }
+
+
+def compare_results(previous, current, tolerance=1.2) -> List[Dict]:
+    """Find the operations which became slower than ``tolerance`` times \
+    since ``previous`` results, comparing the best durations.
+
+    Returns:
+        ``List[Dict]``: the slower operations with both durations.
+    """
+
+    def result_key(result) -> tuple:
+        return result["operation"], result["records"], result["levenshtein"]
+
+    previous_best = {
+        result_key(result): result["best"] for result in previous["results"]
+    }
+    regressions = []
+    for result in current["results"]:
+        before = previous_best.get(result_key(result))
+        if before and result["best"] > before * tolerance:
+            regressions.append({
+                "operation": result["operation"],
+                "records": result["records"],
+                "levenshtein": result["levenshtein"],
+                "previous": before, "current": result["best"],
+            })
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000],
+                        help=f"the numbers of the objects, e.g. {SIZES}")
+    parser.add_argument("--levenshtein", type=float, nargs="+",
+                        default=LEVENSHTEIN)
+    parser.add_argument("--operations", nargs="+", default=OPERATIONS,
+                        choices=OPERATIONS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--value-length", type=int, default=4)
+    parser.add_argument("--list-length", type=int, default=2)
+    parser.add_argument("--duplicate-rate", type=float, default=0.0)
+    parser.add_argument("--file-format", default=None)
+    parser.add_argument("--directory", default=None,
+                        help="where to keep the generated files")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", default=None,
+                        help="the previous results to compare with")
+    parser.add_argument("--tolerance", type=float, default=1.2)
+    arguments = parser.parse_args()
+
+    report = run_benchmarks(
+        arguments.sizes, arguments.levenshtein, arguments.operations,
+        arguments.repeat, arguments.value_length, arguments.list_length,
+        arguments.duplicate_rate, arguments.file_format, arguments.directory
+    )
+    with open(arguments.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    for result in report["results"]:
+        print(f"{result['operation']:<24}{result['records']:>10}"
+              f"{str(result['levenshtein']):>6}{result['best']:>12.4f} s")
+
+    if arguments.compare:
+        with open(arguments.compare, "r") as file:
+            regressions = compare_results(
+                json.load(file), report, arguments.tolerance
+            )
+        for regression in regressions:
+            print(f"Slower: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
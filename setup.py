@@ -30,5 +30,6 @@ setup(
     ],
     keywords="Python JSON Objects",
     python_requires="~=3.6",
-    packages=find_packages()
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
+    extras_require={"fast": ["orjson"]}
 )
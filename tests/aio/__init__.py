@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+
+"""Pytest package for the asyncio API."""
@@ -0,0 +1,78 @@
+import pytest
+import asyncio
+import json
+import os
+import shutil
+import sys
+
+from JSONManipulator import Session, aget_information, achange_value, \
+    achange_all_values, adelete_object, aadd_key, aadd_object
+from JSONManipulator.exceptions import NotSupportedJSONFile
+
+
+def run(coroutine):
+    #  ``asyncio.run()`` is not available on Python 3.6.
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_aio(tmp_path):
+    paths = []
+    for number in range(3):
+        full_path = str(tmp_path / f"books_{number}.json")
+        shutil.copy(
+            os.path.join(sys.path[0], "tests/books_after_set_up.json"),
+            full_path
+        )
+        paths.append(full_path)
+
+    with Session(paths[0]) as session:
+        expected = session.get_information(desc="Categories", value="Java")
+
+    async def lookups():
+        return await asyncio.gather(*(
+            aget_information(full_path, "Java", desc="Categories", index=index)
+            for full_path in paths for index in (False, True)
+        ))
+
+    # -- testing the concurrent lookups over many files
+    for found in run(lookups()):
+        assert found == expected
+
+    async def changes():
+        full_path = paths[0]
+        counts = await asyncio.gather(*(
+            aadd_object(full_path, {"title": {"Title": f"Async book {number}"}})
+            for number in range(10)
+        ))
+        counts.append(await achange_value(
+            full_path, {"isbn": "0000000000"},
+            key="title", value="Unlocking Android"
+        ))
+        counts.append(await adelete_object(
+            full_path, "Async book 3", key="title"
+        ))
+        await aadd_key(full_path, "reading_status", "Reading Status", "Read")
+        counts.append(await achange_all_values(
+            full_path, {"reading_status": "Not Read"}
+        ))
+        with pytest.raises(NotSupportedJSONFile):
+            await aadd_object(full_path, ["not", "a", "dictionary"])
+        return counts
+
+    # -- testing that the concurrent changes of one file are not lost
+    counts = run(changes())
+    with open(paths[0], "r") as file:
+        file_contents = json.load(file)
+    titles = [dictionary["title"]["Title"] for dictionary in file_contents]
+    assert counts[-3:] == [1, 1, len(file_contents)]
+    assert sum(title.startswith("Async book") for title in titles) == 9
+    assert "Async book 3" not in titles
+    assert file_contents[0]["isbn"] == {"ISBN": "0000000000"}
+    assert all(
+        dictionary["reading_status"] == {"Reading Status": "Not Read"}
+        for dictionary in file_contents
+    )
@@ -0,0 +1,40 @@
+import json
+import os
+import sys
+
+from JSONManipulator import BatchQuery, Query
+from JSONManipulator.core.instrumentation import use_recorder, HistogramCollector
+
+
+def test_batch_query():
+    full_path = os.path.join(sys.path[0], "tests/books_after_set_up.json")
+    with open(full_path, "r") as file:
+        file_contents = json.load(file)
+    file_contents.append({"title": {"Title": "Unlocking Android A Developer Guide"}})
+
+    queries = [
+        ("Unlocking Android", 1.0, "title"), ("Unlocking Android A Developer", 1.0, "title"),
+        ("Flex 3 in Action", 1.0, "title"), ("Flex 3 in Action", 0.5, "title"),
+        ("Java", 0.4, None, "Categories"), ("Java", 1.0, None, "Categories"),
+        (416, 1.0, "pageCount"), ("Not found book", 1.0, "title"),
+        {"value": "Android in Action", "levenshtein": 0.6, "key": "title"},
+        Query("W. Frank Ableson", desc="Authors"),
+        ("Unlocking Android", 0, "title"),
+    ]
+
+    # -- testing that every query finds the same as Query.find()
+    batch = BatchQuery(queries)
+    with use_recorder(HistogramCollector()) as collector:
+        results = batch.find(iter(file_contents))
+    assert collector.summary()["counters"]["records_scanned"] == len(file_contents)
+    assert len(results) == len(queries)
+    for query, found, positions in zip(batch.queries, results, batch.output_positions):
+        expected = Query(query.value, query.levenshtein, query.key, query.desc)
+        assert found == expected.find(file_contents)
+        assert positions == expected.output_positions
+    assert results[0] and results[2] and results[4] and not results[7] and not results[10]
+
+    # -- testing the search in the file
+    assert BatchQuery(queries[:3]).find_in_file(full_path) == \
+        BatchQuery(queries[:3]).find_in_file(full_path, stream=True) == \
+        [Query(*query).find(file_contents[:-1]) for query in queries[:3]]
@@ -0,0 +1,45 @@
+import json
+
+from benchmarks.generate_dataset import generate_dataset, generate_records
+from benchmarks.run_benchmarks import run_benchmarks, compare_results, \
+    OPERATIONS
+from JSONManipulator.core.storage import load_document
+
+
+def test_benchmarks(tmp_path):
+    # -- testing the generated objects
+    full_path = str(tmp_path / "dataset.json")
+    generate_dataset(full_path, 100, value_length=3, list_length=4,
+                     duplicate_rate=0.5)
+    file_contents = load_document(full_path)
+    assert file_contents == list(generate_records(100, 3, 4, 0.5))
+    assert all(
+        isinstance(value, dict) and len(value) == 1
+        for dictionary in file_contents for value in dictionary.values()
+    )
+    titles = [dictionary["title"]["Title"] for dictionary in file_contents]
+    assert len(set(titles)) < 75
+    assert all(len(title.split()) == 3 for title in titles)
+    assert all(
+        len(dictionary["categories"]["Categories"]) == 4
+        for dictionary in file_contents
+    )
+
+    # -- testing the harness on a small file
+    report = run_benchmarks(
+        sizes=[50], levenshtein=[1.0, 0.7], repeat=1,
+        directory=str(tmp_path)
+    )
+    json.dumps(report)
+    assert {result["operation"] for result in report["results"]} == \
+        set(OPERATIONS)
+    assert len(report["results"]) == 4 * 2 + 3
+
+    slower = json.loads(json.dumps(report))
+    slower["results"][0]["best"] *= 10
+    assert compare_results(report, slower) == [{
+        "operation": "GetInformation", "records": 50, "levenshtein": 1.0,
+        "previous": report["results"][0]["best"],
+        "current": slower["results"][0]["best"],
+    }]
+    assert compare_results(report, report) == []
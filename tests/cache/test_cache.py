@@ -0,0 +1,42 @@
+import os
+import shutil
+import sys
+
+from JSONManipulator import Session, document_cache
+from JSONManipulator.core.cache import DocumentCache
+from JSONManipulator.core.storage import load_document
+
+
+def test_document_cache(tmp_path):
+    full_path = str(tmp_path / "books.json")
+    shutil.copy(
+        os.path.join(sys.path[0], "tests/books_after_set_up.json"), full_path
+    )
+
+    # -- testing hits and invalidation by our own writes
+    document_cache.clear()
+    file_contents = load_document(full_path, cached=True)
+    assert load_document(full_path, cached=True) is file_contents
+    assert load_document(full_path) is not file_contents
+
+    with Session(full_path) as session:
+        session.delete_object(key="title", value="Unlocking Android")
+
+    assert not any(
+        key[0] == os.path.realpath(full_path) for key in document_cache.entries
+    )
+    new_contents = load_document(full_path, cached=True)
+    assert len(new_contents) == len(file_contents) - 1
+
+    # -- testing the memory budget and LRU eviction
+    cache = DocumentCache(max_bytes=10)
+    cache.put(("a", 0, 4), [1])
+    cache.put(("b", 0, 4), [2])
+    assert cache.get(("a", 0, 4)) == [1]
+    cache.put(("c", 0, 4), [3])
+    assert cache.get(("b", 0, 4)) is None
+    assert cache.get(("a", 0, 4)) == [1]
+    cache.put(("d", 0, 11), [4])
+    assert cache.get(("d", 0, 11)) is None
+    cache.resize(0)
+    assert not cache.entries and cache.current_bytes == 0
@@ -0,0 +1,61 @@
+import pytest
+import json
+import math
+
+from JSONManipulator.core.codec import Codec, json_codec, register_codec, \
+    set_codec, get_codec, orjson, CODECS
+from JSONManipulator.core.storage import dump_document, load_document
+
+
+def test_codec(tmp_path):
+    full_path = str(tmp_path / "books.json")
+    file_contents = [
+        {"title": {"Title": "Über Café"}, "pageCount": {"Pages": 416}},
+        {"title": {"Title": "Second"}, "price": {"Price": 12.5}},
+    ]
+
+    # -- testing that the default codec writes the files as json.dump
+    assert get_codec().name == "auto"
+    dump_document(full_path, file_contents)
+    with open(full_path, "r") as file:
+        assert file.read() == json.dumps(file_contents)
+    assert load_document(full_path) == file_contents
+
+    # -- testing the values parsed only by json
+    with open(full_path, "w") as file:
+        file.write('[{"value": NaN}, {"value": 123456789012345678901234567890}]')
+    parsed = load_document(full_path)
+    assert math.isnan(parsed[0]["value"])
+    assert parsed[1]["value"] == 123456789012345678901234567890
+
+    # -- testing the registered and the tuned codecs
+    calls = []
+
+    def counting_dumps(obj):
+        calls.append(obj)
+        return json.dumps(obj)
+
+    register_codec(Codec("counting", json.loads, counting_dumps))
+    previous = set_codec("counting")
+    try:
+        dump_document(full_path, file_contents)
+        assert calls == file_contents
+
+        set_codec(json_codec(compact=True, ensure_ascii=False))
+        dump_document(full_path, file_contents)
+        with open(full_path, "r", encoding="utf-8") as file:
+            assert file.read() == json.dumps(
+                file_contents, separators=(",", ":"), ensure_ascii=False
+            )
+        assert load_document(full_path) == file_contents
+
+        if orjson is not None:
+            set_codec("orjson")
+            dump_document(full_path, file_contents)
+            assert load_document(full_path) == file_contents
+    finally:
+        set_codec(previous)
+    assert get_codec() is CODECS["auto"]
+
+    with pytest.raises(KeyError):
+        set_codec("missing codec")
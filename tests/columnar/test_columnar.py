@@ -0,0 +1,101 @@
+import copy
+import json
+import os
+import pickle
+import shutil
+import sys
+from array import array
+
+import JSONManipulator.core.storage as storage
+from JSONManipulator import GetInformation, Query, BatchQuery, Session, \
+    DeleteObject
+from JSONManipulator.core.columnar import ColumnStore
+from JSONManipulator.core.index import FuzzyIndex
+
+
+def test_column_store():
+    with open(os.path.join(sys.path[0], "tests/books_after_set_up.json"), "r") as file:
+        file_contents = json.load(file)
+    file_contents.append({"title": "Plain Title", "pageCount": {"Pages": 1.5},
+                          "extra": {"a": 1, "b": 2}})
+
+    # -- testing that the views are the same as the dictionaries
+    store = ColumnStore(iter(file_contents))
+    assert len(store) == len(file_contents)
+    assert list(store.records()) == file_contents
+    assert store[3] == file_contents[3] and store[-1] == file_contents[-1]
+    assert [list(view) for view in store[:4]] == [list(record) for record in file_contents[:4]]
+    assert isinstance(store.columns["isbn"].values, list)
+    assert copy.deepcopy(store[0]) == file_contents[0]
+    assert type(pickle.loads(pickle.dumps(store[0]))) is dict
+
+    # -- testing the columns of the numbers
+    numbers = ColumnStore([{"n": {"N": 1}}, {"n": {"N": 2}}, {"m": {"M": 0.5}}])
+    assert numbers.columns["n"].values == array("q", [1, 2, 0])
+    assert numbers.columns["m"].values.typecode == "d"
+    numbers[1]["n"] = {"Other": "two"}
+    assert list(numbers.records()) == [{"n": {"N": 1}}, {"n": {"Other": "two"}}, {"m": {"M": 0.5}}]
+
+    # -- testing that the searches find the same objects
+    queries = [
+        ("Java", 0.8, None, "Categories"), ("Android in Action", 0.5, "title"),
+        ("Unlocking Android", 1.0, "title"), ("W. Frank Ableson", 1.0, None, "Authors"),
+        (416, 1.0, "pageCount"),
+    ]
+    for query in queries:
+        expected = Query(*query)
+        expected.find(file_contents)
+        found = Query(*query)
+        assert found.find(store) == expected.output_dict_container
+        assert found.output_positions == expected.output_positions
+        found.find(store, index=FuzzyIndex(store))
+        assert found.output_positions == expected.output_positions
+        assert [position for position in Query(*query).find_top(store, 3)] == \
+            Query(*query).find_top(file_contents, 3)
+    assert BatchQuery(queries).find(store) == BatchQuery(queries).find(file_contents)
+
+
+def test_columnar_session(tmp_path):
+    paths = []
+    for name in ("books.json", "books_columnar.json"):
+        full_path = str(tmp_path / name)
+        shutil.copy(
+            os.path.join(sys.path[0], "tests/books_after_set_up.json"), full_path
+        )
+        paths.append(full_path)
+
+    found = GetInformation("Flex 3 in Action", paths[1], key="title", columnar=True)
+    assert found.output_dict_container == GetInformation(
+        "Flex 3 in Action", paths[0], key="title"
+    ).output_dict_container
+
+    # -- testing that the columnar session writes the same file
+    for full_path, columnar in zip(paths, (False, True)):
+        with Session(full_path, columnar=columnar) as session:
+            assert session.change_value({"status": "MEAP"}, "Android in Action", 0.5, "title") > 1
+            assert session.delete_object("Java", 0.8, desc="Categories") > 1
+            session.add_key("rating", "Rating", 0)
+            session.add_object({"title": {"Title": "New Book"}, "rating": {"Rating": 5}})
+            session.change_all_values({"rating": 1})
+            assert session.get_information("New Book", key="title")
+    with open(paths[0]) as first, open(paths[1]) as second:
+        assert first.read() == second.read()
+
+
+def test_columnar_delete(tmp_path, monkeypatch):
+    full_path = str(tmp_path / "books.json")
+    shutil.copy(
+        os.path.join(sys.path[0], "tests/books_after_set_up.json"), full_path
+    )
+    with open(full_path) as file:
+        file_contents = json.load(file)
+
+    # -- testing that the file is not parsed into the dictionaries
+    def read_document(*args, **kwargs):
+        raise AssertionError("The whole file is parsed.")
+
+    monkeypatch.setattr(storage, "read_document", read_document)
+    monkeypatch.setattr("builtins.input", lambda *args: "y")
+    DeleteObject("Unlocking Android", full_path, key="title", columnar=True)
+    with open(full_path) as file:
+        assert json.load(file) == file_contents[1:]
@@ -0,0 +1,54 @@
+import json
+import os
+import sys
+
+from JSONManipulator import Query
+from JSONManipulator.core.index import ExactIndex, FuzzyIndex
+
+
+def test_exact_index():
+    with open(os.path.join(sys.path[0], "tests/books_after_set_up.json"), "r") as file:
+        file_contents = json.load(file)
+    file_contents.append({"title": {"Title": "Unlocking Android A Developer Guide"}})
+    file_contents.append({"title": {"Title": "Unlocking"}})
+
+    # -- testing that the index finds the same objects as the full scan
+    index = ExactIndex(file_contents)
+    values = [
+        "Unlocking Android", "Unlocking Android A Developer",
+        "Unlocking Android A Developer Guide Book", "Flex 3 in Action",
+        "Java", "Android", 416, "Not found book",
+    ]
+    for value in values:
+        for key, desc in (("title", None), ("pageCount", None), (None, "Categories")):
+            query = Query(value, key=key, desc=desc)
+            expected = list(query.find(file_contents))
+            assert query.find(file_contents, index=index) == expected
+
+    assert Query("Unlocking Android A Developer", key="title").find(
+        file_contents, index=index
+    ) == [file_contents[-2]]
+    assert len(Query("Java", desc="Categories").find(file_contents, index=index)) > 1
+
+
+def test_fuzzy_index():
+    with open(os.path.join(sys.path[0], "tests/books_after_set_up.json"), "r") as file:
+        file_contents = json.load(file)
+
+    # -- testing that the index finds the same objects as the full scan
+    index = FuzzyIndex(file_contents)
+    values = [
+        "SBCD Exam Study Kit", "Unlocking Androyd", "Flex 3 in Action",
+        "W. Frank Aleson, Charlie Collins, Robi Sen", "Java", "Not found book",
+    ]
+    for value in values:
+        for levenshtein in (1.0, 0.79, 0.7, 0.6, 0.3):
+            for key, desc in (("title", None), (None, "Authors"), (None, "Categories")):
+                query = Query(value, levenshtein, key=key, desc=desc)
+                expected = list(query.find(file_contents))
+                assert query.find(file_contents, index=index) == expected
+
+    assert Query("SBCD Exam Study Kit", 0.7, key="title").find(
+        file_contents, index=index
+    )
+    assert not ExactIndex.supports(0.7) and FuzzyIndex.supports(0.7)
@@ -0,0 +1,50 @@
+import json
+import os
+import shutil
+import sys
+
+from JSONManipulator import GetInformation, document_cache
+from JSONManipulator.core.instrumentation import HistogramCollector, \
+    CallbackRecorder, use_recorder, current_recorder, NULL_RECORDER
+from JSONManipulator.core.storage import dump_document, load_document
+
+
+def test_instrumentation(tmp_path):
+    full_path = str(tmp_path / "books.json")
+    shutil.copy(
+        os.path.join(sys.path[0], "tests/books_after_set_up.json"), full_path
+    )
+    with open(full_path, "r") as file:
+        file_contents = json.load(file)
+    document_cache.clear()
+
+    # -- testing the phases and the counters of a query
+    with use_recorder(HistogramCollector()) as collector:
+        found = GetInformation(
+            value="Java", desc="Categories", full_path=full_path,
+            levenshtein=0.8
+        ).output_dict_container
+        dump_document(full_path, file_contents)
+    assert current_recorder() is NULL_RECORDER
+
+    summary = collector.summary()
+    assert set(summary["spans"]) == {"load", "match", "render", "dump"}
+    assert all(span["count"] == 1 for span in summary["spans"].values())
+    assert sum(summary["spans"]["match"]["histogram"].values()) == 1
+    counters = summary["counters"]
+    assert counters["records_scanned"] == len(file_contents)
+    assert 0 < counters["records_scored"] >= counters["matches"]
+    assert counters["matches"] == len(found) > 0
+    assert counters["bytes_read"] == counters["bytes_written"] == \
+        os.path.getsize(full_path)
+    assert collector.percentile("load", 50) >= summary["spans"]["load"]["min"]
+
+    # -- testing the callbacks and the cached loads
+    spans = []
+    with use_recorder(CallbackRecorder(
+            on_span=lambda name, seconds: spans.append(name))):
+        load_document(full_path, cached=True)
+        load_document(full_path, cached=True)
+    assert spans == ["load", "load"]
+    collector.clear()
+    assert collector.summary() == {"spans": {}, "counters": {}}
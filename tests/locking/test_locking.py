@@ -0,0 +1,94 @@
+import pytest
+import json
+import multiprocessing
+import os
+import time
+
+from JSONManipulator import Session
+from JSONManipulator.core.locking import FileLock, atomic_write, fcntl
+from JSONManipulator.core.storage import load_document, iter_records
+
+
+def hold_exclusive_lock(full_path, locked, seconds):
+    with FileLock(full_path, exclusive=True):
+        locked.set()
+        time.sleep(seconds)
+        with open(full_path, "w") as file:
+            json.dump([{"title": "Written under the lock"}], file)
+
+
+def test_atomic_write(tmp_path):
+    full_path = str(tmp_path / "books.json")
+    with open(full_path, "w") as file:
+        json.dump([{"title": "Initial"}], file)
+    os.chmod(full_path, 0o640)
+
+    # -- testing that the file stays untouched after an exception
+    with pytest.raises(RuntimeError):
+        with atomic_write(full_path) as file:
+            file.write("[{\"title\": ")
+            raise RuntimeError
+    assert load_document(full_path) == [{"title": "Initial"}]
+    assert not [
+        name for name in os.listdir(str(tmp_path)) if name.endswith(".tmp")
+    ]
+
+    # -- testing the mode and the file behind a symbolic link
+    link_path = str(tmp_path / "link.json")
+    os.symlink(full_path, link_path)
+    with atomic_write(link_path) as file:
+        file.write("[]")
+    assert os.path.islink(link_path)
+    assert load_document(full_path) == []
+    assert oct(os.stat(full_path).st_mode & 0o777) == oct(0o640)
+
+    # -- testing the mode of a new file with the umask of the process
+    umask = os.umask(0o027)
+    try:
+        new_path = str(tmp_path / "new.json")
+        with atomic_write(new_path) as file:
+            file.write("[]")
+        assert os.umask(0o027) == 0o027
+    finally:
+        os.umask(umask)
+    assert oct(os.stat(new_path).st_mode & 0o777) == oct(0o640)
+    assert not [
+        name for name in os.listdir(str(tmp_path)) if name.endswith(".mode")
+    ]
+
+
+@pytest.mark.skipif(fcntl is None, reason="fcntl is not available")
+def test_file_lock(tmp_path):
+    full_path = str(tmp_path / "books.json")
+    with open(full_path, "w") as file:
+        json.dump([{"title": "Initial"}], file)
+
+    # -- testing the reentrant locks within a thread
+    with FileLock(full_path):
+        records = iter_records(full_path)
+        with Session(full_path) as session:
+            session.add_object({"title": "Added"})
+        assert list(records) == [{"title": "Initial"}]
+    assert len(load_document(full_path)) == 2
+
+    # -- testing that a reader waits for the writer of another process
+    locked = multiprocessing.Event()
+    writer = multiprocessing.Process(
+        target=hold_exclusive_lock, args=(full_path, locked, 0.5)
+    )
+    writer.start()
+    assert locked.wait(10)
+    assert load_document(full_path) == [{"title": "Written under the lock"}]
+    writer.join()
+
+    # -- testing the locks released out of order
+    records = iter_records(full_path)
+    writer_lock = FileLock(full_path, exclusive=True)
+    writer_lock.acquire()
+    records.close()
+    with open(full_path + ".lock") as other_file:
+        with pytest.raises(BlockingIOError):
+            fcntl.flock(other_file, fcntl.LOCK_SH | fcntl.LOCK_NB)
+    writer_lock.release()
+    with open(full_path + ".lock") as other_file:
+        fcntl.flock(other_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
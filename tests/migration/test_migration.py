@@ -0,0 +1,130 @@
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+from JSONManipulator import migrate, set_up, Session, JSON_LINES
+from JSONManipulator.core.schema import Schema
+from JSONManipulator.core.storage import load_document, mutate_document, \
+    enable_mutation_log
+from JSONManipulator.exceptions import InvalidMigration, KeyAlreadyExists
+
+
+def copy_books(tmp_path) -> str:
+    full_path = str(tmp_path / "books.json")
+    shutil.copy(
+        os.path.join(sys.path[0], "tests/books_after_set_up.json"), full_path
+    )
+    return full_path
+
+
+def test_migrate(tmp_path):
+    full_path = copy_books(tmp_path)
+    with open(full_path) as file:
+        books = json.load(file)
+
+    migrate(full_path, [
+        {"op": "add", "key": "rating", "desc": "Rating", "default": 0},
+        {"op": "rename", "key": "pageCount", "to": "pages", "desc": "Pages"},
+        {"op": "drop", "key": "thumbnailUrl"},
+        {"op": "drop", "key": "missingKey"},
+    ])
+    with open(full_path) as file:
+        migrated = json.load(file)
+
+    assert len(migrated) == len(books)
+    for book, new_book in zip(books, migrated):
+        assert "thumbnailUrl" not in new_book and "pageCount" not in new_book
+        assert new_book["rating"] == {"Rating": 0}
+        assert list(new_book)[-1] == "rating"
+        if "pageCount" in book:
+            assert new_book["pages"] == {
+                "Pages": list(book["pageCount"].values())[0]
+            }
+            assert list(new_book).index("pages") == \
+                [key for key in book if key != "thumbnailUrl"].index("pageCount")
+
+
+def test_migrate_conflicts(tmp_path):
+    full_path = copy_books(tmp_path)
+    with open(full_path, "rb") as file:
+        original = file.read()
+
+    # -- testing the operations which conflict with each other
+    for operations in (
+            [{"op": "add", "key": "a"}, {"op": "rename", "key": "b", "to": "a"}],
+            [{"op": "rename", "key": "a", "to": "b"}, {"op": "drop", "key": "a"}],
+            [{"op": "rename", "key": "a", "to": "b"},
+             {"op": "rename", "key": "b", "to": "c"}],
+            [{"op": "move", "key": "a"}],
+            [{"op": "rename", "key": "a"}],
+            [{"op": "add", "key": ""}]):
+        with pytest.raises(InvalidMigration):
+            migrate(full_path, operations)
+    with open(full_path, "rb") as file:
+        assert file.read() == original
+
+    # -- testing that the file stays untouched if an object has the key
+    with open(full_path) as file:
+        books = json.load(file)
+    books[-1]["rating"] = "5"
+    with open(full_path, "w") as file:
+        json.dump(books, file)
+    with open(full_path, "rb") as file:
+        original = file.read()
+    with pytest.raises(KeyAlreadyExists):
+        migrate(full_path, [
+            {"op": "drop", "key": "isbn"},
+            {"op": "rename", "key": "title", "to": "rating"},
+        ])
+    with open(full_path, "rb") as file:
+        assert file.read() == original
+    assert not [name for name in os.listdir(tmp_path) if ".tmp" in name]
+
+
+def test_session_migrate(tmp_path):
+    full_path = copy_books(tmp_path)
+    lines_path = str(tmp_path / "books.jsonl")
+    with open(full_path) as file:
+        books = json.load(file)
+    with open(lines_path, "w") as file:
+        file.writelines(json.dumps(book) + "\n" for book in books)
+
+    # -- testing the same migration of JSON Lines and of the session
+    operations = [{"op": "rename", "key": "isbn", "to": "ISBN"},
+                  {"op": "drop", "key": "status"}]
+    migrate(lines_path, operations, JSON_LINES)
+    for columnar in (False, True):
+        copy_books(tmp_path)
+        with Session(full_path, columnar=columnar) as session:
+            session.migrate(operations)
+            with pytest.raises(KeyAlreadyExists):
+                session.migrate([{"op": "add", "key": "title"}])
+
+        with open(full_path) as file:
+            migrated = json.load(file)
+        with open(lines_path) as file:
+            assert [json.loads(line) for line in file] == migrated
+        assert sum("ISBN" in book for book in migrated) == \
+            sum("isbn" in book for book in books)
+        assert not any("status" in book for book in migrated)
+
+
+def test_migrate_after_logged_changes(tmp_path):
+    # -- testing the key which is still in the schema but not in the objects
+    full_path = str(tmp_path / "books.json")
+    with open(full_path, "w") as file:
+        json.dump([{"title": {"Title": "A"}, "rating": {"Rating": 5}},
+                   {"title": {"Title": "B"}}], file)
+    set_up(full_path, descriptions={})
+    enable_mutation_log(full_path)
+    mutate_document(full_path, changes={0: {"title": {"Title": "A"}}})
+    assert Schema(full_path).keys_of("Rating") == ["rating"]
+
+    migrate(full_path, [{"op": "add", "key": "rating", "desc": "Rating"}])
+    assert load_document(full_path) == [
+        {"title": {"Title": "A"}, "rating": {"Rating": ""}},
+        {"title": {"Title": "B"}, "rating": {"Rating": ""}},
+    ]
@@ -0,0 +1,115 @@
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+from JSONManipulator.core.mutation_log import MutationLog
+from JSONManipulator.core.storage import append_document, compact_document, \
+    disable_mutation_log, enable_mutation_log, iter_records, load_document, \
+    mutate_document
+from JSONManipulator.exceptions import StaleMutationLog
+
+
+def test_mutation_log(tmp_path):
+    full_path = str(tmp_path / "books.json")
+    shutil.copy(
+        os.path.join(sys.path[0], "tests/books_after_set_up.json"), full_path
+    )
+    with open(full_path, "r") as file:
+        file_contents = json.load(file)
+    base_size = os.path.getsize(full_path)
+
+    # -- testing the changes kept in the log
+    enable_mutation_log(full_path, max_entries=6)
+    mutation_log = MutationLog(full_path)
+    new_object = {"title": {"Title": "Logged book"}}
+    changed_object = {"title": {"Title": "Changed book"}}
+
+    assert load_document(full_path, cached=True) == file_contents
+    mutate_document(full_path, deletions=[0, 2], appends=[new_object])
+    mutate_document(full_path, changes={0: changed_object})
+    append_document(full_path, [new_object])
+
+    expected = [changed_object] + file_contents[3:] + [new_object] * 2
+    assert load_document(full_path, cached=True) == expected
+    assert list(iter_records(full_path)) == expected
+    assert os.path.getsize(full_path) == base_size
+    assert mutation_log.slots()[:2] == [1, 3]
+
+    # -- testing the deletion of an appended object
+    assert mutate_document(full_path, deletions=[len(expected) - 1]) is None
+    expected.pop()
+    assert mutate_document(full_path, deletions=[1]) is not None
+    expected.pop(1)
+    assert load_document(full_path) == expected
+
+    # -- testing the compaction
+    compact_document(full_path)
+    assert not mutation_log.needs_compaction()
+    assert mutation_log.header()["count"] == len(expected)
+    with open(full_path, "r") as file:
+        assert json.load(file) == expected
+    assert load_document(full_path) == expected
+
+    compact_document(full_path, background=True).join()
+    mutate_document(full_path, deletions=[0])
+    disable_mutation_log(full_path)
+    assert not mutation_log.enabled
+    with open(full_path, "r") as file:
+        assert json.load(file) == expected[1:]
+
+
+def test_interrupted_compaction(tmp_path, monkeypatch):
+    full_path = str(tmp_path / "numbers.json")
+    with open(full_path, "w") as file:
+        json.dump([{"number": number} for number in range(1, 5)], file)
+    enable_mutation_log(full_path)
+    mutate_document(full_path, deletions=[0], appends=[{"number": 99}])
+    expected = [{"number": number} for number in (2, 3, 4, 99)]
+
+    # -- testing that the log folded into the file is not applied again
+    def stop(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(MutationLog, "reset", stop)
+    try:
+        compact_document(full_path)
+    except KeyboardInterrupt:
+        pass
+    monkeypatch.undo()
+
+    with open(full_path, "r") as file:
+        assert json.load(file) == expected
+    assert not MutationLog(full_path).is_current()
+    assert load_document(full_path) == expected
+    assert list(iter_records(full_path)) == expected
+
+    # -- testing that the next change waits for the compaction
+    with pytest.raises(StaleMutationLog):
+        mutate_document(full_path, deletions=[0])
+    assert load_document(full_path) == expected
+    compact_document(full_path)
+    assert MutationLog(full_path).is_current()
+    mutate_document(full_path, deletions=[0])
+    assert load_document(full_path) == expected[1:]
+
+
+def test_copied_log(tmp_path):
+    full_path = str(tmp_path / "numbers.json")
+    with open(full_path, "w") as file:
+        json.dump([{"n": number} for number in range(3)], file)
+    enable_mutation_log(full_path)
+    mutate_document(full_path, deletions=[0])
+    append_document(full_path, [{"n": 3}])
+    expected = [{"n": number} for number in range(1, 4)]
+
+    # -- testing the copies of the file and its log
+    copy_path = str(tmp_path / "copy.json")
+    shutil.copy2(full_path, copy_path)
+    shutil.copy2(full_path + ".log", copy_path + ".log")
+    assert MutationLog(copy_path).is_current()
+    assert load_document(copy_path) == expected
+    mutate_document(copy_path, changes={0: {"n": 10}})
+    assert load_document(copy_path) == [{"n": 10}] + expected[1:]
@@ -0,0 +1,65 @@
+import os
+import pickle
+import shutil
+import sys
+
+from JSONManipulator import GetInformation, Query, convert, JSON_LINES
+from JSONManipulator.core.parallel import scan_lines, match_range, \
+    worker_query
+
+
+def test_parallel_scan(tmp_path):
+    full_path = str(tmp_path / "books.json")
+    shutil.copy(
+        os.path.join(sys.path[0], "tests/books_after_set_up.json"), full_path
+    )
+    lines_path = str(tmp_path / "books.jsonl")
+    convert(full_path, lines_path, JSON_LINES)
+
+    # -- testing that the found objects are the same as after the serial scan
+    queries = [
+        dict(value="Java", desc="Categories", levenshtein=0.8),
+        dict(value="Android in Action", key="title", levenshtein=0.5),
+        dict(value="Unlocking Android", key="title"),
+    ]
+    for query in queries:
+        serial = GetInformation(full_path=full_path, **query)
+        assert serial.output_dict_container
+        for path in (full_path, lines_path):
+            for chunk_size in (3, 2000):
+                parallel = GetInformation(
+                    full_path=path, workers=2, chunk_size=chunk_size, **query
+                )
+                assert parallel.output_dict_container == \
+                    serial.output_dict_container
+                assert parallel.output_positions == serial.output_positions
+
+        streamed = GetInformation(
+            full_path=full_path, stream=True, workers=2, chunk_size=5, **query
+        )
+        assert streamed.output_positions == serial.output_positions
+
+    # -- testing the byte ranges which split the lines
+    query = Query("Java", levenshtein=0.8, desc="Categories")
+    scan_lines(query, lines_path, workers=2, chunk_bytes=100)
+    serial = GetInformation(
+        value="Java", desc="Categories", full_path=lines_path, levenshtein=0.8
+    )
+    assert query.output_positions == serial.output_positions
+    ranged = GetInformation(
+        value="Java", desc="Categories", full_path=lines_path,
+        levenshtein=0.8, workers=2, chunk_bytes=100
+    )
+    assert ranged.output_positions == serial.output_positions
+
+    # -- testing that the found objects are not sent to the workers
+    assert len(pickle.dumps(worker_query(query))) < \
+        len(pickle.dumps(query)) / 10
+    assert query.output_positions == serial.output_positions
+
+    file_size = os.path.getsize(lines_path)
+    counts = [
+        match_range(query, lines_path, start, min(start + 333, file_size))[0]
+        for start in range(0, file_size, 333)
+    ]
+    assert sum(counts) == len(open(lines_path).readlines())
@@ -0,0 +1,92 @@
+import json
+import os
+import sys
+
+import pytest
+
+from JSONManipulator import Filter, Query, Exact, Prefix, Range, Fuzzy, \
+    AllOf, AnyOf
+from JSONManipulator.exceptions import NoKeyAndDesc
+
+FULL_PATH = os.path.join(sys.path[0], "tests/books_after_set_up.json")
+
+
+def load_books() -> list:
+    with open(FULL_PATH) as file:
+        return json.load(file)
+
+
+def test_predicates():
+    books = load_books()
+
+    # -- testing the fuzzy predicate against Query
+    for value, levenshtein, key, desc in (
+            ("Java", 0.8, None, "Categories"),
+            ("W. Frank Ableson", 1.0, "authors", None),
+            ("Android in Action", 0.7, "title", None)):
+        assert Filter(Fuzzy(value, levenshtein, key, desc)).find_positions(books) \
+            == Query(value, levenshtein, key, desc).find_positions(books)
+
+    # -- testing the exact, the prefix and the range predicates
+    assert Filter(Exact("unlocking  android", key="title")).find_positions(
+        books) == [0]
+    assert Filter(Exact("w. frank ableson", desc="Authors")).find_positions(
+        books) == [
+        position for position, book in enumerate(books)
+        if "W. Frank Ableson" in book["authors"]["Authors"]
+    ]
+    assert Filter(Prefix("Android", key="title")).find_positions(books) == [
+        position for position, book in enumerate(books)
+        if book["title"]["Title"].upper().startswith("ANDROID")
+    ]
+    assert Filter(Range(500, 600, desc="The number of pages")).find_positions(
+        books) == [
+        position for position, book in enumerate(books)
+        if 500 <= book["pageCount"]["The number of pages"] <= 600
+    ]
+
+    # -- testing the combinations in one pass
+    java = Fuzzy("Java", 0.8, desc="Categories")
+    big = Range(low=700, key="pageCount")
+    found = Filter(java & big).find_positions(books)
+    java_positions = Query("Java", 0.8, desc="Categories").find_positions(books)
+    big_positions = Filter(big).find_positions(books)
+    assert found == sorted(set(java_positions) & set(big_positions))
+    assert Filter([java, big]).find_positions(books) == found
+    either = Filter(AnyOf(Exact("Unlocking Android", key="title"), big))
+    assert either.find_positions(books) == sorted(
+        set(Filter(big).find_positions(books)) | {0}
+    )
+    assert Filter(AllOf(AllOf(big), AnyOf(java))).find_positions(books) == found
+    assert Filter(big).find_in_file(FULL_PATH, stream=True) == \
+        Filter(big).find(books)
+
+    with pytest.raises(NoKeyAndDesc):
+        Exact("Java")
+
+
+def test_predicate_order():
+    # -- testing that the cheap predicates reject the objects first
+    calls = []
+
+    class Counted(Fuzzy):
+        __slots__ = []
+
+        def test(self):
+            test = super().test()
+
+            def counted(value):
+                calls.append(value)
+                return test(value)
+
+            return counted
+
+    books = load_books()
+    predicate = AllOf(Counted("Java", 0.8, desc="Categories"),
+                      Range(high=100, key="pageCount"))
+    assert [type(item) for item in sorted(
+        predicate.predicates, key=lambda item: item.cost
+    )] == [Range, Counted]
+    Filter(predicate).find(books)
+    assert len(calls) == len(Filter(Range(high=100, key="pageCount")).find(books))
+    assert len(calls) < len(books) / 2
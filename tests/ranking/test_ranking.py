@@ -0,0 +1,56 @@
+import json
+import os
+import sys
+
+from JSONManipulator import Query
+from JSONManipulator.core.index import FuzzyIndex
+from JSONManipulator.core.scoring import IndelScorer
+
+
+def test_find_top():
+    with open(os.path.join(sys.path[0], "tests/books_after_set_up.json"), "r") as file:
+        file_contents = json.load(file)
+
+    for value, levenshtein, scorer in (("Flex 3 in Action", 0.3, None),
+                                       ("Android in Action", 0.5, None),
+                                       ("Java", 0.4, IndelScorer())):
+        query = Query(value, levenshtein=levenshtein, key="title", scorer=scorer)
+        ranked = query.find_top(file_contents, 5)
+        assert 0 < len(ranked) <= 5
+        assert query.output_dict_container == [record for _, record in ranked]
+        assert all(file_contents[position] is record for position, (_, record)
+                   in zip(query.output_positions, ranked))
+
+        # -- testing the order: the most similar first, then the earlier
+        keys = [(-score, position) for (score, _), position
+                in zip(ranked, query.output_positions)]
+        assert keys == sorted(keys)
+
+        # -- testing that the similarity is the highest passing levenshtein
+        for score, record in ranked:
+            assert levenshtein <= score <= 1
+            assert record in Query(value, levenshtein=score, key="title",
+                                   scorer=scorer).find(file_contents)
+            if score < 0.99:
+                assert record not in Query(value, levenshtein=score + 0.01,
+                                           key="title", scorer=scorer).find(file_contents)
+
+        # -- testing that no object outside the top is more similar
+        found = Query(value, levenshtein=levenshtein, key="title",
+                      scorer=scorer).find(file_contents)
+        worst = ranked[-1][0]
+        if len(ranked) == 5:
+            assert not [record for record in Query(
+                value, levenshtein=min(1.0, worst + 0.01), key="title",
+                scorer=scorer
+            ).find(file_contents) if record not in query.output_dict_container]
+        else:
+            assert len(found) == len(ranked)
+
+        # -- testing that the index finds the same top
+        assert Query(value, levenshtein=levenshtein, key="title", scorer=scorer) \
+            .find_top(file_contents, 5, index=FuzzyIndex(file_contents)) == ranked
+
+    assert Query("Flex 3 in Action", key="title").find_top(file_contents, 3)[0] == \
+        (1.0, Query("Flex 3 in Action", key="title").find(file_contents)[0])
+    assert Query("Not found book", key="title").find_top(file_contents, 3) == []
@@ -0,0 +1,85 @@
+import json
+import os
+import shutil
+import sys
+
+from JSONManipulator import set_up, GetInformation, AddObject, Session
+from JSONManipulator.core.locking import HELD_LOCKS, fcntl
+from JSONManipulator.core.schema import Schema
+
+DESCRIPTIONS = {
+    "title": "Title", "isbn": "ISBN", "pageCount": "Pages",
+    "authors": "Authors", "categories": "Categories",
+}
+
+
+def test_schema(tmp_path, monkeypatch):
+    full_path = str(tmp_path / "books.json")
+    shutil.copy(
+        os.path.join(sys.path[0], "tests/set_up/books_to_set_up.json"), full_path
+    )
+    monkeypatch.setattr(
+        "builtins.input", lambda prompt="": DESCRIPTIONS.get(prompt[1:-3], "")
+    )
+    set_up(full_path)
+
+    # -- testing the schema written by set_up()
+    schema = Schema(full_path)
+    assert schema.load() == [
+        ["title", "Title", "value"], ["isbn", "ISBN", "value"],
+        ["pageCount", "Pages", "value"], ["publishedDate", "$date", "value"],
+        ["authors", "Authors", "list"],
+        ["categories", "Categories", "list"],
+    ]
+    assert schema.keys_of("Categories") == ["categories"]
+
+    # -- testing that the searches by the description find the same objects
+    for value, desc, levenshtein in (("Java", "Categories", 0.8),
+                                     ("W. Frank Ableson", "Authors", 1.0),
+                                     ("Java", "Unknown", 1.0)):
+        found = GetInformation(value, full_path, levenshtein, desc=desc)
+        assert found.desc_keys is not None
+        shutil.copy(full_path + ".schema", str(tmp_path / "saved.schema"))
+        os.remove(full_path + ".schema")
+        expected = GetInformation(value, full_path, levenshtein, desc=desc)
+        assert expected.desc_keys is None
+        assert found.output_positions == expected.output_positions
+        shutil.copy(str(tmp_path / "saved.schema"), full_path + ".schema")
+
+    # -- testing that AddObject takes the keys from the schema
+    answers = {"<Title>": "Schema Book", "<Categories>": '["Java"]', "<Pages>": "10"}
+    monkeypatch.setattr(
+        "builtins.input", lambda prompt="": answers.get(prompt[8:-2], "")
+    )
+    AddObject(full_path)
+    with open(full_path) as file:
+        assert json.load(file)[-1] == {
+            "title": {"Title": "Schema Book"}, "pageCount": {"Pages": "10"},
+            "categories": {"Categories": ["Java"]},
+        }
+    assert schema.load() is not None
+
+    # -- testing that the writers add the new keys
+    with Session(full_path) as session:
+        session.add_object({"title": {"Title": "Other"}, "rating": {"Rating": 5}})
+    assert schema.keys_of("Rating") == ["rating"]
+
+    # -- testing that the keys are resolved under the lock of the loaded file
+    keys_of = Schema.keys_of
+    held = []
+
+    def locked_keys_of(self, desc, pairs=None):
+        held.append(os.path.realpath(full_path) in HELD_LOCKS.locks)
+        return keys_of(self, desc, pairs)
+
+    monkeypatch.setattr(Schema, "keys_of", locked_keys_of)
+    assert GetInformation("Java", full_path, desc="Categories").desc_keys \
+        == ["categories"]
+    assert held == [fcntl is not None]
+    monkeypatch.undo()
+
+    # -- testing that the changed file is not described by the schema
+    with open(full_path, "a") as file:
+        file.write(" ")
+    assert schema.load() is None
+    assert GetInformation("Java", full_path, desc="Categories").desc_keys is None
@@ -0,0 +1,59 @@
+import json
+import os
+import random
+import sys
+from difflib import SequenceMatcher
+
+from JSONManipulator import Query
+from JSONManipulator.core.scoring import DifflibScorer, IndelScorer
+
+
+def lcs_ratio(first, second):
+    table = [[0] * (len(second) + 1) for _ in range(len(first) + 1)]
+    for i, first_element in enumerate(first):
+        for j, second_element in enumerate(second):
+            table[i + 1][j + 1] = table[i][j] + 1 \
+                if first_element == second_element \
+                else max(table[i][j + 1], table[i + 1][j])
+    length = len(first) + len(second)
+    return 2.0 * table[-1][-1] / length if length else 1.0
+
+
+def test_scorers():
+    # -- testing the decisions on random words
+    generator = random.Random(0)
+    difflib_scorer = DifflibScorer()
+    indel_scorer = IndelScorer()
+    for _ in range(2000):
+        first = "".join(generator.choice("ABCD") for _ in range(generator.randint(0, 9)))
+        second = "".join(generator.choice("ABCD") for _ in range(generator.randint(0, 9)))
+        threshold = generator.choice([0.3, 0.42, 0.6, 0.7, 0.8, 1.0])
+        assert difflib_scorer.ratio_at_least(first, second, threshold) == \
+            (SequenceMatcher(None, first, second).ratio() >= threshold)
+        assert indel_scorer.ratio_at_least(first, second, threshold) == \
+            (lcs_ratio(first, second) >= threshold)
+
+    # -- testing that the compatible scorer finds the same objects
+    with open(os.path.join(sys.path[0], "tests/books_after_set_up.json"), "r") as file:
+        file_contents = json.load(file)
+
+    for value, levenshtein in (("SBCD Exam Study Kit", 0.7), ("Flex", 0.3),
+                               ("Unlocking Android", 1.0)):
+        found = []
+        for dictionary in file_contents:
+            words = Query.normalize_dictionary_value(dictionary["title"])
+            query_words = Query(value, levenshtein, key="title").value
+            short_length = len(min(words, query_words))
+            if short_length / len(max(words, query_words)) < 0.8 * levenshtein:
+                continue
+            ratio = SequenceMatcher(None, words, query_words).ratio()
+            if ratio >= 0.6 * levenshtein and all(
+                    SequenceMatcher(None, words[i], query_words[i]).ratio() >= levenshtein
+                    for i in range(short_length)):
+                found.append(dictionary)
+
+        assert Query(value, levenshtein, key="title").find(file_contents) == found
+        indel_found = Query(
+            value, levenshtein, key="title", scorer=IndelScorer()
+        ).find(file_contents)
+        assert all(dictionary in indel_found for dictionary in found)
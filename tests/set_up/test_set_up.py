@@ -56,3 +56,40 @@ def test_set_up():
         )
     except Exception:
         raise
+
+
+def test_streaming_set_up(tmp_path, monkeypatch):
+    source_path = str(tmp_path / "books.json")
+    with open(source_path, "w") as file:
+        json.dump([{"title": "First", "isbn": "1"},
+                   {"title": "Second", "authors": ["A"], "extra": 1}], file)
+
+    # -- testing the set up with the descriptions from the file
+    mapping_path = str(tmp_path / "mapping.json")
+    with open(mapping_path, "w") as file:
+        json.dump({"title": "Title", "authors": "Authors", "isbn": ""}, file)
+    target_path = str(tmp_path / "books.jsonl")
+    set_up(source_path, descriptions=mapping_path, target_path=target_path)
+    with open(target_path, "r") as file:
+        assert [json.loads(line) for line in file] == [
+            {"title": {"Title": "First"}, "isbn": "1"},
+            {"title": {"Title": "Second"}, "authors": {"Authors": ["A"]}, "extra": 1},
+        ]
+
+    # -- testing the set up in place and the union of the keys
+    asked = []
+    monkeypatch.setattr(
+        "builtins.input", lambda prompt="": asked.append(prompt) or "Desc"
+    )
+    set_up(source_path)
+    assert asked == ["<title>: ", "<authors>: ", "<extra>: ", "<isbn>: "]
+    with open(source_path, "r") as file:
+        assert json.load(file)[0] == {"title": {"Desc": "First"}, "isbn": {"Desc": "1"}}
+
+    # -- testing that the unsupported file stays untouched
+    with open(source_path, "w") as file:
+        file.write('[{"title": "First"}, 5]')
+    with pytest.raises(NotSupportedJSONFile):
+        set_up(source_path, descriptions={"title": "Title"})
+    with open(source_path, "r") as file:
+        assert file.read() == '[{"title": "First"}, 5]'
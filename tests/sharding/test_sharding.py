@@ -0,0 +1,143 @@
+import json
+import os
+import sys
+
+import pytest
+
+from JSONManipulator import ShardedDataset, shard, unshard, reshard, \
+    Filter, Query, Range, set_codec
+from JSONManipulator.core.codec import json_codec
+from JSONManipulator.core.locking import HELD_LOCKS, is_exclusive
+from JSONManipulator.core.sharding import shard_number
+
+FULL_PATH = os.path.join(sys.path[0], "tests/books_after_set_up.json")
+
+
+def load_books() -> list:
+    with open(FULL_PATH) as file:
+        return json.load(file)
+
+
+def sort_key(book) -> str:
+    return json.dumps(book, sort_keys=True)
+
+
+def test_sharding(tmp_path):
+    books = load_books()
+    directory = str(tmp_path / "books")
+
+    # -- testing the split and the manifest
+    dataset = shard(FULL_PATH, directory, "isbn", shards=4)
+    assert dataset.shards == 4 and len(dataset) == len(books)
+    assert dataset.verify() == []
+    for number, full_path in enumerate(dataset.paths()):
+        with open(full_path) as file:
+            shard_books = [json.loads(line) for line in file]
+        assert len(shard_books) == dataset.files[number]["count"]
+        assert all(shard_number(book.get("isbn"), 4) == number
+                   for book in shard_books)
+    with pytest.raises(ValueError):
+        shard(FULL_PATH, directory, "isbn")
+
+    # -- testing the lookups and the scans
+    assert dataset.lookup("1933988673") == [books[0]]
+    found = dataset.find(Query("Java", 0.8, desc="Categories"))
+    assert sorted(map(sort_key, (book for _, _, book in found))) == sorted(
+        sort_key(books[position]) for position
+        in Query("Java", 0.8, desc="Categories").find_positions(books)
+    )
+    finder = Filter(Range(500, key="pageCount"))
+    assert dataset.find(finder, workers=2) == dataset.find(finder)
+
+    # -- testing the changes of one shard
+    number = dataset.shard_of("1933988673")
+    checksums = [entry["sha256"] for entry in dataset.files]
+    assert dataset.change("1933988673", {"status": "Sold"}) == 1
+    assert dataset.lookup("1933988673")[0]["status"] == "Sold"
+    assert [entry["sha256"] != checksum
+            for entry, checksum in zip(dataset.files, checksums)] == \
+        [other == number for other in range(4)]
+    assert dataset.delete("1933988673") == 1
+    assert dataset.lookup("1933988673") == []
+    dataset.append([books[0]])
+    assert len(dataset) == len(books) and dataset.verify() == []
+
+    # -- testing the resharding and the conversion back
+    old_paths = dataset.paths()
+    dataset = reshard(directory, 3, key="title")
+    assert dataset.shards == 3 and len(dataset) == len(books)
+    assert not any(os.path.exists(full_path) for full_path in old_paths)
+    assert ShardedDataset(directory).key == "title"
+    assert dataset.lookup("unlocking android") == [books[0]]
+
+    target_path = str(tmp_path / "books.json")
+    unshard(directory, target_path)
+    with open(target_path) as file:
+        assert sorted(sort_key(json.loads(line)) for line in file) == \
+            sorted(map(sort_key, books))
+
+
+def test_keys(tmp_path, monkeypatch):
+    books = load_books()
+    directory = str(tmp_path / "books")
+    dataset = shard(FULL_PATH, directory, "isbn", shards=4)
+
+    # -- testing the hashes independent of the codec
+    numbers = [shard_number(None, 4), shard_number("1933988673", 4)]
+    previous = set_codec(json_codec(compact=True, name="compact"))
+    try:
+        assert [shard_number(None, 4),
+                shard_number("1933988673", 4)] == numbers
+    finally:
+        set_codec(previous)
+
+    # -- testing the keys with several values
+    with pytest.raises(ValueError):
+        dataset.lookup(["1933988673"])
+    with pytest.raises(ValueError):
+        dataset.append([dict(books[0], isbn=["1933988673", "1"])])
+    with pytest.raises(ValueError):
+        reshard(directory, 2, key="authors")
+    assert len(ShardedDataset(directory)) == len(books)
+
+    # -- testing the changes of the key
+    old_number = dataset.shard_of("1933988673")
+    new_isbn = next(str(number) for number in range(100)
+                    if dataset.shard_of(str(number)) != old_number)
+    assert dataset.change("1933988673", {"isbn": new_isbn}) == 1
+    assert dataset.lookup("1933988673") == []
+    assert [book["title"] for book in dataset.lookup(new_isbn)] == \
+        [books[0]["title"]]
+    assert len(dataset) == len(books) and dataset.verify() == []
+
+    # -- testing the lock of the manifest held by the changes
+    manifest_path = os.path.realpath(dataset.manifest_path)
+    held = []
+    refresh = ShardedDataset.refresh
+    monkeypatch.setattr(
+        ShardedDataset, "refresh",
+        lambda self, numbers=None: held.append(
+            manifest_path in HELD_LOCKS.locks
+        ) or refresh(self, numbers)
+    )
+    dataset.append([books[0]])
+    dataset.delete("1933988673")
+    assert held == [True, True]
+
+    # -- testing the key read under the lock after another resharding
+    stale = ShardedDataset(directory)
+    reshard(directory, 3, key="title")
+    appended = []
+    append_objects = ShardedDataset.append_objects
+    monkeypatch.setattr(
+        ShardedDataset, "append_objects",
+        lambda self, new_objects: appended.append(
+            is_exclusive(HELD_LOCKS.locks[manifest_path])
+        ) or append_objects(self, new_objects)
+    )
+    old_number = shard_number("Unlocking Android", 3)
+    title = next(str(number) for number in range(100)
+                 if shard_number(str(number), 3) != old_number)
+    assert stale.change("Unlocking Android", {"title": title}) == 1
+    assert appended == [True] and stale.key == "title"
+    assert len(stale.lookup(title)) == 1
@@ -0,0 +1,60 @@
+import pytest
+import json
+import os
+import sys
+
+from JSONManipulator import Query, Session
+from JSONManipulator.core.storage import JSON_ARRAY, JSON_LINES, \
+    append_document, convert, detect_format, dump_document, iter_records, \
+    load_document
+
+
+def test_storage(tmp_path):
+    full_path = os.path.join(sys.path[0], "tests/books_after_set_up.json")
+    with open(full_path, "r") as file:
+        file_contents = json.load(file)
+
+    # -- testing the conversion between the formats
+    lines_path = str(tmp_path / "books.data")
+    array_path = str(tmp_path / "books.json")
+    convert(full_path, lines_path, JSON_LINES)
+    convert(lines_path, array_path, JSON_ARRAY)
+
+    assert detect_format(full_path) == JSON_ARRAY
+    assert detect_format(lines_path) == JSON_LINES
+    assert detect_format(str(tmp_path / "new.jsonl")) == JSON_LINES
+    assert load_document(lines_path) == file_contents
+    assert list(iter_records(lines_path)) == file_contents
+    with open(array_path, "r") as file:
+        assert json.load(file) == file_contents
+    with pytest.raises(ValueError):
+        convert(lines_path, lines_path, JSON_ARRAY)
+
+    # -- testing the appends
+    new_object = {"title": {"Title": "Appended book"}}
+    append_document(lines_path, [new_object])
+    append_document(array_path, [new_object, new_object])
+    assert load_document(lines_path) == file_contents + [new_object]
+    assert load_document(array_path) == file_contents + [new_object] * 2
+    assert not [
+        name for name in os.listdir(str(tmp_path)) if name.endswith(".tmp")
+    ]
+
+    empty_path = str(tmp_path / "empty.json")
+    with open(empty_path, "w") as file:
+        file.write("[ \n]\n")
+    append_document(empty_path, [new_object])
+    assert load_document(empty_path) == [new_object]
+
+    # -- testing the classes with JSON Lines
+    query = Query("Java", desc="Categories")
+    assert query.find(iter_records(lines_path)) == query.find(file_contents)
+
+    with Session(lines_path) as session:
+        session.delete_object(key="title", value="Appended book")
+    assert load_document(lines_path) == file_contents
+    with open(lines_path, "r") as file:
+        assert len(file.readlines()) == len(file_contents)
+
+    dump_document(lines_path, iter([new_object]))
+    assert load_document(lines_path, cached=True) == [new_object]
@@ -0,0 +1,59 @@
+import pytest
+import json
+import os
+import sys
+
+from JSONManipulator import Query
+from JSONManipulator.core.streaming import iter_objects
+from JSONManipulator.exceptions import NotSupportedJSONFile
+
+
+def test_iter_objects(tmp_path):
+    full_path = os.path.join(sys.path[0], "tests/books_after_set_up.json")
+    with open(full_path, "r") as file:
+        file_contents = json.load(file)
+
+    # -- testing the objects of the real file with different buffers
+    for buffer_size in (1, 7, 4096):
+        assert list(iter_objects(full_path, buffer_size)) == file_contents
+
+    query = Query("Java", desc="Categories")
+    assert query.find(iter_objects(full_path)) == query.find(file_contents)
+
+    # -- testing tricky values
+    tricky_contents = [
+        {"title": {"Title": "Quote \" and \\ backslash ] } ,"}},
+        [1, [2, {"3": []}]], "plain string", 12.5e3, True, None, {},
+    ]
+    tricky_path = str(tmp_path / "tricky.json")
+    with open(tricky_path, "w") as file:
+        json.dump(tricky_contents, file, indent=2)
+    for buffer_size in (1, 2, 3, 64):
+        assert list(iter_objects(tricky_path, buffer_size)) == tricky_contents
+
+    # -- testing the broken files
+    with pytest.raises(NotSupportedJSONFile):
+        list(iter_objects(
+            os.path.join(sys.path[0], "tests/set_up/unsupported_file.json")
+        ))
+
+    with open(tricky_path, "w") as file:
+        file.write('[{"title": {"Title": "Unfinished"}}, {"title"')
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_objects(tricky_path, 5))
+
+    for broken_text in ('[{"a": 1} {"b": 2}]', '[{"a": 1},, {"b": 2}]',
+                        '[, {"a": 1}]', '[{"a": 1},]', '[1 2]',
+                        '[{"a": 1}, {"b": 2}] ,{"c": 3}]', '[{"a": 1}] x'):
+        with open(tricky_path, "w") as file:
+            file.write(broken_text)
+        for buffer_size in (1, 64):
+            with pytest.raises(json.JSONDecodeError):
+                list(iter_objects(tricky_path, buffer_size))
+
+    with open(tricky_path, "w") as file:
+        file.write('[ ]\n')
+    assert list(iter_objects(tricky_path, 1)) == []
+
+    with pytest.raises(FileNotFoundError):
+        iter_objects("some_folder/file.json")
@@ -0,0 +1,104 @@
+import os
+import shutil
+import sys
+
+from JSONManipulator import GetInformation
+from JSONManipulator.core.storage import load_document, dump_document, \
+    append_document, mutate_document, enable_mutation_log, disable_mutation_log
+from JSONManipulator.core.token_cache import TokenCache, LOADED, field_entries
+
+
+def assert_up_to_date(full_path):
+    token_cache = TokenCache(full_path)
+    loaded = token_cache.load()
+    assert loaded is not None
+    file_contents = load_document(full_path)
+    assert loaded[0] == len(file_contents)
+    for field, entries in loaded[1].items():
+        assert entries == list(field_entries(file_contents, field))
+
+
+def test_token_cache(tmp_path):
+    full_path = str(tmp_path / "books.json")
+    shutil.copy(
+        os.path.join(sys.path[0], "tests/books_after_set_up.json"), full_path
+    )
+
+    # -- testing that the sidecar finds the same objects
+    queries = [
+        dict(value="Java", desc="Categories", levenshtein=0.8),
+        dict(value="Android in Action", key="title", levenshtein=0.5),
+        dict(value="Unlocking Android", key="title"),
+        dict(value="W. Frank Ableson", desc="Authors"),
+    ]
+    for query in queries:
+        expected = GetInformation(full_path=full_path, **query)
+        found = GetInformation(full_path=full_path, tokens=True, **query)
+        assert found.output_dict_container == expected.output_dict_container
+        assert found.output_positions == expected.output_positions
+        top = GetInformation(full_path=full_path, tokens=True, top=3, **query)
+        assert top.output_scores == GetInformation(
+            full_path=full_path, top=3, **query
+        ).output_scores
+    assert sorted(TokenCache(full_path).field_names()) == [
+        ("desc", "Authors"), ("desc", "Categories"), ("key", "title")
+    ]
+    assert_up_to_date(full_path)
+
+    # -- testing that the sidecar is read by another process
+    LOADED.clear()
+    assert_up_to_date(full_path)
+
+    # -- testing that the writers keep the sidecar up to date
+    new_book = {"title": {"Title": "Java Tokens"}, "categories": {"Categories": ["Java"]}}
+    append_document(full_path, iter([new_book]))
+    assert_up_to_date(full_path)
+    file_contents = load_document(full_path)
+    dump_document(full_path, (dictionary for dictionary in file_contents[5:]))
+    assert_up_to_date(full_path)
+
+    enable_mutation_log(full_path)
+    assert_up_to_date(full_path)
+    mutate_document(
+        full_path, deletions=[0, 7], changes={3: new_book, 7: new_book, 9: {}},
+        appends=[new_book, {"status": {"Status": "MEAP"}}]
+    )
+    assert_up_to_date(full_path)
+    append_document(full_path, [new_book])
+    assert_up_to_date(full_path)
+    found = GetInformation(full_path=full_path, tokens=True, value="Java Tokens", key="title")
+    assert found.output_positions == GetInformation(
+        full_path=full_path, value="Java Tokens", key="title"
+    ).output_positions
+    disable_mutation_log(full_path)
+    assert_up_to_date(full_path)
+
+    # -- testing that the changed file is not served from the sidecar
+    with open(full_path, "w") as file:
+        file.write('[{"title": {"Title": "Only Book"}}]')
+    assert TokenCache(full_path).load() is None
+    found = GetInformation(full_path=full_path, tokens=True, value="Only Book", key="title")
+    assert found.output_positions == [0]
+
+
+def test_loaded_budget(tmp_path, monkeypatch):
+    # -- testing that only the recently used sidecars are kept in memory
+    paths = []
+    for number in range(4):
+        full_path = str(tmp_path / f"books_{number}.json")
+        shutil.copy(
+            os.path.join(sys.path[0], "tests/books_after_set_up.json"), full_path
+        )
+        paths.append(full_path)
+    LOADED.clear()
+    GetInformation(full_path=paths[0], tokens=True, value="Java", desc="Categories")
+    weight = os.path.getsize(paths[0] + ".tokens")
+    monkeypatch.setattr(
+        "JSONManipulator.core.token_cache.MAX_LOADED_BYTES", 2 * weight
+    )
+
+    for full_path in paths[1:]:
+        GetInformation(full_path=full_path, tokens=True, value="Java", desc="Categories")
+    assert list(LOADED) == [os.path.realpath(path) for path in paths[2:]]
+    assert TokenCache(paths[0]).load() is not None
+    assert list(LOADED) == [os.path.realpath(path) for path in (paths[3], paths[0])]
@@ -1,8 +1,11 @@
+import pytest
 import json
 import os
 import sys
 
 from JSONManipulator import AddObject
+from JSONManipulator.core.storage import JSON_LINES
+from JSONManipulator.exceptions import NotSupportedJSONFile
 
 
 def test_add_object():
@@ -36,3 +39,16 @@ def test_add_object():
         )
     except Exception:
         raise
+
+
+def test_add_object_to_empty_file(tmp_path):
+    # -- testing the files without the objects to take the keys from
+    full_path = str(tmp_path / "empty.json")
+    for text, file_format in (("[]", None), ("", JSON_LINES),
+                              ('["title"]', None)):
+        with open(full_path, "w") as file:
+            file.write(text)
+        with pytest.raises(NotSupportedJSONFile):
+            AddObject(full_path, file_format)
+        with open(full_path) as file:
+            assert file.read() == text
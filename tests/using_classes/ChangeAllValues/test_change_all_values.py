@@ -2,6 +2,8 @@ import json
 import os
 import sys
 
+import pytest
+
 from JSONManipulator import ChangeAllValues
 
 
@@ -26,3 +28,35 @@ def test_change_all_values():
         )
     except Exception:
         raise
+
+
+def test_streaming_change_all_values(tmp_path, monkeypatch):
+    # -- testing that ChangeAllValues changes the objects one by one
+    full_path = str(tmp_path / "books.jsonl")
+    books = [
+        {"title": {"Title": f"Book {number}"}, "pages": {"Pages": number},
+         "tags": {"Tags": ["a"]}, "url": "http://example.com"}
+        for number in range(50)
+    ]
+    books[7] = {"title": {"Title": "Short"}, "pages": {"Pages": 7},
+                "tags": {"Tags": ["b"]}}
+    with open(full_path, "w") as file:
+        file.writelines(json.dumps(book) + "\n" for book in books)
+
+    answers = iter(["y", "", "del", '["c", "d"]'])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    for module in ("storage", "GetInformation", "ChangeValue"):
+        monkeypatch.setattr(
+            f"JSONManipulator.core.{module}.load_document",
+            lambda *args, **kwargs: pytest.fail("the whole file is loaded")
+        )
+    ChangeAllValues(full_path=full_path)
+
+    with open(full_path) as file:
+        changed = [json.loads(line) for line in file]
+    assert len(changed) == len(books)
+    for book, new_book in zip(books, changed):
+        assert new_book["title"] == book["title"]
+        assert "pages" not in new_book
+        assert new_book["tags"] == {"Tags": ["c", "d"]}
+        assert new_book.get("url") == book.get("url")
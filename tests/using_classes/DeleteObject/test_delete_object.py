@@ -81,3 +81,17 @@ def test_delete_object():
         )
     except Exception:
         raise
+
+
+def test_delete_object_by_position(tmp_path, monkeypatch):
+    # -- testing that only the chosen one of the equal objects is deleted
+    full_path = str(tmp_path / "books.json")
+    book = {"title": {"Title": "Twin Book"}}
+    with open(full_path, "w") as file:
+        json.dump([book, {"title": {"Title": "Other Book"}}, book], file)
+
+    monkeypatch.setattr("builtins.input", lambda *_: "2")
+    DeleteObject(key="title", value="Twin Book", full_path=full_path)
+
+    with open(full_path, "r") as file:
+        assert json.load(file) == [book, {"title": {"Title": "Other Book"}}]
@@ -64,3 +64,35 @@ def test_get_information():
         )
     except Exception:
         raise
+
+    try:
+        GetInformation(
+            key="title", value="Unlocking Android", index=True,
+            full_path=os.path.join(
+                sys.path[0], "tests/books_after_set_up.json"
+            )
+        )
+    except Exception:
+        raise
+
+    try:
+        GetInformation(
+            key="title", value="SBCD Exam Study Kit", levenshtein=0.7,
+            index=True,
+            full_path=os.path.join(
+                sys.path[0], "tests/books_after_set_up.json"
+            )
+        )
+    except Exception:
+        raise
+
+    try:
+        GetInformation(
+            desc="Authors", value="W. Frank Aleson, Charlie Collins, Robi Sen",
+            levenshtein=0.6, stream=True,
+            full_path=os.path.join(
+                sys.path[0], "tests/books_after_set_up.json"
+            )
+        )
+    except Exception:
+        raise
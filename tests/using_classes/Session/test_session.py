@@ -0,0 +1,61 @@
+import pytest
+import json
+import os
+import shutil
+import sys
+
+from JSONManipulator import Session
+from JSONManipulator.exceptions import KeyAlreadyExists, NoKeyAndDesc
+
+
+def test_session(tmp_path):
+    full_path = str(tmp_path / "books.json")
+    shutil.copy(
+        os.path.join(sys.path[0], "tests/books_after_set_up.json"), full_path
+    )
+    with open(full_path, "r") as file:
+        initial_contents = json.load(file)
+
+    # -- testing lookups without changes
+    with Session(full_path) as session:
+        found = session.get_information(key="title", value="Unlocking Android")
+        assert found == [initial_contents[0]]
+        assert len(session.get_information(desc="Categories", value="Java")) > 1
+        with pytest.raises(NoKeyAndDesc):
+            session.get_information(value="Unlocking Android")
+
+    # -- testing several operations with one write
+    with Session(full_path) as session:
+        assert session.change_value(
+            {"isbn": "0000000000", "status": "<del>"},
+            key="title", value="Unlocking Android"
+        ) == 1
+        assert session.delete_object(desc="Categories", value="Java") > 1
+        session.add_key("reading_status", "Reading Status", "Not Read")
+        session.add_object({"title": {"Title": "Session book"}})
+        with pytest.raises(KeyAlreadyExists):
+            session.add_key("title")
+
+    with open(full_path, "r") as file:
+        file_contents = json.load(file)
+
+    assert file_contents[0]["isbn"] == {"ISBN": "0000000000"}
+    assert "status" not in file_contents[0]
+    assert file_contents[-1] == {"title": {"Title": "Session book"}}
+    assert all(
+        dictionary["reading_status"] == {"Reading Status": "Not Read"}
+        for dictionary in file_contents[:-1]
+    )
+    assert not any(
+        dictionary.get("categories") == {"Categories": ["Java"]}
+        for dictionary in file_contents
+    )
+
+    # -- testing that the file is untouched after an exception
+    with pytest.raises(RuntimeError):
+        with Session(full_path) as session:
+            session.change_all_values({"title": "<del>"})
+            raise RuntimeError
+
+    with open(full_path, "r") as file:
+        assert json.load(file) == file_contents